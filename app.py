@@ -1,17 +1,55 @@
 import flet as ft
+import signal
+import threading
+import time
 import sys
 import os
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from core.pages.splash_screen import SplashScreen
-from core.pages.auth_handler import AuthHandler
+from core import pages
 from services.database.sqlite_manager import SQLiteManager
 from core.styles import AppStyles
 from config.app_config import AppConfig
-from utils.logger import logger
-from core.translator import smart_translator
+from utils.logger import logger, log_context
+from services.password_policy import password_policy
+from services.asset_registry import asset_registry
+from core.translator import smart_translator, get_translator
+from core.animation import animation_ticker
+from services.startup import startup_pipeline
+from services.session_store import session_store
+from services.health import health_monitor, start_health_server
+from services.auth_service import auth_service
+from services.login_limiter import login_limiter
+from services.bot_runner import bot_runner
+
+def warm_database():
+    """Create/migrate the schema and open pooled connections"""
+    db_manager = SQLiteManager(AppConfig.DATABASE_PATH)
+    db_manager.init_db()
+    db_manager.warm_pool()
+
+def warm_translations():
+    """Load and compile the default language; other catalogs load when a session first uses them"""
+    smart_translator.set_language(AppConfig.DEFAULT_LANGUAGE)
+    smart_translator.compile(AppConfig.DEFAULT_LANGUAGE)
+
+def warm_pages():
+    """Import the login and dashboard pages so the first session does not pay for them"""
+    pages.preload('AuthHandler', 'Dashboard')
+
+startup_pipeline.add_step("database", warm_database)
+startup_pipeline.add_step("assets", asset_registry.preload)
+startup_pipeline.add_step("translations", warm_translations)
+startup_pipeline.add_step("pages", warm_pages)
+
+health_monitor.set_readiness(lambda: startup_pipeline.is_done)
+health_monitor.add_provider("auth", auth_service.get_stats)
+health_monitor.add_provider("login_limiter", login_limiter.get_stats)
+health_monitor.add_provider("sessions", session_store.get_stats)
+health_monitor.add_provider("logging", logger.get_stats)
+health_monitor.add_provider("bots", bot_runner.get_stats)
 
 class ATVApp:
     def __init__(self):
@@ -19,6 +57,9 @@ class ATVApp:
         self.styles = AppStyles()
         self.current_page = None
         self.page = None
+        self.session_started = None
+        self.splash_finished = False
+        self._splash_lock = threading.Lock()
         
     def setup_page(self, page: ft.Page):
         """Configure the main page settings"""
@@ -32,68 +73,162 @@ class ATVApp:
         page.vertical_alignment = ft.MainAxisAlignment.CENTER
         page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
         page.theme_mode = ft.ThemeMode.DARK
+        self.session_started = time.perf_counter()
         
-        # Initialize database safely (only once)
-        if not hasattr(self, 'db_initialized'):
-            try:
-                self.db_manager.init_db()
-                logger.info("Database initialized successfully")
-                self.db_initialized = True
-            except Exception as e:
-                logger.error(f"Database initialization error: {e}")
-                self.db_initialized = False
+        # Warmup runs once per process; later sessions usually find it finished
+        startup_pipeline.start()
         
-        # Initialize smart translator to English (ensure default)
-        smart_translator.set_language("en")
-        logger.info(f"Language initialized to: {smart_translator.current_language}")
+        if startup_pipeline.is_done and self.is_returning_session():
+            self.finish_splash(skipped=True)
+        else:
+            self.show_splash_screen()
         
-        # Start with splash screen
-        self.show_splash_screen()
+    def is_returning_session(self):
+        """Whether this browser has already seen the splash screen"""
+        if not AppConfig.SPLASH_SKIP_FOR_RETURNING:
+            return False
+        try:
+            return bool(self.page.client_storage.get(AppConfig.SPLASH_SEEN_STORAGE_KEY))
+        except Exception as e:
+            logger.debug(f"Client storage unavailable: {e}")
+            return False
         
     def show_splash_screen(self):
-        """Show splash screen"""
-        splash_screen = SplashScreen(self.page, self.navigate_to_auth)
+        """Show splash screen until warmup finishes"""
+        splash_screen = pages.SplashScreen(self.page, self.on_splash_sequence_done)
         splash_screen.build()
         splash_screen.start_splash_sequence()
+        startup_pipeline.add_done_callback(lambda: self.page.run_thread(self.end_splash_after_minimum))
+        
+    def end_splash_after_minimum(self):
+        """Leave the splash once it has been visible for SPLASH_MIN_SECONDS"""
+        remaining = AppConfig.SPLASH_MIN_SECONDS - (time.perf_counter() - self.session_started)
+        if remaining > 0:
+            time.sleep(remaining)
+        self.finish_splash()
+        
+    def on_splash_sequence_done(self):
+        """Scripted sequence ended before warmup; hold the splash until it finishes"""
+        startup_pipeline.wait()
+        self.finish_splash()
+        
+    def finish_splash(self, skipped=False):
+        """Move from the splash to the login page exactly once"""
+        with self._splash_lock:
+            if self.splash_finished:
+                return
+            self.splash_finished = True
+        
+        animation_ticker.stop(self.page)
+        try:
+            self.page.client_storage.set(AppConfig.SPLASH_SEEN_STORAGE_KEY, True)
+        except Exception as e:
+            logger.debug(f"Client storage unavailable: {e}")
+        
+        resumed = self.resume_or_login()
+        elapsed_ms = (time.perf_counter() - self.session_started) * 1000
+        logger.info(
+            f"Session {self.page.session_id} interactive in {elapsed_ms:.0f} ms "
+            f"(splash {'skipped' if skipped else 'shown'}, {'resumed' if resumed else 'login'})",
+            session_id=self.page.session_id,
+        )
+        
+    def resume_or_login(self):
+        """Go straight to the dashboard for a valid stored session, else to the login page"""
+        user = self.resume_session()
+        if user:
+            self.navigate_to_dashboard(user)
+            return True
+        self.navigate_to_auth()
+        return False
+        
+    def resume_session(self):
+        """User for the session token in client storage, or None (no password check, no bcrypt)"""
+        try:
+            token = self.page.client_storage.get(AppConfig.SESSION_STORAGE_KEY)
+        except Exception as e:
+            logger.debug(f"Client storage unavailable: {e}")
+            return None
+        if not token:
+            return None
+        
+        user = session_store.resume(self.db_manager, token)
+        if user is None:
+            logger.info("Stored session expired or invalid; showing login", session_id=self.page.session_id)
+            try:
+                self.page.client_storage.remove(AppConfig.SESSION_STORAGE_KEY)
+            except Exception as e:
+                logger.debug(f"Client storage unavailable: {e}")
+            return None
+        
+        if user.get('language'):
+            get_translator(self.page).set_language(user['language'])
+        logger.info(f"Resumed session for user: {user['email']}", session_id=self.page.session_id)
+        return user
         
     def navigate_to_auth(self):
         """Navigate to authentication pages"""
-        self.current_page = AuthHandler(self.page, self.navigate_to_dashboard)
+        self.current_page = pages.AuthHandler(self.page, self.navigate_to_dashboard, self.db_manager)
         self.current_page.show_login()
         
     def navigate_to_dashboard(self, user_data):
         """Navigate to main dashboard after successful login"""
-        from core.pages.dashboard import Dashboard
-        
         # Create and show dashboard
-        dashboard = Dashboard(self.page, user_data)
+        dashboard = pages.Dashboard(self.page, user_data, self.db_manager, on_logout=self.navigate_to_auth)
         dashboard.build()
 
 def main(page: ft.Page):
     """Main application entry point"""
     try:
         logger.info("Starting ATV Mobile Application")
+        health_monitor.session_opened()
+        page.on_close = lambda e: health_monitor.session_closed()
         app = ATVApp()
-        app.setup_page(page)
+        with log_context(session_id=page.session_id):
+            app.setup_page(page)
     except Exception as e:
         logger.error(f"Error in main application: {e}")
         page.add(ft.Text(f"Error: {e}", color=ft.Colors.RED))
         page.update()
 
-if __name__ == "__main__":
+def run():
+    """Serve the app on SERVER_HOST:SERVER_PORT (one process; see launcher.py for several)"""
     logger.info("🚀 Starting ATV Mobile Application...")
     logger.info("📱 Mobile-first design optimized for 375x812 (iPhone X/11)")
-    logger.info("🌐 Access: http://localhost:5000")
+    logger.info(f"🌐 Access: http://localhost:{AppConfig.SERVER_PORT}")
     logger.info("👤 Admin login: admin@atv.com / admin123")
     
+    # Exit through atexit on SIGTERM (launcher restarts) so queued log records are flushed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    if AppConfig.HEALTH_PORT:
+        start_health_server(AppConfig.SERVER_HOST, AppConfig.HEALTH_PORT)
+    
+    # Fit the bcrypt cost to this host before serving logins
+    if AppConfig.BCRYPT_CALIBRATE_ON_STARTUP:
+        password_policy.calibrate()
+    
+    # Warm the database, logos, translations and dashboard before the first session
+    startup_pipeline.start()
+    
+    # Trade active bots in the background (launcher.py runs them itself and turns this off)
+    if AppConfig.BOT_RUNNER_ENABLED:
+        bot_runner.start(SQLiteManager(AppConfig.DATABASE_PATH))
+    
     try:
         ft.app(
             target=main, 
-            port=5000, 
-            host="0.0.0.0",
-            view=ft.AppView.WEB_BROWSER
+            port=AppConfig.SERVER_PORT, 
+            host=AppConfig.SERVER_HOST,
+            view=ft.AppView.WEB_BROWSER,
+            assets_dir=AppConfig.ASSETS_DIR
         )
     except Exception as e:
         logger.critical(f"Critical error starting application: {e}")
         import traceback
-        logger.error(traceback.format_exc())
\ No newline at end of file
+        logger.error(traceback.format_exc())
+    finally:
+        bot_runner.stop(timeout=AppConfig.BOT_STOP_TIMEOUT)
+
+if __name__ == "__main__":
+    run()
@@ -5,11 +5,13 @@ import os
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from core.pages.auth_handler import AuthHandler
+from core import pages
 from services.database.postgres_manager import PostgresManager
 from core.styles import AppStyles
 from config.app_config import AppConfig
 from utils.logger import logger
+from services.password_policy import password_policy
+from services.asset_registry import asset_registry
 
 class SimpleATVApp:
     def __init__(self):
@@ -40,13 +42,12 @@ class SimpleATVApp:
         
     def show_auth(self):
         """Show authentication directly"""
-        auth_handler = AuthHandler(self.page, self.navigate_to_dashboard)
+        auth_handler = pages.AuthHandler(self.page, self.navigate_to_dashboard, self.db_manager)
         auth_handler.show_login()
         
     def navigate_to_dashboard(self, user_data):
         """Navigate to main dashboard after successful login"""
-        from core.pages.dashboard import Dashboard
-        dashboard = Dashboard(self.page, user_data)
+        dashboard = pages.Dashboard(self.page, user_data, self.db_manager, on_logout=self.show_auth)
         dashboard.build()
 
 def main(page: ft.Page):
@@ -66,12 +67,20 @@ if __name__ == "__main__":
     logger.info("🌐 Access: http://localhost:6000")
     logger.info("👤 Admin login: admin@atv.com / admin123")
     
+    # Fit the bcrypt cost to this host before serving logins
+    if AppConfig.BCRYPT_CALIBRATE_ON_STARTUP:
+        password_policy.calibrate()
+    
+    # Resolve broker logos once for every session
+    asset_registry.preload()
+    
     try:
         ft.app(
             target=main, 
             port=6000, 
             host="0.0.0.0",
-            view=ft.AppView.WEB_BROWSER
+            view=ft.AppView.WEB_BROWSER,
+            assets_dir=AppConfig.ASSETS_DIR
         )
     except Exception as e:
         logger.critical(f"Critical error starting application: {e}")
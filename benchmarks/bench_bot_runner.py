@@ -0,0 +1,89 @@
+"""
+Benchmark: many bots trading on one event loop against the simulated broker
+
+Usage: python benchmarks/bench_bot_runner.py [--bots 2000] [--seconds 10] [--tick 0.2]
+
+Starts --bots active bots with a --tick second interval and trade duration,
+runs them for --seconds and reports trades per second, how late the event
+loop wakes up (scheduling lag) and how many trades reached trading_history.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from services.bot_runner import STRATEGIES, BotRunner
+from services.brokers import SimulatedBroker
+from services.database.sqlite_manager import SQLiteManager
+
+
+async def measure_lag(samples, interval=0.01):
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        samples.append((loop.time() - start - interval) * 1000)
+
+
+async def bench(db_manager, args):
+    runner = BotRunner(
+        broker=SimulatedBroker(seed=1, volatility=0.01),
+        tick_interval=args.tick,
+        trade_duration=args.tick,
+        reload_interval=args.seconds,
+    )
+    lag = []
+    probe = asyncio.create_task(measure_lag(lag))
+    task = asyncio.create_task(runner.run(db_manager))
+    start = time.perf_counter()
+    await asyncio.sleep(args.seconds)
+    runner.stop()
+    await task
+    elapsed = time.perf_counter() - start
+    probe.cancel()
+    return runner.get_stats(), elapsed, lag
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bots', type=int, default=2000)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--tick', type=float, default=0.2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = SQLiteManager(os.path.join(tmp, 'bench.db'))
+        db_manager.init_db()
+        user_id = db_manager.repository.create_user({'email': 'bots@example.com'}, 'not-a-real-hash', seed_accounts=False)
+        strategies = sorted(STRATEGIES)
+        for i in range(args.bots):
+            db_manager.repository.create_bot({
+                'user_id': user_id,
+                'bot_name': f"Bot {i}",
+                'broker_name': 'Binomo',
+                'strategy_type': strategies[i % len(strategies)],
+                'is_active': True,
+                'profit_target': 1000.0,
+                'stop_loss': 500.0,
+                'investment_amount': 1.0,
+            })
+
+        stats, elapsed, lag = asyncio.run(bench(db_manager, args))
+        stored = db_manager.repository._fetch_one("SELECT COUNT(*) AS n FROM trading_history")['n']
+
+        print(f"{args.bots} bots, {args.tick}s tick, {elapsed:.1f}s")
+        print(f"  trades:          {stats['trades']:8d} ({stats['trades'] / elapsed:.0f}/s)")
+        print(f"  written:         {stored:8d} (buffered {stats['buffered']}, write errors {stats['write_errors']})")
+        print(f"  loop lag median: {statistics.median(lag):8.3f} ms")
+        print(f"  loop lag max:    {max(lag):8.3f} ms")
+        print(f"  stats: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: websocket payload per dashboard tab switch, full rebuild vs view router
+
+Usage: python benchmarks/bench_dashboard_navigation.py [--rounds 5]
+
+Drives a real flet Page over an in-process connection that serializes
+every command batch the way the socket server does, and reports the
+bytes and controls sent for each navigation.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import flet as ft
+
+from recording_connection import RecordingConnection
+from core.pages.dashboard import Dashboard
+from core.view_router import count_controls
+from services.database.sqlite_manager import SQLiteManager
+
+TABS = ["beranda", "bots", "history", "profile"]
+
+
+def make_dashboard(db_manager):
+    conn = RecordingConnection()
+    page = ft.Page(conn, "bench", asyncio.new_event_loop())
+    user = {'id': 1, 'email': 'bench@example.com', 'first_name': 'Bench', 'last_name': 'User'}
+    return conn, Dashboard(page, user, db_manager)
+
+
+def full_rebuild(dashboard, tab_key):
+    """What every tab switch used to do: clean the page and add a fresh tree"""
+    builders = {
+        "beranda": dashboard.build_home_view,
+        "bots": dashboard.build_active_bots_view,
+        "history": dashboard.build_history_view,
+        "profile": dashboard.build_profile_view,
+    }
+    dashboard.current_tab = tab_key
+    tree = ft.Column([builders[tab_key](), dashboard.create_bottom_navigation()], expand=True)
+    dashboard.page.clean()
+    dashboard.page.add(tree)
+    return count_controls(tree)
+
+
+def run(label, conn, navigate, rounds):
+    conn.take()
+    total_bytes = 0
+    print(f"\n{label}")
+    for round_number in range(rounds):
+        for tab_key in TABS:
+            start = time.perf_counter()
+            controls = navigate(tab_key)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            sent, _ = conn.take()
+            total_bytes += sent
+            if round_number in (0, rounds - 1):
+                print(f"  round {round_number + 1} {tab_key:<8} {sent:>8} bytes  {controls:>5} controls  {elapsed_ms:>7.1f} ms")
+    print(f"  total: {total_bytes} bytes over {rounds * len(TABS)} navigations")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = SQLiteManager(os.path.join(tmp, 'bench.db'))
+        db_manager.init_db()
+
+        conn, dashboard = make_dashboard(db_manager)
+        run("full rebuild (page.clean + page.add)", conn,
+            lambda tab_key: full_rebuild(dashboard, tab_key), args.rounds)
+
+        conn, dashboard = make_dashboard(db_manager)
+        dashboard.build()
+
+        def routed(tab_key):
+            dashboard.switch_tab(tab_key)
+            return dashboard.router.last_navigation['controls_sent']
+
+        run("view router (cached subtrees)", conn, routed, args.rounds)
+        print(f"  router stats: {dashboard.router.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: caller-side latency of a log call, synchronous handlers vs the queue pipeline
+
+Usage: python benchmarks/bench_logging.py [--records 2000] [--disk-ms 0.5] [--queue-size 500]
+
+The file handler is slowed down by --disk-ms per record to stand in for
+a busy disk. Reports what the logging thread pays per call, and how many
+records the bounded queue dropped once the listener fell behind.
+"""
+import argparse
+import logging
+import os
+import queue
+import statistics
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.log_handlers import DroppingQueueHandler, DrainingQueueListener
+
+
+class SlowFileHandler(logging.FileHandler):
+    def __init__(self, path, delay_ms):
+        super().__init__(path)
+        self.delay = delay_ms / 1000
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        super().emit(record)
+
+
+def timed_calls(log, records):
+    latencies = []
+    for n in range(records):
+        start = time.perf_counter()
+        log.info("Login attempt %d for user%d@example.com", n, n)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def report(label, latencies, extra=""):
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:<7} median {statistics.median(latencies):>8.1f} us   p99 {p99:>8.1f} us   {extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=2000)
+    parser.add_argument('--disk-ms', type=float, default=0.5)
+    parser.add_argument('--queue-size', type=int, default=500)
+    args = parser.parse_args()
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    with tempfile.TemporaryDirectory() as tmp:
+        file_handler = SlowFileHandler(os.path.join(tmp, 'sync.log'), args.disk_ms)
+        file_handler.setFormatter(formatter)
+        sync_log = logging.getLogger('bench.sync')
+        sync_log.propagate = False
+        sync_log.setLevel(logging.INFO)
+        sync_log.addHandler(file_handler)
+        report("sync", timed_calls(sync_log, args.records))
+        file_handler.close()
+
+        file_handler = SlowFileHandler(os.path.join(tmp, 'async.log'), args.disk_ms)
+        file_handler.setFormatter(formatter)
+        log_queue = queue.Queue(maxsize=args.queue_size)
+        queue_handler = DroppingQueueHandler(log_queue)
+        listener = DrainingQueueListener(log_queue, file_handler)
+        listener.start()
+        async_log = logging.getLogger('bench.async')
+        async_log.propagate = False
+        async_log.setLevel(logging.INFO)
+        async_log.addHandler(queue_handler)
+        latencies = timed_calls(async_log, args.records)
+        listener.stop()
+        file_handler.close()
+        report("queue", latencies, f"dropped {queue_handler.dropped} of {args.records}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: a credential-stuffing burst against one client, with and without the login limiter
+
+Usage: python benchmarks/bench_login_limiter.py [--attempts 100]
+
+Replays --attempts wrong-password logins for rotating emails from one
+client IP through auth_service.authenticate, and reports how many reached
+bcrypt, how long the burst took, and the cost of a rejected attempt.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from services.auth_service import auth_service
+from services.database.sqlite_manager import SQLiteManager
+from services.login_limiter import LoginRateLimited, login_limiter
+from services.password_policy import password_policy
+
+
+def burst(db_manager, attempts, limited):
+    futures = []
+    rejected = 0
+    reject_time = 0.0
+    start = time.perf_counter()
+    for n in range(attempts):
+        email = f"victim{n % 25}@example.com"
+        try:
+            if limited:
+                call_start = time.perf_counter()
+                try:
+                    futures.append(auth_service.authenticate(db_manager, email, "wrong-password", "203.0.113.7"))
+                except LoginRateLimited:
+                    rejected += 1
+                    reject_time += time.perf_counter() - call_start
+            else:
+                futures.append(auth_service._submit(db_manager.authenticate_user, email, "wrong-password"))
+        except Exception:
+            rejected += 1
+        # Pace submissions so the auth queue itself never overflows
+        while auth_service.get_stats()['pending'] >= auth_service.max_pending:
+            time.sleep(0.001)
+    for future in futures:
+        future.result()
+    return len(futures), rejected, time.perf_counter() - start, reject_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--attempts', type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = SQLiteManager(os.path.join(tmp, 'bench.db'))
+        db_manager.init_db()
+        for n in range(25):
+            db_manager.create_user({'email': f"victim{n}@example.com", 'password': 'correct-password'})
+
+        print(f"bcrypt cost {password_policy.rounds}, {auth_service.max_workers} hash workers, {args.attempts} attempts")
+        checked, rejected, elapsed, _ = burst(db_manager, args.attempts, limited=False)
+        print(f"  no limiter: {checked:>4} bcrypt checks, {rejected:>4} rejected, {elapsed:6.2f} s")
+
+        login_limiter.reset()
+        checked, rejected, elapsed, reject_time = burst(db_manager, args.attempts, limited=True)
+        per_reject = reject_time / rejected * 1e6 if rejected else 0.0
+        print(f"  limiter:    {checked:>4} bcrypt checks, {rejected:>4} rejected, {elapsed:6.2f} s "
+              f"({per_reject:.1f} us per rejection)")
+        print(f"  limiter stats: {login_limiter.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
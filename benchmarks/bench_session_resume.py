@@ -0,0 +1,64 @@
+"""
+Benchmark: getting a returning user to the dashboard, password login vs stored session
+
+Usage: python benchmarks/bench_session_resume.py [--rounds 20]
+
+Compares a full login (login row + bcrypt) with resuming a signed session
+token, both from the database (cold) and from the in-memory LRU (warm).
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Sign with a throwaway key instead of writing .session_secret into the working directory
+os.environ.setdefault('SESSION_SECRET', 'benchmark-only')
+
+from services.database.sqlite_manager import SQLiteManager
+from services.password_policy import password_policy
+from services.session_store import session_store
+
+
+def timed(fn, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+        assert result, "benchmark call returned no user"
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = SQLiteManager(os.path.join(tmp, 'bench.db'))
+        db_manager.init_db()
+        db_manager.create_user({'email': 'returning@example.com', 'password': 'correct-password'})
+        user = db_manager.authenticate_user('returning@example.com', 'correct-password')
+        token = session_store.create(db_manager, user['id'], remember=True)
+
+        def cold_resume():
+            session_store.cache.clear()
+            return session_store.resume(db_manager, token)
+
+        print(f"bcrypt cost {password_policy.rounds}, median of {args.rounds} rounds")
+        login_ms = timed(lambda: db_manager.authenticate_user('returning@example.com', 'correct-password'),
+                         args.rounds)
+        print(f"  password login:       {login_ms:8.3f} ms")
+        cold_ms = timed(cold_resume, args.rounds)
+        print(f"  session resume (DB):  {cold_ms:8.3f} ms")
+        warm_ms = timed(lambda: session_store.resume(db_manager, token), args.rounds)
+        print(f"  session resume (LRU): {warm_ms:8.3f} ms")
+        print(f"  session stats: {session_store.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: bytes sent and server CPU per splash, server-driven frames vs client implicit animations
+
+Usage: python benchmarks/bench_splash_modes.py [--sessions 20]
+
+Runs the full splash sequence for N concurrent sessions in each mode over
+in-process connections, and reports websocket bytes/messages per session
+and process CPU time per session (which includes the shared ticker thread).
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import flet as ft
+
+from recording_connection import RecordingConnection
+from core.animation import animation_ticker
+from core.pages.splash_screen import SplashScreen
+
+
+def run_mode(mode, sessions, loop, executor):
+    finished = threading.Semaphore(0)
+    splashes = []
+    for n in range(sessions):
+        conn = RecordingConnection()
+        page = ft.Page(conn, f"{mode}-{n}", loop, executor)
+        splash = SplashScreen(page, finished.release, mode=mode)
+        splash.build()
+        conn.take()  # Count only the animation, not the initial tree
+        splashes.append((conn, splash))
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for _, splash in splashes:
+        splash.start_splash_sequence()
+    for _ in splashes:
+        finished.acquire()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    sent = [conn.take() for conn, _ in splashes]
+    total_bytes = sum(b for b, _ in sent)
+    total_messages = sum(m for _, m in sent)
+    print(
+        f"{mode:<7} {total_bytes / sessions:>9.0f} bytes/session  "
+        f"{total_messages / sessions:>6.1f} messages/session  "
+        f"{cpu * 1000 / sessions:>7.2f} ms CPU/session  "
+        f"({wall:.2f} s wall)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=20)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    executor = ThreadPoolExecutor(max_workers=4)
+
+    print(f"{args.sessions} concurrent sessions, ticker at {animation_ticker.fps} fps")
+    for mode in ("server", "client"):
+        run_mode(mode, args.sessions, loop, executor)
+
+
+if __name__ == "__main__":
+    main()
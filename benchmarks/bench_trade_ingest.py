@@ -0,0 +1,76 @@
+"""
+Benchmark: row-at-a-time trade inserts vs chunked executemany ingest
+
+Usage: python benchmarks/bench_trade_ingest.py [--rows 20000] [--chunk-size 1000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from services.database.sqlite_manager import SQLiteManager
+from services.database.trade_ingest import TradeHistoryIngestor
+
+BROKERS = ['Binomo', 'Quotex', 'Olymptrade', 'IQ Option', 'Stockity']
+PAIRS = ['EUR/USD', 'GBP/USD', 'USD/JPY', 'AUD/USD', 'BTC/USD']
+
+
+def generate_trades(count, user_id=1):
+    for _ in range(count):
+        yield {
+            'user_id': user_id,
+            'broker_name': random.choice(BROKERS),
+            'asset_pair': random.choice(PAIRS),
+            'trade_type': random.choice(['call', 'put']),
+            'investment_amount': round(random.uniform(1, 100), 2),
+            'entry_price': round(random.uniform(1, 2), 5),
+        }
+
+
+def bench_row_at_a_time(db, rows):
+    start = time.perf_counter()
+    for trade in generate_trades(rows):
+        db.repository.add_trade(trade)  # One transaction per trade
+    return time.perf_counter() - start
+
+
+def bench_chunked(db, rows, chunk_size):
+    ingestor = TradeHistoryIngestor(db, chunk_size=chunk_size)
+    report = ingestor.ingest(generate_trades(rows))
+
+    updates = (
+        {'id': trade_id, 'result': 'win', 'payout_amount': 1.8}
+        for trade_id in range(1, report['rows'] + 1)
+    )
+    settle = ingestor.apply_results(updates)
+    return report, settle
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--baseline-rows', type=int, default=2000,
+                        help="Rows for the slow row-at-a-time baseline")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_db = SQLiteManager(os.path.join(tmp, 'baseline.db'))
+        baseline_db.init_db()
+        seconds = bench_row_at_a_time(baseline_db, args.baseline_rows)
+        print(f"row-at-a-time : {args.baseline_rows:>7} rows  {args.baseline_rows / seconds:>10.0f} rows/s")
+
+        chunked_db = SQLiteManager(os.path.join(tmp, 'chunked.db'))
+        chunked_db.init_db()
+        report, settle = bench_chunked(chunked_db, args.rows, args.chunk_size)
+        print(f"chunked insert: {report['rows']:>7} rows  {report['rows_per_second']:>10.0f} rows/s  ({report['chunks']} chunks)")
+        print(f"chunked settle: {settle['rows']:>7} rows  {settle['rows_per_second']:>10.0f} rows/s  ({settle['chunks']} chunks)")
+
+
+if __name__ == "__main__":
+    main()
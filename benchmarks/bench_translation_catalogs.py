@@ -0,0 +1,66 @@
+"""
+Benchmark: import time and retained memory of the translation catalogs
+
+Usage: python benchmarks/bench_translation_catalogs.py [--runs 7]
+
+Each run is a fresh interpreter. It times `import core.translator` (plus
+core.language while that module exists) and uses tracemalloc to measure
+the memory held after import, after the first language is used, and
+after every language has been compiled. Medians are reported.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+CHILD = """
+import importlib.util, json, sys, time, tracemalloc
+sys.path.insert(0, {src!r})
+import config.app_config, utils.logger  # Loaded by the app anyway; not part of the measurement
+tracemalloc.start()
+start = time.perf_counter()
+import core.translator
+if importlib.util.find_spec('core.language'):
+    import core.language
+import_ms = (time.perf_counter() - start) * 1000
+after_import = tracemalloc.get_traced_memory()[0]
+translator = core.translator.smart_translator
+translator.set_language('id')
+translator.get_text('login')
+after_one = tracemalloc.get_traced_memory()[0]
+translator.compile_all()
+after_all = tracemalloc.get_traced_memory()[0]
+print(json.dumps({{'import_ms': import_ms, 'after_import': after_import,
+                  'after_one': after_one, 'after_all': after_all}}))
+"""
+
+
+def run_child():
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD.format(src=SRC)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=7)
+    args = parser.parse_args()
+
+    runs = [run_child() for _ in range(args.runs)]
+    median = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+    print(f"{args.runs} fresh interpreters, medians")
+    print(f"  import time:                  {median['import_ms']:>8.2f} ms")
+    print(f"  retained after import:        {median['after_import'] / 1024:>8.1f} KiB")
+    print(f"  retained after one language:  {median['after_one'] / 1024:>8.1f} KiB")
+    print(f"  retained after all languages: {median['after_all'] / 1024:>8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
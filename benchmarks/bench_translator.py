@@ -0,0 +1,53 @@
+"""
+Benchmark: per-lookup cost of SmartTranslator.get_text, layered walk vs compiled table
+
+Usage: python benchmarks/bench_translator.py [--number 200000]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.translator import SmartTranslator
+
+
+def layered_get_text(translator, key):
+    """The pre-compilation lookup: manual -> auto -> English -> key"""
+    lang = translator.current_language
+    layers = translator.catalog.load(lang)
+    if key in layers["manual"]:
+        return layers["manual"][key]
+    if key in layers["auto"]:
+        return layers["auto"][key]
+    if lang != "en" and key in translator.catalog.load("en")["manual"]:
+        return translator.catalog.load("en")["manual"][key]
+    return key
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=200000)
+    args = parser.parse_args()
+
+    translator = SmartTranslator()
+    # A page's worth of keys: translated, English-fallback and missing ones
+    keys = list(translator.catalog.load("en")["manual"])[:40] + ["missing_key_1", "missing_key_2"]
+
+    print(f"{'language':<9}{'layered':>12}{'compiled':>12}{'get_many':>12}   (ns per key)")
+    for lang in ("en", "id", "zh", "vi"):
+        translator.set_language(lang)
+        count = args.number // len(keys)
+
+        layered = timeit.timeit(lambda: [layered_get_text(translator, k) for k in keys], number=count)
+        compiled = timeit.timeit(lambda: [translator.get_text(k) for k in keys], number=count)
+        bulk = timeit.timeit(lambda: translator.get_many(keys), number=count)
+
+        lookups = count * len(keys)
+        print(f"{lang:<9}{layered / lookups * 1e9:>12.1f}{compiled / lookups * 1e9:>12.1f}{bulk / lookups * 1e9:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
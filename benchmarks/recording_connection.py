@@ -0,0 +1,46 @@
+"""
+In-process flet connection that measures what a browser client would receive
+"""
+import json
+
+from flet.core.local_connection import LocalConnection
+from flet.core.protocol import (
+    ClientActions, ClientMessage, CommandEncoder, PageCommandResponsePayload, PageCommandsBatchResponsePayload
+)
+
+
+class RecordingConnection(LocalConnection):
+    """LocalConnection that measures the JSON the client would receive"""
+
+    def __init__(self):
+        super().__init__()
+        self.bytes_sent = 0
+        self.messages_sent = 0
+
+    def send_command(self, session_id, command):
+        batch = self.send_commands(session_id, [command])
+        return PageCommandResponsePayload(result=" ".join(batch.results), error="")
+
+    def send_commands(self, session_id, commands):
+        results = []
+        messages = []
+        for command in commands:
+            result, message = self._process_command(command)
+            if command.name in ["add", "get"]:
+                results.append(result)
+            if message:
+                messages.append(message)
+        if messages:
+            payload = json.dumps(
+                ClientMessage(ClientActions.PAGE_CONTROLS_BATCH, messages),
+                cls=CommandEncoder, separators=(",", ":")
+            )
+            self.bytes_sent += len(payload)
+            self.messages_sent += len(messages)
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def take(self):
+        sent = self.bytes_sent, self.messages_sent
+        self.bytes_sent = 0
+        self.messages_sent = 0
+        return sent
@@ -0,0 +1,106 @@
+"""
+Production launcher: several app.py workers behind one sticky proxy port
+
+Usage:
+    python launcher.py                      # WORKERS processes, public port SERVER_PORT
+    python launcher.py --workers 4 --port 5000
+
+Signals:
+    SIGHUP           rolling restart, one worker at a time (e.g. after a deploy)
+    SIGINT, SIGTERM  stop the proxy and every worker
+
+GET /_health on the public port reports every worker; each worker also
+serves its own report on WORKER_HEALTH_BASE_PORT + i.
+
+Trading bots (BOT_RUNNER_ENABLED) run here, once, instead of in every worker.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from config.app_config import AppConfig
+from services.database.sqlite_manager import SQLiteManager
+from services.bot_runner import bot_runner
+from services.password_policy import password_policy
+from services.worker_pool import StickyProxy, WorkerPool
+from utils.logger import logger
+
+
+def prepare_shared_state():
+    """One-time work done here instead of racing in every worker; returns the workers' environment"""
+    env = dict(os.environ)
+
+    # Create/migrate the schema once; workers then only find it up to date
+    SQLiteManager(AppConfig.DATABASE_PATH).init_db()
+
+    # Calibrate bcrypt once, on an idle machine, and give every worker the same cost
+    if AppConfig.BCRYPT_CALIBRATE_ON_STARTUP:
+        env['BCRYPT_ROUNDS'] = str(password_policy.calibrate())
+        env['BCRYPT_CALIBRATE'] = '0'
+
+    # Keep lockouts across worker restarts (each worker still counts attempts in its own memory)
+    env.setdefault('LOGIN_LIMITER_DB', os.path.abspath(AppConfig.DATABASE_PATH))
+
+    # Bots trade from the launcher; workers only switch them on and off in the database
+    env['BOT_RUNNER_ENABLED'] = '0'
+    return env
+
+
+async def serve(workers, host, port):
+    env = prepare_shared_state()
+    pool = WorkerPool([sys.executable, os.path.join(ROOT, 'app.py')], count=workers, env=env)
+    proxy = StickyProxy(pool, host=host, port=port)
+
+    await pool.start()
+    await proxy.start()
+    bots = None
+    if AppConfig.BOT_RUNNER_ENABLED:
+        bots = asyncio.ensure_future(bot_runner.run(SQLiteManager(AppConfig.DATABASE_PATH)))
+
+    loop = asyncio.get_running_loop()
+    stopped = asyncio.Event()
+    restarts = set()
+
+    def rolling_restart():
+        task = asyncio.ensure_future(pool.rolling_restart())
+        restarts.add(task)
+        task.add_done_callback(restarts.discard)
+
+    loop.add_signal_handler(signal.SIGHUP, rolling_restart)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopped.set)
+
+    logger.info(f"🌐 Access: http://localhost:{port} ({workers} workers, health at {AppConfig.HEALTH_PATH})")
+    await stopped.wait()
+
+    logger.info("Shutting down")
+    await proxy.close()
+    await pool.stop()
+    if bots is not None:
+        bot_runner.stop()
+        await bots
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=AppConfig.WORKERS)
+    parser.add_argument('--host', default=AppConfig.SERVER_HOST)
+    parser.add_argument('--port', type=int, default=AppConfig.SERVER_PORT)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.workers, args.host, args.port))
+    except RuntimeError as e:
+        logger.critical(f"Launcher failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,16 +15,129 @@ class AppConfig:
     DATABASE_URL = os.environ.get('DATABASE_URL')
     DATABASE_PATH = "database.db"  # SQLite database path for Replit compatibility
     
+    # SQLite Connection Pool
+    SQLITE_POOL_SIZE = int(os.environ.get('SQLITE_POOL_SIZE', 8))
+    SQLITE_POOL_TIMEOUT = float(os.environ.get('SQLITE_POOL_TIMEOUT', 5.0))  # Seconds to wait for a free connection
+    SQLITE_CACHE_SIZE_KB = 16384  # Page cache per connection (16 MB)
+    
+    # PostgreSQL Connection Pool
+    PG_POOL_ENABLED = os.environ.get('PG_POOL_ENABLED', '1') != '0'
+    PG_POOL_MIN_SIZE = int(os.environ.get('PG_POOL_MIN_SIZE', 1))
+    PG_POOL_MAX_SIZE = int(os.environ.get('PG_POOL_MAX_SIZE', 10))
+    PG_POOL_TIMEOUT = float(os.environ.get('PG_POOL_TIMEOUT', 5.0))  # Seconds to wait for a free connection
+    
+    # User Lookup Cache
+    USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', 10000))
+    USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', 300))  # Seconds
+    USER_CACHE_NEGATIVE_TTL = float(os.environ.get('USER_CACHE_NEGATIVE_TTL', 30))  # Seconds for "not found" entries
+    
+    # Trading History Ingest
+    TRADE_INGEST_CHUNK_SIZE = int(os.environ.get('TRADE_INGEST_CHUNK_SIZE', 1000))  # Rows per transaction
+    HISTORY_PAGE_SIZE = int(os.environ.get('HISTORY_PAGE_SIZE', 30))  # Rows fetched per history scroll page
+    HISTORY_WINDOW_PAGES = int(os.environ.get('HISTORY_WINDOW_PAGES', 3))  # Pages kept as controls; older/newer ones are dropped and refetched
+    
+    # Static Assets
+    ASSETS_DIR = os.environ.get(
+        'ASSETS_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'assets')
+    )
+    ASSET_MODE = os.environ.get('ASSET_MODE', 'url')  # 'url' serves files from ASSETS_DIR; 'inline' embeds data URIs
+    ASSET_CACHE_MAX_BYTES = int(os.environ.get('ASSET_CACHE_MAX_BYTES', 2 * 1024 * 1024))
+    
+    # Startup
+    STARTUP_WARM_CONNECTIONS = int(os.environ.get('STARTUP_WARM_CONNECTIONS', 2))  # Pooled connections opened during warmup
+    SPLASH_MIN_SECONDS = float(os.environ.get('SPLASH_MIN_SECONDS', 1.0))  # Shortest splash shown once warmup is done
+    SPLASH_SKIP_FOR_RETURNING = os.environ.get('SPLASH_SKIP_FOR_RETURNING', '1') != '0'
+    SPLASH_SEEN_STORAGE_KEY = "atv.splash_seen"
+    IMPORT_BUDGET_MS = float(os.environ.get('IMPORT_BUDGET_MS', 1500))  # tools/import_profile.py: cold `import app`, flet included
+    IMPORT_OWN_BUDGET_MS = float(os.environ.get('IMPORT_OWN_BUDGET_MS', 60))  # Self time of config/core/services/utils modules
+    
+    # Logging
+    LOG_ASYNC = os.environ.get('LOG_ASYNC', '1') != '0'  # Enqueue records; one listener thread formats and writes
+    LOG_QUEUE_SIZE = int(os.environ.get('LOG_QUEUE_SIZE', 10000))  # Records buffered before new ones are dropped
+    LOG_DIR = os.environ.get('LOG_DIR', 'logs')
+    LOG_FILE_PREFIX = os.environ.get('LOG_FILE_PREFIX', 'atv')  # Active file is <prefix>.log
+    LOG_MAX_BYTES = int(os.environ.get('LOG_MAX_BYTES', 10 * 1024 * 1024))  # Roll over at this size as well as at midnight; 0 = daily only
+    LOG_RETENTION_DAYS = int(os.environ.get('LOG_RETENTION_DAYS', 14))  # Delete rolled files older than this; 0 keeps them
+    LOG_BACKUP_COUNT = int(os.environ.get('LOG_BACKUP_COUNT', 50))  # Most rolled files kept; 0 = no limit
+    LOG_COMPRESS = os.environ.get('LOG_COMPRESS', '1') != '0'  # Gzip rolled files in the background
+    LOG_FORMAT = os.environ.get('LOG_FORMAT', 'text')  # File format: 'text' or 'json' (JSON lines with session/request ids)
+    
     # UI Configuration
     MOBILE_WIDTH = 375
     MOBILE_HEIGHT = 812
+    ANIMATION_FPS = int(os.environ.get('ANIMATION_FPS', 20))
+    SPLASH_ANIMATION_MODE = os.environ.get('SPLASH_ANIMATION_MODE', 'client')  # 'client' (implicit animations) or 'server'
+    ANIMATION_MAX_SESSIONS = int(os.environ.get('ANIMATION_MAX_SESSIONS', 200))  # Beyond this, animations jump to their end state
     
     # Security Configuration
-    BCRYPT_ROUNDS = 12
+    BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))  # Starting cost; replaced by calibration when enabled
+    BCRYPT_MIN_ROUNDS = 10
+    BCRYPT_MAX_ROUNDS = 15
+    BCRYPT_LATENCY_BUDGET_MS = int(os.environ.get('BCRYPT_LATENCY_BUDGET_MS', 250))
+    BCRYPT_CALIBRATE_ON_STARTUP = os.environ.get('BCRYPT_CALIBRATE', '1') != '0'
+    AUTH_HASH_WORKERS = int(os.environ.get('AUTH_HASH_WORKERS', min(4, os.cpu_count() or 1)))
+    AUTH_MAX_PENDING = int(os.environ.get('AUTH_MAX_PENDING', 32))  # Queued + running bcrypt jobs before rejecting
+    
+    # Login Rate Limiting
+    LOGIN_RATE_EMAIL_BURST = int(os.environ.get('LOGIN_RATE_EMAIL_BURST', 5))  # Attempts allowed back to back per email
+    LOGIN_RATE_EMAIL_PER_MINUTE = float(os.environ.get('LOGIN_RATE_EMAIL_PER_MINUTE', 5))  # Sustained attempts per email
+    LOGIN_RATE_CLIENT_BURST = int(os.environ.get('LOGIN_RATE_CLIENT_BURST', 20))  # Per client IP
+    LOGIN_RATE_CLIENT_PER_MINUTE = float(os.environ.get('LOGIN_RATE_CLIENT_PER_MINUTE', 30))
+    LOGIN_FAILURE_WINDOW = float(os.environ.get('LOGIN_FAILURE_WINDOW', 900))  # Seconds failures are counted over
+    LOGIN_FAILURE_THRESHOLD = int(os.environ.get('LOGIN_FAILURE_THRESHOLD', 5))  # Failures per email in the window before lockout
+    LOGIN_CLIENT_FAILURE_THRESHOLD = int(os.environ.get('LOGIN_CLIENT_FAILURE_THRESHOLD', 20))  # Failures per client
+    LOGIN_LOCKOUT_BASE = float(os.environ.get('LOGIN_LOCKOUT_BASE', 30))  # First lockout in seconds; doubles each time
+    LOGIN_LOCKOUT_MAX = float(os.environ.get('LOGIN_LOCKOUT_MAX', 3600))
+    LOGIN_LIMITER_MAX_KEYS = int(os.environ.get('LOGIN_LIMITER_MAX_KEYS', 100000))  # Tracked emails + clients
+    LOGIN_LIMITER_DB = os.environ.get('LOGIN_LIMITER_DB', '')  # SQLite file to persist lockouts across restarts; empty = memory only
+    
+    # Login Sessions
+    SESSION_STORAGE_KEY = "atv.session"  # client_storage key holding the signed session token
+    SESSION_TTL = float(os.environ.get('SESSION_TTL', 12 * 3600))  # Seconds; extended while in use
+    SESSION_REMEMBER_TTL = float(os.environ.get('SESSION_REMEMBER_TTL', 30 * 86400))  # With "remember me" ticked
+    SESSION_CACHE_SIZE = int(os.environ.get('SESSION_CACHE_SIZE', 10000))  # Live sessions kept in memory
+    SESSION_CACHE_TTL = float(os.environ.get('SESSION_CACHE_TTL', 60))  # Seconds before a cached session is rechecked in the DB
+    SESSION_PURGE_INTERVAL = float(os.environ.get('SESSION_PURGE_INTERVAL', 3600))  # Seconds between expired-session sweeps
+    SESSION_SECRET = os.environ.get('SESSION_SECRET', '')  # Token signing key; empty = generated into SESSION_SECRET_FILE
+    SESSION_SECRET_FILE = os.environ.get('SESSION_SECRET_FILE', '.session_secret')
+    
+    # Trading Bots
+    BOT_RUNNER_ENABLED = os.environ.get('BOT_RUNNER_ENABLED', '1') != '0'  # Run active bots in this process (the launcher runs them itself)
+    BOT_BROKER = os.environ.get('BOT_BROKER', 'simulated')  # Registered broker name or module:Class
+    BOT_TICK_INTERVAL = float(os.environ.get('BOT_TICK_INTERVAL', 60))  # Seconds between a bot's trades
+    BOT_TRADE_DURATION = float(os.environ.get('BOT_TRADE_DURATION', 60))  # Seconds until a trade expires
+    BOT_RELOAD_INTERVAL = float(os.environ.get('BOT_RELOAD_INTERVAL', 5))  # Seconds between re-reading active bots from the DB
+    BOT_FLUSH_INTERVAL = float(os.environ.get('BOT_FLUSH_INTERVAL', 1.0))  # Seconds between batched result writes
+    BOT_FLUSH_BATCH = int(os.environ.get('BOT_FLUSH_BATCH', 500))  # Trades per write transaction
+    BOT_MAX_BUFFERED = int(os.environ.get('BOT_MAX_BUFFERED', 50000))  # Unwritten trades kept while the DB is failing
+    BOT_MAX_CONCURRENT_ORDERS = int(os.environ.get('BOT_MAX_CONCURRENT_ORDERS', 200))  # Broker calls in flight at once
+    BOT_MARTINGALE_MAX_STEPS = int(os.environ.get('BOT_MARTINGALE_MAX_STEPS', 4))  # Stake doublings after losses
+    BOT_STOP_TIMEOUT = float(os.environ.get('BOT_STOP_TIMEOUT', 5))  # Seconds app.py waits on exit for buffered results to be written
+    BOT_ASSET_PAIRS = os.environ.get('BOT_ASSET_PAIRS', 'EUR/USD,GBP/USD,USD/JPY,AUD/USD,BTC/USD').split(',')
+    BOT_DEFAULT_STRATEGY = os.environ.get('BOT_DEFAULT_STRATEGY', 'trend')  # For bots created from the broker switch
+    BOT_DEFAULT_INVESTMENT = float(os.environ.get('BOT_DEFAULT_INVESTMENT', 10.0))
+    BOT_DEFAULT_PROFIT_TARGET = float(os.environ.get('BOT_DEFAULT_PROFIT_TARGET', 100.0))
+    BOT_DEFAULT_STOP_LOSS = float(os.environ.get('BOT_DEFAULT_STOP_LOSS', 50.0))
+    SIM_PAYOUT_RATE = float(os.environ.get('SIM_PAYOUT_RATE', 0.85))  # Simulated broker: profit share on a winning trade
+    SIM_VOLATILITY = float(os.environ.get('SIM_VOLATILITY', 0.0005))  # Simulated broker: price noise per sqrt(second)
     
     # Server Configuration
-    SERVER_HOST = "0.0.0.0"
-    SERVER_PORT = 5000
+    SERVER_HOST = os.environ.get('SERVER_HOST', "0.0.0.0")
+    SERVER_PORT = int(os.environ.get('SERVER_PORT', 5000))
+    HEALTH_PORT = int(os.environ.get('HEALTH_PORT', 0))  # Serve HEALTH_PATH on this port; 0 = off (the launcher sets it per worker)
+    HEALTH_PATH = "/_health"
+    
+    # Multi-worker Launcher (launcher.py)
+    WORKERS = int(os.environ.get('WORKERS', os.cpu_count() or 1))
+    WORKER_ID = os.environ.get('ATV_WORKER_ID', '')  # Set by the launcher in each worker process
+    WORKER_BASE_PORT = int(os.environ.get('WORKER_BASE_PORT', 5100))  # Worker i serves Flet on base + i (localhost only)
+    WORKER_HEALTH_BASE_PORT = int(os.environ.get('WORKER_HEALTH_BASE_PORT', 5200))  # ...and its health endpoint on base + i
+    WORKER_START_TIMEOUT = float(os.environ.get('WORKER_START_TIMEOUT', 120))  # Seconds for a worker to become healthy
+    WORKER_DRAIN_TIMEOUT = float(os.environ.get('WORKER_DRAIN_TIMEOUT', 30))  # Seconds to let open connections finish on restart
+    WORKER_STOP_TIMEOUT = float(os.environ.get('WORKER_STOP_TIMEOUT', 10))  # Seconds between SIGTERM and SIGKILL
+    WORKER_HEALTH_INTERVAL = float(os.environ.get('WORKER_HEALTH_INTERVAL', 2))  # Seconds between probes
+    WORKER_MAX_FAILED_PROBES = int(os.environ.get('WORKER_MAX_FAILED_PROBES', 3))  # Consecutive failures before a restart
+    PROXY_TRUST_FORWARDED = os.environ.get('PROXY_TRUST_FORWARDED', '0') == '1'  # Take the client IP from X-Forwarded-For (only behind a trusted proxy)
     
     # Default Admin Credentials
     DEFAULT_ADMIN_EMAIL = "admin@atv.com"
@@ -32,4 +145,8 @@ class AppConfig:
     
     # Language Configuration
     DEFAULT_LANGUAGE = "en"  # Default to English
+    TRANSLATION_CATALOG_DIR = os.environ.get(
+        'TRANSLATION_CATALOG_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'core', 'locales')
+    )
+    TRANSLATION_RELOAD_INTERVAL = float(os.environ.get('TRANSLATION_RELOAD_INTERVAL', 5.0))  # Seconds between catalog mtime checks; 0 disables hot reload
     SUPPORTED_LANGUAGES = ["en", "id"]
\ No newline at end of file
@@ -0,0 +1,269 @@
+"""
+Shared animation ticker: one thread drives server-side tweens for every session
+"""
+import math
+import threading
+import time
+
+from config.app_config import AppConfig
+from utils.logger import logger
+
+
+def linear(t):
+    return t
+
+
+def ease_in_out(t):
+    return 0.5 - math.cos(math.pi * t) / 2
+
+
+class Tween:
+    """Interpolate one numeric property of a control from start to end
+
+    With duration 0 it simply sets the property at `delay`, which is how
+    client-animated controls are given their target states.
+
+    start defaults to the property's value when the tween first runs.
+    on_change(value) is called after each step, e.g. to mirror a value
+    into a label; return extra controls it touched so they are sent too.
+    """
+
+    def __init__(self, control, attr, end, duration, start=None, delay=0.0, easing=ease_in_out, on_change=None):
+        self.control = control
+        self.attr = attr
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.delay = delay
+        self.easing = easing
+        self.on_change = on_change
+
+    def step(self, elapsed):
+        """Advance to elapsed seconds, returns (finished, changed controls)"""
+        if elapsed < self.delay:
+            return False, ()
+        if self.start is None:
+            self.start = getattr(self.control, self.attr) or 0
+
+        t = 1.0 if self.duration <= 0 else min(1.0, (elapsed - self.delay) / self.duration)
+        # Assign end exactly on the last step; this also lets zero-duration tweens set non-numeric states
+        value = self.end if t >= 1.0 else self.start + (self.end - self.start) * self.easing(t)
+
+        changed = []
+        if getattr(self.control, self.attr) != value:
+            setattr(self.control, self.attr, value)
+            changed.append(self.control)
+            if self.on_change:
+                changed.extend(self.on_change(value) or ())
+        return t >= 1.0, changed
+
+
+class FrameEffect:
+    """Run update(seconds) every frame for effects that are not a single tween
+
+    update mutates `controls` (e.g. an orbit computed with sin/cos); all of
+    them are treated as changed each frame. With duration None the effect
+    runs until the ticker is told to stop it.
+    """
+
+    def __init__(self, controls, update, duration, delay=0.0):
+        self.controls = list(controls)
+        self.update = update
+        self.duration = duration
+        self.delay = delay
+
+    def step(self, elapsed):
+        if elapsed < self.delay:
+            return False, ()
+        local = elapsed - self.delay
+        finished = self.duration is not None and local >= self.duration
+        self.update(self.duration if finished else local)
+        return finished, self.controls
+
+
+class _Session:
+    def __init__(self, page, animations, on_complete):
+        self.page = page
+        self.animations = list(animations)
+        self.on_complete = on_complete
+        self.started = time.perf_counter()
+
+
+class AnimationTicker:
+    """One background thread that steps every registered animation per frame
+
+    Each tick, every session's animations are advanced and the controls
+    they changed are sent with a single page.update(*controls), each
+    control once. When more than max_sessions pages are animating, new
+    requests skip straight to their end state with one update, so the
+    ticker's work per frame stays bounded under load.
+    """
+
+    def __init__(self, fps=None, max_sessions=None):
+        self.fps = fps or AppConfig.ANIMATION_FPS
+        self.max_sessions = max_sessions or AppConfig.ANIMATION_MAX_SESSIONS
+        self._sessions = {}  # page session id -> _Session
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread = None
+        self.stats = {
+            'ticks': 0,
+            'updates': 0,
+            'controls_sent': 0,
+            'skipped': 0,
+            'late_ticks': 0,
+        }
+
+    def animate(self, page, *animations, on_complete=None):
+        """Run animations on page; on_complete is called on the page's thread pool when all finish
+
+        Returns False if the session cap was hit and the end state was applied immediately.
+        """
+        key = page.session_id
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                session.animations.extend(_rebase(animations, time.perf_counter() - session.started))
+                if on_complete:
+                    previous = session.on_complete
+                    session.on_complete = _chain(previous, on_complete)
+                return True
+
+            if len(self._sessions) < self.max_sessions:
+                self._sessions[key] = _Session(page, animations, on_complete)
+                self._ensure_thread()
+                self._wakeup.notify()
+                return True
+
+            self.stats['skipped'] += 1
+
+        logger.debug(f"Animation cap ({self.max_sessions}) reached; finishing instantly for {key}")
+        self._finish_instantly(page, animations, on_complete)
+        return False
+
+    def stop(self, page):
+        """Drop a page's animations without running on_complete"""
+        with self._lock:
+            self._sessions.pop(page.session_id, None)
+
+    def _finish_instantly(self, page, animations, on_complete):
+        changed = []
+        for animation in animations:
+            if animation.duration is None:
+                continue  # Open-ended effects have no end state to jump to
+            _, controls = animation.step(math.inf)
+            changed.extend(controls)
+        try:
+            if changed:
+                page.update(*_unique(changed))
+        except Exception as e:
+            logger.debug(f"Animation update failed for {page.session_id}: {e}")
+        if on_complete:
+            page.run_thread(on_complete)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="animation-ticker", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        interval = 1.0 / self.fps
+        next_tick = time.perf_counter()
+        while True:
+            with self._lock:
+                while not self._sessions:
+                    self._wakeup.wait()
+                    next_tick = time.perf_counter()
+                sessions = list(self._sessions.items())
+
+            for key, session in sessions:
+                self._tick_session(key, session)
+            self.stats['ticks'] += 1
+
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Running behind: skip the missed frames instead of bursting to catch up
+                self.stats['late_ticks'] += 1
+                next_tick = time.perf_counter()
+
+    def _tick_session(self, key, session):
+        elapsed = time.perf_counter() - session.started
+        changed = []
+        remaining = []
+
+        with self._lock:
+            animations = list(session.animations)
+        for animation in animations:
+            try:
+                finished, controls = animation.step(elapsed)
+            except Exception as e:
+                logger.error(f"Animation step error: {e}")
+                finished, controls = True, ()
+            changed.extend(controls)
+            if not finished:
+                remaining.append(animation)
+
+        try:
+            if changed:
+                controls = _unique(changed)
+                session.page.update(*controls)
+                self.stats['updates'] += 1
+                self.stats['controls_sent'] += len(controls)
+        except Exception as e:
+            # Page disconnected or its controls were replaced; stop animating it
+            logger.debug(f"Animation update failed for {key}: {e}")
+            self.stop(session.page)
+            return
+
+        with self._lock:
+            # Keep animations added by animate() while this tick ran
+            added = session.animations[len(animations):]
+            session.animations = remaining + added
+            if session.animations or self._sessions.get(key) is not session:
+                return
+            del self._sessions[key]
+
+        if session.on_complete:
+            session.page.run_thread(session.on_complete)
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['active_sessions'] = len(self._sessions)
+            stats['fps'] = self.fps
+            stats['max_sessions'] = self.max_sessions
+            return stats
+
+
+def _unique(controls):
+    seen = set()
+    result = []
+    for control in controls:
+        if id(control) not in seen:
+            seen.add(id(control))
+            result.append(control)
+    return result
+
+
+def _chain(first, second):
+    if first is None:
+        return second
+
+    def run_both():
+        first()
+        second()
+    return run_both
+
+
+def _rebase(animations, offset):
+    """Shift delays so animations added to a running session start now"""
+    for animation in animations:
+        animation.delay += offset
+    return animations
+
+
+# Global animation ticker instance
+animation_ticker = AnimationTicker()
@@ -0,0 +1,128 @@
+"""
+Translation catalogs stored as JSON files, loaded per language on first use
+"""
+import json
+import os
+import threading
+import time
+
+from config.app_config import AppConfig
+from utils.logger import logger
+
+MANIFEST = "languages.json"
+LAYERS = ("manual", "auto")
+
+
+class TranslationCatalog:
+    """Lazy, memoized loader for <directory>/<code>.json catalogs
+
+    Each catalog holds a "manual" layer (reviewed translations) and an
+    "auto" layer (machine fill-ins). A language is parsed the first time
+    it is asked for and then kept; reload_changed() re-reads only files
+    whose mtime or size changed, so edited catalogs go live without a
+    restart. languages.json lists the supported codes and display names.
+    """
+
+    def __init__(self, directory=None, reload_interval=None):
+        self.directory = directory or AppConfig.TRANSLATION_CATALOG_DIR
+        self.reload_interval = AppConfig.TRANSLATION_RELOAD_INTERVAL if reload_interval is None else reload_interval
+        self._lock = threading.Lock()
+        self._loaded = {}  # language code -> (file signature, {layer: {key: text}})
+        self._languages = None  # (file signature, [{"code", "name"}])
+        self._next_check = time.monotonic() + self.reload_interval
+        self.stats = {'loads': 0, 'reloads': 0, 'checks': 0}
+
+    def path(self, language_code):
+        return os.path.join(self.directory, f"{language_code}.json")
+
+    def languages(self):
+        """Supported languages as [{"code", "name"}], read once from the manifest"""
+        entry = self._languages
+        if entry is None:
+            with self._lock:
+                if self._languages is None:
+                    path = os.path.join(self.directory, MANIFEST)
+                    self._languages = (_signature(path), _read_json(path))
+                entry = self._languages
+        return entry[1]
+
+    def load(self, language_code):
+        """Get {"manual": {...}, "auto": {...}} for a language; a missing file gives empty layers"""
+        entry = self._loaded.get(language_code)
+        if entry is None:
+            with self._lock:
+                entry = self._loaded.get(language_code)
+                if entry is None:
+                    entry = self._load_file(language_code)
+                    self._loaded[language_code] = entry
+        return entry[1]
+
+    def _load_file(self, language_code):
+        path = self.path(language_code)
+        signature = _signature(path)
+        layers = {layer: {} for layer in LAYERS}
+        if signature is not None:
+            try:
+                data = _read_json(path)
+                for layer in LAYERS:
+                    layers[layer] = dict(data.get(layer) or {})
+            except (OSError, ValueError) as e:
+                logger.error(f"Could not load translation catalog {path}: {e}")
+        self.stats['loads'] += 1
+        return signature, layers
+
+    def save(self, language_code, layers):
+        """Write a language's layers atomically and make them the loaded version"""
+        path = self.path(language_code)
+        data = {layer: dict(layers.get(layer) or {}) for layer in LAYERS}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._loaded[language_code] = (_signature(path), data)
+
+    def reload_changed(self):
+        """Re-read catalogs whose files changed on disk, returns the changed language codes"""
+        changed = set()
+        with self._lock:
+            self.stats['checks'] += 1
+            if self._languages is not None:
+                if _signature(os.path.join(self.directory, MANIFEST)) != self._languages[0]:
+                    self._languages = None
+            for language_code, (signature, _) in list(self._loaded.items()):
+                if _signature(self.path(language_code)) != signature:
+                    self._loaded[language_code] = self._load_file(language_code)
+                    changed.add(language_code)
+            self.stats['reloads'] += len(changed)
+
+        if changed:
+            logger.info(f"Reloaded translation catalogs: {', '.join(sorted(changed))}")
+        return changed
+
+    def maybe_reload(self):
+        """reload_changed() at most once per reload_interval, so it is cheap to call often"""
+        if self.reload_interval <= 0 or time.monotonic() < self._next_check:
+            return set()
+        self._next_check = time.monotonic() + self.reload_interval
+        return self.reload_changed()
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['loaded_languages'] = sorted(self._loaded)
+            return stats
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
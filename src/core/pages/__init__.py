@@ -1 +1,31 @@
-# Pages module for ATV - AUTOTRADEVIP
\ No newline at end of file
+"""
+Pages module for ATV - AUTOTRADEVIP
+
+Page classes are imported on first access (`pages.Dashboard`), so starting
+the app only pays for the pages a session actually shows.
+"""
+import importlib
+
+_PAGES = {
+    'SplashScreen': 'core.pages.splash_screen',
+    'AuthHandler': 'core.pages.auth_handler',
+    'Dashboard': 'core.pages.dashboard',
+    'TradingHistoryView': 'core.pages.history_view',
+}
+
+__all__ = list(_PAGES)
+
+
+def __getattr__(name):
+    module_name = _PAGES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    page_class = getattr(importlib.import_module(module_name), name)
+    globals()[name] = page_class  # Later lookups skip __getattr__
+    return page_class
+
+
+def preload(*names):
+    """Import the given pages (all by default), e.g. from a warmup thread"""
+    for name in names or _PAGES:
+        __getattr__(name)
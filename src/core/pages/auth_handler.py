@@ -1,34 +1,60 @@
 import flet as ft
 import hashlib
+import math
 import re
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+import uuid
 
 from core.styles import AppStyles
 from services.database.sqlite_manager import SQLiteManager
-from core.translator import smart_translator
+from services.auth_service import auth_service, AuthServiceOverloaded
+from services.login_limiter import LoginRateLimited
+from services.password_policy import password_policy
+from services.session_store import session_store
+from config.app_config import AppConfig
+from core.translator import get_translator
+from utils.logger import logger, log_context
 
 class AuthHandler:
-    def __init__(self, page: ft.Page, on_success_callback):
+    def __init__(self, page: ft.Page, on_success_callback, db_manager=None):
         self.page = page
         self.styles = AppStyles()
-        self.db_manager = SQLiteManager()
+        self.translator = get_translator(page)
+        self.db_manager = db_manager or SQLiteManager()
         self.on_success_callback = on_success_callback
         
+    def start_session(self, user, remember_me=False):
+        """Issue a session token so reloading the page resumes without logging in again"""
+        token = session_store.create(self.db_manager, user['id'], remember=bool(remember_me))
+        if token is None:
+            return
+        try:
+            self.page.client_storage.set(AppConfig.SESSION_STORAGE_KEY, token)
+        except Exception as e:
+            logger.debug(f"Client storage unavailable: {e}")
+        
     def hash_password(self, password):
         """Hash password for storage using bcrypt"""
-        import bcrypt
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        return password_policy.hash(password)
         
     def validate_email(self, email):
         """Validate email format"""
         pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
         return re.match(pattern, email) is not None
         
+    def create_loading_indicator(self):
+        """Create spinner shown while a background auth request is running"""
+        return ft.Container(
+            content=ft.ProgressRing(
+                width=22,
+                height=22,
+                stroke_width=2,
+                color="#00d4ff",
+            ),
+            alignment=ft.alignment.center,
+            padding=ft.padding.only(bottom=10),
+            visible=False,
+        )
+        
     def create_premium_header(self, title, subtitle=None):
         """Create extremely sophisticated header with luxury visual effects"""
         return ft.Container(
@@ -455,12 +481,12 @@ class AuthHandler:
         
         # Create luxury form fields with language support
         email_field = self.create_luxury_form_field(
-            smart_translator.get_text("email"), 
-            smart_translator.get_text("enter_email")
+            self.translator.get_text("email"), 
+            self.translator.get_text("enter_email")
         )
         password_field = self.create_luxury_form_field(
-            smart_translator.get_text("password"), 
-            smart_translator.get_text("enter_password"), 
+            self.translator.get_text("password"), 
+            self.translator.get_text("enter_password"), 
             password=True
         )
         
@@ -480,25 +506,61 @@ class AuthHandler:
             padding=ft.padding.symmetric(vertical=5),
         )
         
-        # Remember me checkbox
+        # Remember me checkbox (a checked box keeps the session for SESSION_REMEMBER_TTL)
         remember_checkbox = ft.Checkbox(
-            label="Ingat saya",
+            label=self.translator.get_text("remember_me"),
             value=False,
-            fill_color=self.styles.TEXT_SECONDARY,
-            check_color=ft.Colors.WHITE,
+            fill_color="#00d4ff",
+            check_color="#ffffff",
             label_style=ft.TextStyle(
-                color=self.styles.TEXT_PRIMARY,
-                size=14,
+                color="#ffffff",
+                size=11,
+                weight=ft.FontWeight.W_600,
+                font_family="Inter",
             ),
         )
         
+        loading_indicator = self.create_loading_indicator()
+        login_state = {'in_flight': False}
+        
+        def set_login_busy(busy):
+            login_state['in_flight'] = busy
+            loading_indicator.visible = busy
+        
+        def on_login_done(future):
+            """Runs on a session thread once verify_login finishes"""
+            set_login_busy(False)
+            try:
+                user = future.result()
+                ids = {'session_id': self.page.session_id, 'request_id': login_state.get('request_id')}
+                
+                if user:
+                    logger.info(f"Login successful for user: {user['email']}", **ids)
+                    self.start_session(user, login_state.get('remember_me'))
+                    # The saved language arrives with the login row; apply it to this session only
+                    if user.get('language'):
+                        self.translator.set_language(user['language'])
+                    self.on_success_callback(user)
+                else:
+                    logger.info("Login rejected: invalid credentials", **ids)
+                    error_container.content.value = "Email atau password salah"
+                    error_container.visible = True
+                    self.page.update()
+            except Exception as e:
+                logger.error(f"Login error: {e}")
+                error_container.content.value = f"Terjadi kesalahan: {str(e)}"
+                error_container.visible = True
+                self.page.update()
+        
         def handle_login(e):
+            if login_state['in_flight']:
+                return
             try:
                 email = email_textfield.value.strip() if email_textfield.value else ""
                 password = password_textfield.value.strip() if password_textfield.value else ""
                 remember_me = remember_checkbox.value
                 
-                print(f"Login attempt - Email: {email}, Password length: {len(password)}")
+                logger.debug(f"Login attempt - Email: {email}")
                 
                 # Clear previous errors
                 error_container.visible = False
@@ -517,24 +579,32 @@ class AuthHandler:
                     self.page.update()
                     return
                     
-                # Check credentials
-                print(f"Authenticating user: {email}")
-                user = self.db_manager.authenticate_user(email, password)
-                print(f"Authentication result: {user}")
-                
-                if user:
-                    print(f"Login successful for user: {user['email']}")
-                    if remember_me:
-                        print(f"Remember me enabled for user: {user['email']}")
-                    self.on_success_callback(user)
-                else:
-                    print("Authentication failed")
-                    error_container.content.value = "Email atau password salah"
+                # Check credentials off the UI thread
+                login_state['remember_me'] = remember_me
+                login_state['request_id'] = uuid.uuid4().hex[:12]
+                try:
+                    with log_context(session_id=self.page.session_id, request_id=login_state['request_id']):
+                        logger.debug(f"Authenticating user: {email}")
+                        future = auth_service.authenticate(self.db_manager, email, password, self.page.client_ip)
+                except LoginRateLimited as limited:
+                    error_container.content.value = f"Terlalu banyak percobaan login, coba lagi dalam {math.ceil(limited.retry_after)} detik"
                     error_container.visible = True
                     self.page.update()
+                    return
+                except AuthServiceOverloaded:
+                    error_container.content.value = "Server sedang sibuk, silahkan coba lagi"
+                    error_container.visible = True
+                    self.page.update()
+                    return
+                
+                set_login_busy(True)
+                self.page.update()
+                # Hand the result back to the session's thread pool so UI work
+                # never occupies a hashing worker
+                future.add_done_callback(lambda f: self.page.run_thread(on_login_done, f))
                     
             except Exception as e:
-                print(f"Login error: {e}")
+                logger.error(f"Login error: {e}")
                 error_container.content.value = f"Terjadi kesalahan: {str(e)}"
                 error_container.visible = True
                 self.page.update()
@@ -544,8 +614,8 @@ class AuthHandler:
             # Compact header
             ft.Container(
                 content=self.create_premium_header(
-                    smart_translator.get_text("login"), 
-                    smart_translator.get_text("professional_trading_platform")
+                    self.translator.get_text("login"), 
+                    self.translator.get_text("professional_trading_platform")
                 ),
                 padding=ft.padding.only(top=15, bottom=10),
             ),
@@ -558,7 +628,7 @@ class AuthHandler:
                         content=ft.Column([
                             # Form heading
                             ft.Text(
-                                smart_translator.get_text("exclusive_access"),
+                                self.translator.get_text("exclusive_access"),
                                 size=16,
                                 weight=ft.FontWeight.W_900,
                                 color="#ffffff",
@@ -574,22 +644,11 @@ class AuthHandler:
                             
                             # Remember me and forgot password
                             ft.Row([
-                                ft.Checkbox(
-                                    label=smart_translator.get_text("remember_me"),
-                                    value=False,
-                                    fill_color="#00d4ff",
-                                    check_color="#ffffff",
-                                    label_style=ft.TextStyle(
-                                        color="#ffffff",
-                                        size=11,
-                                        weight=ft.FontWeight.W_600,
-                                        font_family="Inter",
-                                    ),
-                                ),
+                                remember_checkbox,
                                 ft.Container(expand=True),
                                 ft.TextButton(
                                     content=ft.Text(
-                                        smart_translator.get_text("forgot_password_link"),
+                                        self.translator.get_text("forgot_password_link"),
                                         size=11,
                                         weight=ft.FontWeight.W_700,
                                         color="#00d4ff",
@@ -611,8 +670,10 @@ class AuthHandler:
                             
                             ft.Container(height=15),
                             
+                            loading_indicator,
+                            
                             # Login button
-                            self.create_primary_button(smart_translator.get_text("login_now"), handle_login, 300),
+                            self.create_primary_button(self.translator.get_text("login_now"), handle_login, 300),
                             
                             ft.Container(height=20),
                             
@@ -630,7 +691,7 @@ class AuthHandler:
                                 ),
                                 ft.Container(
                                     content=ft.Text(
-                                        smart_translator.get_text("or"),
+                                        self.translator.get_text("or"),
                                         size=10,
                                         color="#64748b",
                                         weight=ft.FontWeight.W_600,
@@ -648,7 +709,7 @@ class AuthHandler:
                             ft.Container(
                                 content=ft.Column([
                                     ft.Text(
-                                        smart_translator.get_text("dont_have_account"),
+                                        self.translator.get_text("dont_have_account"),
                                         size=13,
                                         color="#94a3b8",
                                         weight=ft.FontWeight.W_500,
@@ -659,7 +720,7 @@ class AuthHandler:
                                     ft.Container(
                                         content=ft.TextButton(
                                             content=ft.Text(
-                                                smart_translator.get_text("register_now"),
+                                                self.translator.get_text("register_now"),
                                                 size=14,
                                                 weight=ft.FontWeight.W_800,
                                                 color="#00d4ff",
@@ -795,7 +856,47 @@ class AuthHandler:
             check_color="#ffffff",
         )
         
+        loading_indicator = self.create_loading_indicator()
+        register_state = {'in_flight': False}
+        
+        def set_register_busy(busy):
+            register_state['in_flight'] = busy
+            loading_indicator.visible = busy
+        
+        def on_register_done(future):
+            """Runs on a session thread once create_user finishes"""
+            set_register_busy(False)
+            try:
+                user_id = future.result()
+            except Exception as e:
+                error_container.content.value = f"Terjadi kesalahan: {str(e)}"
+                error_container.visible = True
+                self.page.update()
+                return
+            
+            if user_id:
+                success_container.content.value = "Registrasi berhasil! Silahkan login."
+                success_container.visible = True
+                self.page.update()
+                
+                # Auto redirect to login after 2 seconds
+                def redirect_to_login():
+                    import time
+                    time.sleep(2)
+                    self.show_login()
+                
+                import threading
+                thread = threading.Thread(target=redirect_to_login)
+                thread.daemon = True
+                thread.start()
+            else:
+                error_container.content.value = "Gagal mendaftar. Silahkan coba lagi."
+                error_container.visible = True
+                self.page.update()
+        
         def handle_register(e):
+            if register_state['in_flight']:
+                return
             try:
                 username = username_textfield.value.strip() if username_textfield.value else ""
                 email = email_textfield.value.strip() if email_textfield.value else ""
@@ -855,25 +956,18 @@ class AuthHandler:
                     'is_admin': False
                 }
                 
-                if self.db_manager.create_user(user_data):
-                    success_container.content.value = "Registrasi berhasil! Silahkan login."
-                    success_container.visible = True
-                    self.page.update()
-                    
-                    # Auto redirect to login after 2 seconds
-                    def redirect_to_login():
-                        import time
-                        time.sleep(2)
-                        self.show_login()
-                    
-                    import threading
-                    thread = threading.Thread(target=redirect_to_login)
-                    thread.daemon = True
-                    thread.start()
-                else:
-                    error_container.content.value = "Gagal mendaftar. Silahkan coba lagi."
+                # Password hashing runs on the bounded auth executor
+                try:
+                    future = auth_service.create_user(self.db_manager, user_data)
+                except AuthServiceOverloaded:
+                    error_container.content.value = "Server sedang sibuk, silahkan coba lagi"
                     error_container.visible = True
                     self.page.update()
+                    return
+                
+                set_register_busy(True)
+                self.page.update()
+                future.add_done_callback(lambda f: self.page.run_thread(on_register_done, f))
             except Exception as e:
                 error_container.content.value = f"Terjadi kesalahan: {str(e)}"
                 error_container.visible = True
@@ -948,6 +1042,8 @@ class AuthHandler:
                             
                             ft.Container(height=10),
                             
+                            loading_indicator,
+                            
                             self.create_primary_button("DAFTAR", handle_register),
                             
                             ft.Container(height=25),
@@ -956,15 +1052,15 @@ class AuthHandler:
                             ft.Container(
                                 content=ft.Row([
                                     ft.Container(height=1, bgcolor=self.styles.CARD_BORDER, expand=True),
-                                    ft.Text(language_manager.get_text("or"), size=12, color=self.styles.TEXT_MUTED),
+                                    ft.Text(self.translator.get_text("or"), size=12, color=self.styles.TEXT_MUTED),
                                     ft.Container(height=1, bgcolor=self.styles.CARD_BORDER, expand=True),
                                 ], spacing=10),
                                 padding=ft.padding.symmetric(vertical=10),
                             ),
                             
                             ft.Row([
-                                ft.Text(smart_translator.get_text("already_have_account") + " ", size=14, color=self.styles.TEXT_TERTIARY),
-                                self.create_text_button(smart_translator.get_text("login"), lambda e: self.show_login()),
+                                ft.Text(self.translator.get_text("already_have_account") + " ", size=14, color=self.styles.TEXT_TERTIARY),
+                                self.create_text_button(self.translator.get_text("login"), lambda e: self.show_login()),
                             ], alignment=ft.MainAxisAlignment.CENTER),
                             
                         ], spacing=0),
@@ -1107,7 +1203,7 @@ class AuthHandler:
                             ft.Container(
                                 content=ft.Row([
                                     ft.Container(height=1, bgcolor=self.styles.CARD_BORDER, expand=True),
-                                    ft.Text(language_manager.get_text("or"), size=12, color=self.styles.TEXT_MUTED),
+                                    ft.Text(self.translator.get_text("or"), size=12, color=self.styles.TEXT_MUTED),
                                     ft.Container(height=1, bgcolor=self.styles.CARD_BORDER, expand=True),
                                 ], spacing=10),
                                 padding=ft.padding.symmetric(vertical=10),
@@ -1,22 +1,32 @@
 import flet as ft
 import threading
 import time
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from core.styles import AppStyles
-from core.translator import smart_translator
+from core.translator import get_translator
+from core.pages.history_view import TradingHistoryView
+from core.view_router import ViewRouter
+from services.asset_registry import asset_registry
+from services.bot_runner import bot_runner
+from config.app_config import AppConfig
+from services.database.sqlite_manager import SQLiteManager
+from services.session_store import session_store
+from utils.logger import logger
 
 class Dashboard:
-    def __init__(self, page: ft.Page, user_data):
+    def __init__(self, page: ft.Page, user_data, db_manager=None, on_logout=None):
         self.page = page
         self.user_data = user_data
+        self.db_manager = db_manager or SQLiteManager(AppConfig.DATABASE_PATH)
+        self.on_logout = on_logout
         self.styles = AppStyles()
+        self.translator = get_translator(page)
         self.current_tab = "beranda"
         self.current_broker = "Beranda"
+        self.router = None
+        self.shell = None
+        self.bottom_navigation = None
+        self.broker_controls = {}  # broker name -> (status text, switch) on the home tab
         
     def create_app_header(self):
         """Create the top app header with logo, search, VIP button, and notifications"""
@@ -43,7 +53,7 @@ class Dashboard:
                 # Search Bar
                 ft.Container(
                     content=ft.TextField(
-                        hint_text=smart_translator.get_text("search_broker_bot"),
+                        hint_text=self.translator.get_text("search_broker_bot"),
                         hint_style=ft.TextStyle(
                             color=self.styles.TEXT_MUTED,
                             size=14,
@@ -278,47 +288,21 @@ class Dashboard:
     
     def create_broker_card(self, broker_name, is_active=False, progress=0.0):
         """Create individual broker card with progress"""
-        import os
-        import base64
-        
-        def get_base64_image(image_path):
-            """Convert image to base64 for Flet compatibility"""
-            try:
-                with open(image_path, "rb") as img_file:
-                    return base64.b64encode(img_file.read()).decode('utf-8')
-            except Exception as e:
-                print(f"Error loading image {image_path}: {e}")
-                return None
-        
-        # Try to load PNG images as base64
-        broker_logos = {
-            "Binomo": "assets/brokers/binomo.png",
-            "Stockity": "assets/brokers/stockity.png",
-            "IQ Option": "assets/brokers/iqoption.png",
-            "Olymptrade": "assets/brokers/olymptrade.png",
-            "Quotex": "assets/brokers/quotex.png",
-        }
-        
-        logo_path = broker_logos.get(broker_name, "assets/logo.svg")
-        
-        # Try to get base64 version of the image
-        base64_image = None
-        if broker_name in broker_logos and os.path.exists(logo_path):
-            base64_image = get_base64_image(logo_path)
-            if base64_image:
-                logo_path = f"data:image/png;base64,{base64_image}"
-                print(f"✓ Base64 logo loaded for {broker_name}")
-            else:
-                print(f"✗ Failed to load base64 for {broker_name}")
-        else:
-            print(f"✗ PNG file not found for {broker_name}: {logo_path}")
+        logo_src = asset_registry.broker_logo(broker_name)
+        status_text = ft.Text(size=12)
+        status_switch = ft.Switch(
+            on_change=lambda e: self.toggle_broker(broker_name, e.control.value),
+            active_color=self.styles.SUCCESS_COLOR,
+        )
+        self.broker_controls[broker_name] = (status_text, status_switch)
+        self.set_broker_status(broker_name, is_active)
         
         return ft.Container(
             content=ft.Column([
                 ft.Row([
                     ft.Container(
                         content=ft.Image(
-                            src=logo_path,
+                            src=logo_src,
                             width=40,
                             height=40,
                             fit=ft.ImageFit.CONTAIN,
@@ -340,18 +324,10 @@ class Dashboard:
                             weight=ft.FontWeight.BOLD,
                             color=self.styles.TEXT_PRIMARY,
                         ),
-                        ft.Text(
-                            "Aktif" if is_active else "Tidak Aktif",
-                            size=12,
-                            color=self.styles.SUCCESS_COLOR if is_active else self.styles.TEXT_MUTED,
-                        ),
+                        status_text,
                     ], spacing=2, expand=True),
                     ft.Container(
-                        content=ft.Switch(
-                            value=is_active,
-                            on_change=lambda e: self.toggle_broker(broker_name, e.control.value),
-                            active_color=self.styles.SUCCESS_COLOR,
-                        ),
+                        content=status_switch,
                         padding=ft.padding.only(right=10),
                     ),
                 ]),
@@ -396,12 +372,13 @@ class Dashboard:
     
     def create_trading_bot_section(self):
         """Create the trading bot section"""
+        active_brokers = self.get_active_brokers() or set()
         brokers_data = [
-            {"name": "Binomo", "active": True, "progress": 0.75},
-            {"name": "Stockity", "active": False, "progress": 0.30},
-            {"name": "IQ Option", "active": True, "progress": 0.90},
-            {"name": "Olymptrade", "active": False, "progress": 0.15},
-            {"name": "Quotex", "active": True, "progress": 0.60},
+            {"name": "Binomo", "active": "Binomo" in active_brokers, "progress": 0.75},
+            {"name": "Stockity", "active": "Stockity" in active_brokers, "progress": 0.30},
+            {"name": "IQ Option", "active": "IQ Option" in active_brokers, "progress": 0.90},
+            {"name": "Olymptrade", "active": "Olymptrade" in active_brokers, "progress": 0.15},
+            {"name": "Quotex", "active": "Quotex" in active_brokers, "progress": 0.60},
         ]
         
         return ft.Column([
@@ -441,46 +418,31 @@ class Dashboard:
     def create_bottom_navigation(self):
         """Create modern bottom navigation bar with clean design"""
         nav_items = [
-            {"icon": ft.Icons.HOME, "label": smart_translator.get_text("beranda"), "key": "beranda"},
-            {"icon": ft.Icons.SMART_TOY, "label": smart_translator.get_text("active_bots"), "key": "bots"},
-            {"icon": ft.Icons.HISTORY, "label": smart_translator.get_text("history"), "key": "history"},
-            {"icon": ft.Icons.PERSON, "label": smart_translator.get_text("profile"), "key": "profile"},
+            {"icon": ft.Icons.HOME, "label": self.translator.get_text("beranda"), "key": "beranda"},
+            {"icon": ft.Icons.SMART_TOY, "label": self.translator.get_text("active_bots"), "key": "bots"},
+            {"icon": ft.Icons.HISTORY, "label": self.translator.get_text("history"), "key": "history"},
+            {"icon": ft.Icons.PERSON, "label": self.translator.get_text("profile"), "key": "profile"},
         ]
         
         # Create navigation buttons
         nav_buttons = []
         
         for item in nav_items:
-            is_active = item["key"] == self.current_tab.lower()
-            
             # Create navigation button with app theme colors
             nav_button = ft.Container(
                 content=ft.Column([
                     ft.Container(
-                        content=ft.Icon(
-                            item["icon"],
-                            color=self.styles.TEXT_PRIMARY if is_active else self.styles.TEXT_TERTIARY,
-                            size=24,
-                        ),
+                        content=ft.Icon(item["icon"], size=24),
                         width=48,
                         height=32,
-                        bgcolor=self.styles.TEXT_SECONDARY if is_active else ft.Colors.TRANSPARENT,
                         border_radius=16,
                         alignment=ft.alignment.center,
                         animate=ft.Animation(300, ft.AnimationCurve.EASE_OUT),
-                        shadow=ft.BoxShadow(
-                            spread_radius=0,
-                            blur_radius=8,
-                            color=ft.Colors.with_opacity(0.3, self.styles.TEXT_SECONDARY) if is_active else ft.Colors.TRANSPARENT,
-                            offset=ft.Offset(0, 2),
-                        ) if is_active else None,
                     ),
                     ft.Container(height=4),
                     ft.Text(
                         item["label"],
                         size=10,
-                        color=self.styles.TEXT_SECONDARY if is_active else self.styles.TEXT_MUTED,
-                        weight=ft.FontWeight.W_600 if is_active else ft.FontWeight.W_400,
                         text_align=ft.TextAlign.CENTER,
                     ),
                 ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=0),
@@ -488,7 +450,9 @@ class Dashboard:
                 on_click=lambda e, key=item["key"]: self.switch_tab(key),
                 expand=True,
                 animate=ft.Animation(200, ft.AnimationCurve.EASE_OUT),
+                data=item["key"],
             )
+            self.style_nav_button(nav_button, item["key"] == self.current_tab.lower())
             nav_buttons.append(nav_button)
         
         # Create the main navigation bar with app theme
@@ -518,6 +482,31 @@ class Dashboard:
         
         return nav_bar
     
+    def style_nav_button(self, nav_button, is_active):
+        """Apply active/inactive colors to a bottom navigation button in place"""
+        icon_container, _, label = nav_button.content.controls
+        icon_container.content.color = self.styles.TEXT_PRIMARY if is_active else self.styles.TEXT_TERTIARY
+        icon_container.bgcolor = self.styles.TEXT_SECONDARY if is_active else ft.Colors.TRANSPARENT
+        icon_container.shadow = ft.BoxShadow(
+            spread_radius=0,
+            blur_radius=8,
+            color=ft.Colors.with_opacity(0.3, self.styles.TEXT_SECONDARY),
+            offset=ft.Offset(0, 2),
+        ) if is_active else None
+        label.color = self.styles.TEXT_SECONDARY if is_active else self.styles.TEXT_MUTED
+        label.weight = ft.FontWeight.W_600 if is_active else ft.FontWeight.W_400
+    
+    def update_bottom_navigation(self):
+        """Restyle the mounted bottom navigation for current_tab, returns the buttons that changed"""
+        changed = []
+        for nav_button in self.bottom_navigation.content.controls:
+            is_active = nav_button.data == self.current_tab
+            was_active = nav_button.content.controls[0].bgcolor == self.styles.TEXT_SECONDARY
+            if is_active != was_active:
+                self.style_nav_button(nav_button, is_active)
+                changed.append(nav_button)
+        return changed
+    
     def show_vip_options(self, e):
         """Show VIP subscription options"""
         def close_dialog(e):
@@ -525,7 +514,7 @@ class Dashboard:
             self.page.update()
         
         def select_plan(e, plan):
-            print(f"Selected VIP plan: {plan}")
+            logger.info(f"Selected VIP plan: {plan}")
             close_dialog(e)
         
         dialog = ft.AlertDialog(
@@ -606,46 +595,91 @@ class Dashboard:
         self.current_broker = broker
         self.page.update()
     
+    def get_active_brokers(self):
+        """Names of the brokers the user has an active bot on, None if the bots could not be loaded"""
+        try:
+            bots = self.db_manager.repository.get_user_bots(self.user_data.get('id'))
+        except Exception as e:
+            logger.error(f"Error loading bots: {e}")
+            return None
+        return {bot['broker_name'] for bot in bots if bot['is_active']}
+    
+    def set_broker_status(self, broker_name, is_active):
+        """Show a broker card as active or inactive"""
+        status_text, status_switch = self.broker_controls[broker_name]
+        status_text.value = "Aktif" if is_active else "Tidak Aktif"
+        status_text.color = self.styles.SUCCESS_COLOR if is_active else self.styles.TEXT_MUTED
+        status_switch.value = is_active
+    
+    def refresh_broker_cards(self):
+        """Re-read which brokers have an active bot; the bot runner stops bots on its own"""
+        active_brokers = self.get_active_brokers()
+        if active_brokers is None:
+            return  # Keep what is shown
+        for broker_name in self.broker_controls:
+            self.set_broker_status(broker_name, broker_name in active_brokers)
+    
     def toggle_broker(self, broker_name, is_active):
-        """Toggle broker active status"""
-        from utils.logger import logger
+        """Switch the user's bots on a broker on or off (a default bot is created on first use)"""
+        user_id = self.user_data.get('id')
         logger.debug(f"Toggling {broker_name}: {is_active}")
+        try:
+            repository = self.db_manager.repository
+            if not repository.set_broker_bots_active(user_id, broker_name, is_active) and is_active:
+                repository.create_bot({
+                    'user_id': user_id,
+                    'bot_name': f"{broker_name} Bot",
+                    'broker_name': broker_name,
+                    'strategy_type': AppConfig.BOT_DEFAULT_STRATEGY,
+                    'is_active': True,
+                    'profit_target': AppConfig.BOT_DEFAULT_PROFIT_TARGET,
+                    'stop_loss': AppConfig.BOT_DEFAULT_STOP_LOSS,
+                    'investment_amount': AppConfig.BOT_DEFAULT_INVESTMENT,
+                })
+            bot_runner.request_reload()
+        except Exception as e:
+            logger.error(f"Error toggling {broker_name}: {e}")
+            is_active = not is_active  # Put the switch back
+        self.set_broker_status(broker_name, is_active)
         self.page.update()
     
     def switch_tab(self, tab_key):
         """Switch bottom navigation tab"""
         self.current_tab = tab_key
         
-        # Handle different tab actions
-        if tab_key == "beranda":
-            self.show_home_content()
-        elif tab_key == "bots":
-            self.show_active_bots()
-        elif tab_key == "history":
-            self.show_history()
-        elif tab_key == "profile":
-            self.show_profile()
+        # Sub-pages (settings, admin...) replace the whole page; remount the shell first
+        if self.shell is None or self.shell not in self.page.controls:
+            self.build(tab_key)
+            return
         
-        self.page.update()
+        self.router.show(tab_key, *self.update_bottom_navigation())
     
     def show_home_content(self):
         """Show home/beranda content"""
-        self.build()
+        self.switch_tab("beranda")
     
     def show_active_bots(self):
         """Show active bots page"""
-        # Clear current content and show active bots
-        self.page.clean()
-        
-        # Create active bots page
-        active_bots_content = ft.Container(
+        self.switch_tab("bots")
+    
+    def show_history(self):
+        """Show trading history page"""
+        self.switch_tab("history")
+    
+    def show_profile(self):
+        """Show profile page"""
+        self.switch_tab("profile")
+    
+    def build_active_bots_view(self):
+        """Build the active bots tab"""
+        return ft.Container(
             content=ft.Column([
                 # Header
                 ft.Container(
                     content=ft.Row([
                         ft.IconButton(
                             icon=ft.Icons.ARROW_BACK,
-                            on_click=lambda e: self.build(),
+                            on_click=lambda e: self.switch_tab("beranda"),
                             icon_color=self.styles.TEXT_PRIMARY,
                         ),
                         ft.Text(
@@ -696,30 +730,21 @@ class Dashboard:
                     expand=True,
                     padding=20,
                 ),
-                
-                # Bottom navigation
-                self.create_bottom_navigation(),
             ], spacing=0),
             expand=True,
             bgcolor=self.styles.PRIMARY_COLOR,
         )
         
-        self.page.add(active_bots_content)
-        
-    def show_history(self):
-        """Show trading history page"""
-        # Clear current content and show history
-        self.page.clean()
-        
-        # Create history page
-        history_content = ft.Container(
+    def build_history_view(self):
+        """Build the trading history tab"""
+        return ft.Container(
             content=ft.Column([
                 # Header
                 ft.Container(
                     content=ft.Row([
                         ft.IconButton(
                             icon=ft.Icons.ARROW_BACK,
-                            on_click=lambda e: self.build(),
+                            on_click=lambda e: self.switch_tab("beranda"),
                             icon_color=self.styles.TEXT_PRIMARY,
                         ),
                         ft.Text(
@@ -733,67 +758,28 @@ class Dashboard:
                     padding=ft.padding.symmetric(vertical=15, horizontal=10),
                 ),
                 
-                # History list
+                # History list, paged in from the database as the user scrolls
                 ft.Container(
-                    content=ft.Column([
-                        ft.Container(
-                            content=ft.Row([
-                                ft.Icon(ft.Icons.TRENDING_UP, color=self.styles.SUCCESS_COLOR),
-                                ft.Column([
-                                    ft.Text("EUR/USD", size=16, weight=ft.FontWeight.BOLD, color=self.styles.TEXT_PRIMARY),
-                                    ft.Text("2024-01-15 14:30", size=12, color=self.styles.TEXT_TERTIARY),
-                                    ft.Text("Binomo", size=12, color=self.styles.TEXT_SECONDARY),
-                                ], expand=True),
-                                ft.Text("+$125", size=16, color=self.styles.SUCCESS_COLOR, weight=ft.FontWeight.BOLD),
-                            ]),
-                            bgcolor=self.styles.SECONDARY_COLOR,
-                            padding=15,
-                            border_radius=10,
-                            margin=ft.margin.only(bottom=10),
-                        ),
-                        ft.Container(
-                            content=ft.Row([
-                                ft.Icon(ft.Icons.TRENDING_DOWN, color=self.styles.ERROR_COLOR),
-                                ft.Column([
-                                    ft.Text("GBP/USD", size=16, weight=ft.FontWeight.BOLD, color=self.styles.TEXT_PRIMARY),
-                                    ft.Text("2024-01-15 13:45", size=12, color=self.styles.TEXT_TERTIARY),
-                                    ft.Text("Quotex", size=12, color=self.styles.TEXT_SECONDARY),
-                                ], expand=True),
-                                ft.Text("-$50", size=16, color=self.styles.ERROR_COLOR, weight=ft.FontWeight.BOLD),
-                            ]),
-                            bgcolor=self.styles.SECONDARY_COLOR,
-                            padding=15,
-                            border_radius=10,
-                            margin=ft.margin.only(bottom=10),
-                        ),
-                    ]),
+                    content=TradingHistoryView(
+                        self.page, self.db_manager.repository, self.user_data.get('id')
+                    ).build(),
                     expand=True,
-                    padding=20,
                 ),
-                
-                # Bottom navigation
-                self.create_bottom_navigation(),
             ], spacing=0),
             expand=True,
             bgcolor=self.styles.PRIMARY_COLOR,
         )
         
-        self.page.add(history_content)
-        
-    def show_profile(self):
-        """Show profile page"""
-        # Clear current content and show profile
-        self.page.clean()
-        
-        # Create profile page
-        profile_content = ft.Container(
+    def build_profile_view(self):
+        """Build the profile tab"""
+        return ft.Container(
             content=ft.Column([
                 # Header
                 ft.Container(
                     content=ft.Row([
                         ft.IconButton(
                             icon=ft.Icons.ARROW_BACK,
-                            on_click=lambda e: self.build(),
+                            on_click=lambda e: self.switch_tab("beranda"),
                             icon_color=self.styles.TEXT_PRIMARY,
                         ),
                         ft.Text(
@@ -834,7 +820,7 @@ class Dashboard:
                                                 size=16,
                                             ),
                                             ft.Text(
-                                                smart_translator.get_text("vip_premium") if self.user_data.get('vip_status') == 'premium' else smart_translator.get_text("regular"),
+                                                self.translator.get_text("vip_premium") if self.user_data.get('vip_status') == 'premium' else self.translator.get_text("regular"),
                                                 size=12,
                                                 color=self.styles.TEXT_SECONDARY,
                                             ),
@@ -853,24 +839,24 @@ class Dashboard:
                             content=ft.Column([
                                 ft.ListTile(
                                     leading=ft.Icon(ft.Icons.LANGUAGE, color=self.styles.TEXT_SECONDARY),
-                                    title=ft.Text(smart_translator.get_text("language"), color=self.styles.TEXT_PRIMARY),
+                                    title=ft.Text(self.translator.get_text("language"), color=self.styles.TEXT_PRIMARY),
                                     trailing=ft.Icon(ft.Icons.ARROW_FORWARD_IOS, color=self.styles.TEXT_TERTIARY),
                                     on_click=lambda e: self.show_language_selection(),
                                 ),
                                 ft.ListTile(
                                     leading=ft.Icon(ft.Icons.SETTINGS, color=self.styles.TEXT_SECONDARY),
-                                    title=ft.Text(smart_translator.get_text("settings"), color=self.styles.TEXT_PRIMARY),
+                                    title=ft.Text(self.translator.get_text("settings"), color=self.styles.TEXT_PRIMARY),
                                     trailing=ft.Icon(ft.Icons.ARROW_FORWARD_IOS, color=self.styles.TEXT_TERTIARY),
                                     on_click=lambda e: self.show_settings(),
                                 ),
                                 ft.ListTile(
                                     leading=ft.Icon(ft.Icons.HELP, color=self.styles.TEXT_SECONDARY),
-                                    title=ft.Text(smart_translator.get_text("help_support"), color=self.styles.TEXT_PRIMARY),
+                                    title=ft.Text(self.translator.get_text("help_support"), color=self.styles.TEXT_PRIMARY),
                                     trailing=ft.Icon(ft.Icons.ARROW_FORWARD_IOS, color=self.styles.TEXT_TERTIARY),
                                 ),
                                 ft.ListTile(
                                     leading=ft.Icon(ft.Icons.LOGOUT, color=self.styles.ERROR_COLOR),
-                                    title=ft.Text(smart_translator.get_text("logout"), color=self.styles.ERROR_COLOR),
+                                    title=ft.Text(self.translator.get_text("logout"), color=self.styles.ERROR_COLOR),
                                     trailing=ft.Icon(ft.Icons.ARROW_FORWARD_IOS, color=self.styles.TEXT_TERTIARY),
                                     on_click=lambda e: self.logout(),
                                 ),
@@ -883,19 +869,14 @@ class Dashboard:
                     expand=True,
                     padding=20,
                 ),
-                
-                # Bottom navigation
-                self.create_bottom_navigation(),
             ], spacing=0),
             expand=True,
             bgcolor=self.styles.PRIMARY_COLOR,
         )
         
-        self.page.add(profile_content)
-        
     def show_language_selection(self):
         """Show language selection dialog with save/cancel functionality"""
-        selected_language = smart_translator.current_language
+        selected_language = self.translator.current_language
         
         def select_language(language_code):
             """Select a language temporarily"""
@@ -906,10 +887,14 @@ class Dashboard:
             
         def save_language(e):
             """Save the selected language"""
-            smart_translator.set_language(selected_language)
+            self.translator.set_language(selected_language)
+            self.user_data['language'] = selected_language
+            if self.user_data.get('id') is not None:
+                self.db_manager.set_user_language(self.user_data['id'], selected_language)
             close_dialog(e)
-            # Refresh the current page to apply new language
-            self.show_profile()
+            # Cached tabs hold translated text; rebuild them in the new language
+            self.router.invalidate()
+            self.build("profile")
             
         def close_dialog(e):
             """Close the dialog"""
@@ -919,9 +904,9 @@ class Dashboard:
         def update_language_options():
             """Update language options display"""
             language_options.controls.clear()
-            for lang in smart_translator.get_supported_languages():
+            for lang in self.translator.get_supported_languages():
                 is_selected = lang["code"] == selected_language
-                is_current = lang["code"] == smart_translator.current_language
+                is_current = lang["code"] == self.translator.current_language
                 
                 # Show both current and selected states
                 trailing_icon = None
@@ -948,7 +933,7 @@ class Dashboard:
         update_language_options()
         
         dialog = ft.AlertDialog(
-            title=ft.Text(smart_translator.get_text("select_language"), color=self.styles.TEXT_PRIMARY),
+            title=ft.Text(self.translator.get_text("select_language"), color=self.styles.TEXT_PRIMARY),
             content=ft.Container(
                 content=language_options,
                 width=350,
@@ -956,12 +941,12 @@ class Dashboard:
             ),
             actions=[
                 ft.TextButton(
-                    smart_translator.get_text("cancel"), 
+                    self.translator.get_text("cancel"), 
                     on_click=close_dialog,
                     style=ft.ButtonStyle(color=self.styles.TEXT_SECONDARY)
                 ),
                 ft.ElevatedButton(
-                    smart_translator.get_text("save"), 
+                    self.translator.get_text("save"), 
                     on_click=save_language,
                     bgcolor=self.styles.ACCENT_COLOR,
                     color=ft.Colors.WHITE
@@ -1224,7 +1209,7 @@ class Dashboard:
                                 ft.Icon(ft.Icons.PERSON, size=80, color=self.styles.TEXT_SECONDARY),
                                 ft.TextButton(
                                     "Change Picture",
-                                    on_click=lambda e: print("Change picture clicked"),
+                                    on_click=lambda e: logger.debug("Change picture clicked"),
                                     style=ft.ButtonStyle(color=self.styles.TEXT_SECONDARY),
                                 ),
                             ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
@@ -1963,7 +1948,7 @@ class Dashboard:
         
         def save_user(e):
             # TODO: Implement user creation in database
-            print(f"Creating user: {name_field.value}, {email_field.value}")
+            logger.info(f"Creating user: {name_field.value}, {email_field.value}")
             close_dialog(e)
             self.show_user_management()  # Refresh the page
         
@@ -2005,7 +1990,7 @@ class Dashboard:
         
         def save_changes(e):
             # TODO: Implement user update in database
-            print(f"Updating user {user['id']}: {name_field.value}, {vip_dropdown.value}")
+            logger.info(f"Updating user {user['id']}: {name_field.value}, {vip_dropdown.value}")
             close_dialog(e)
             self.show_user_management()  # Refresh the page
         
@@ -2047,7 +2032,7 @@ class Dashboard:
         
         def confirm_delete(e):
             # TODO: Implement user deletion in database
-            print(f"Deleting user {user['id']}: {user['name']}")
+            logger.info(f"Deleting user {user['id']}: {user['name']}")
             close_dialog(e)
             self.show_user_management()  # Refresh the page
         
@@ -2073,7 +2058,7 @@ class Dashboard:
         
         def save_bot(e):
             # TODO: Implement bot creation in database
-            print(f"Creating bot: {name_field.value}, {broker_dropdown.value}")
+            logger.info(f"Creating bot: {name_field.value}, {broker_dropdown.value}")
             close_dialog(e)
             self.show_bot_management()  # Refresh the page
         
@@ -2115,7 +2100,7 @@ class Dashboard:
         
         def save_changes(e):
             # TODO: Implement bot update in database
-            print(f"Updating bot {bot['id']}: {name_field.value}, {status_dropdown.value}")
+            logger.info(f"Updating bot {bot['id']}: {name_field.value}, {status_dropdown.value}")
             close_dialog(e)
             self.show_bot_management()  # Refresh the page
         
@@ -2157,7 +2142,7 @@ class Dashboard:
         
         def confirm_delete(e):
             # TODO: Implement bot deletion in database
-            print(f"Deleting bot {bot['id']}: {bot['name']}")
+            logger.info(f"Deleting bot {bot['id']}: {bot['name']}")
             close_dialog(e)
             self.show_bot_management()  # Refresh the page
         
@@ -2178,33 +2163,44 @@ class Dashboard:
     def refresh_stats(self):
         """Refresh system statistics"""
         # TODO: Implement stats refresh
-        print("Refreshing system statistics...")
+        logger.debug("Refreshing system statistics...")
         self.show_system_stats()
         
     def filter_logs(self):
         """Filter audit logs"""
         # TODO: Implement log filtering
-        print("Filtering audit logs...")
+        logger.debug("Filtering audit logs...")
         
     def logout(self):
-        """Handle logout"""
-        # Clear user data and return to auth
+        """End the stored session and return to the login page"""
+        try:
+            token = self.page.client_storage.get(AppConfig.SESSION_STORAGE_KEY)
+            if token:
+                session_store.revoke(self.db_manager, token)
+            self.page.client_storage.remove(AppConfig.SESSION_STORAGE_KEY)
+        except Exception as e:
+            logger.debug(f"Client storage unavailable: {e}")
+        
+        if self.on_logout:
+            self.on_logout()
+            return
         from core.pages.auth_handler import AuthHandler
-        self.current_page = AuthHandler(self.page, None)
+        self.current_page = AuthHandler(self.page, self.show_dashboard_for, self.db_manager)
         self.current_page.show_login()
         
+    def show_dashboard_for(self, user_data):
+        """Build a fresh dashboard after logging in again from logout()"""
+        Dashboard(self.page, user_data, self.db_manager).build()
+        
 
         
 
         
 
     
-    def build(self):
-        """Build and display the dashboard"""
-        self.page.clean()
-        
-        # Create main layout
-        dashboard_content = ft.Container(
+    def build_home_view(self):
+        """Build the beranda tab: app header, broker navigation and trading content"""
+        return ft.Container(
             content=ft.Column([
                 # App Header
                 self.create_app_header(),
@@ -2222,14 +2218,35 @@ class Dashboard:
                     ], scroll=ft.ScrollMode.AUTO),
                     expand=True,
                 ),
+            ], spacing=0),
+            expand=True,
+        )
+    
+    def build(self, tab_key="beranda"):
+        """Mount the dashboard shell (routed content area + bottom navigation) and show a tab"""
+        if self.router is None:
+            self.router = ViewRouter(self.page)
+            self.router.register("beranda", self.build_home_view, on_show=self.refresh_broker_cards)
+            self.router.register("bots", self.build_active_bots_view)
+            # Rebuilt on each visit so trades written by the bot runner show up, scrolled to the top
+            self.router.register("history", self.build_history_view, cache=False)
+            self.router.register("profile", self.build_profile_view)
+        
+        self.current_tab = tab_key
+        self.bottom_navigation = self.create_bottom_navigation()
+        self.shell = ft.Container(
+            content=ft.Column([
+                # Routed tab content; built tabs stay mounted and are toggled
+                self.router.container,
                 
                 # Floating Bottom Navigation
-                self.create_bottom_navigation(),
+                self.bottom_navigation,
                 
             ], spacing=0),
             expand=True,
             bgcolor=self.styles.PRIMARY_COLOR,
         )
         
-        self.page.add(dashboard_content)
-        self.page.update()
\ No newline at end of file
+        self.page.clean()
+        self.router.show(tab_key, update=False)
+        self.page.add(self.shell)
@@ -0,0 +1,228 @@
+import flet as ft
+import threading
+
+from core.styles import AppStyles
+from config.app_config import AppConfig
+from utils.logger import logger
+
+class HistoryRow(ft.Container):
+    """One history row; refilled with another trade when the list recycles it"""
+
+    def __init__(self, styles):
+        icon = ft.Icon()
+        asset_pair = ft.Text(size=16, weight=ft.FontWeight.BOLD, color=styles.TEXT_PRIMARY)
+        created_at = ft.Text(size=12, color=styles.TEXT_TERTIARY)
+        broker_name = ft.Text(size=12, color=styles.TEXT_SECONDARY)
+        amount = ft.Text(size=16, weight=ft.FontWeight.BOLD)
+        super().__init__(
+            content=ft.Row([
+                icon,
+                ft.Column([asset_pair, created_at, broker_name], expand=True, spacing=0),
+                amount,
+            ]),
+            bgcolor=styles.SECONDARY_COLOR,
+            padding=ft.padding.symmetric(horizontal=15, vertical=10),
+            border_radius=10,
+            margin=ft.margin.only(bottom=10),
+        )
+        self.styles = styles
+        self.trade_key = None  # (created_at, id) of the trade shown
+        self.icon = icon
+        self.asset_pair = asset_pair
+        self.created_at = created_at
+        self.broker_name = broker_name
+        self.amount = amount
+
+    def show(self, trade):
+        result = trade.get('result')
+        investment = trade.get('investment_amount') or 0.0
+
+        if result == 'win':
+            icon, color = ft.Icons.TRENDING_UP, self.styles.SUCCESS_COLOR
+            amount = f"+${(trade.get('payout_amount') or 0.0) - investment:,.2f}"
+        elif result == 'loss':
+            icon, color = ft.Icons.TRENDING_DOWN, self.styles.ERROR_COLOR
+            amount = f"-${investment:,.2f}"
+        elif result == 'draw':
+            # The stake is refunded
+            icon, color = ft.Icons.REMOVE, self.styles.TEXT_SECONDARY
+            amount = "Draw"
+        else:
+            icon, color = ft.Icons.SCHEDULE, self.styles.TEXT_TERTIARY
+            amount = f"${investment:,.2f}"
+
+        self.trade_key = (trade['created_at'], trade['id'])
+        self.icon.name = icon
+        self.icon.color = color
+        self.asset_pair.value = trade['asset_pair']
+        self.created_at.value = str(trade['created_at'])[:16]
+        self.broker_name.value = trade['broker_name']
+        self.amount.value = amount
+        self.amount.color = color
+        return self
+
+
+class TradingHistoryView:
+    """Trading history list that pages through trading_history on scroll
+
+    Only window_pages pages are kept as controls. Scrolling down drops the
+    oldest rows off the top, and scrolling back refetches them with a
+    reverse keyset query. Control count and memory therefore stay flat
+    however long the history is. Dropped row controls are refilled rather
+    than rebuilt.
+    """
+
+    ROW_HEIGHT = 88  # Fixed extent lets the ListView lay rows out lazily
+
+    def __init__(self, page: ft.Page, repository, user_id, page_size=None, window_pages=None):
+        self.page = page
+        self.repository = repository
+        self.user_id = user_id
+        self.page_size = page_size or AppConfig.HISTORY_PAGE_SIZE
+        self.window_pages = max(2, window_pages or AppConfig.HISTORY_WINDOW_PAGES)
+        self.styles = AppStyles()
+
+        self.rows = []  # HistoryRows on screen, newest first
+        self._spare_rows = []  # Dropped rows waiting to be refilled
+        self._has_newer = False  # Rows were dropped off the top
+        self._exhausted = False  # Nothing older than the last row
+        self._pixels = 0.0
+        self._loading = False
+        self._lock = threading.Lock()
+
+        self.list_view = ft.ListView(
+            expand=True,
+            spacing=0,
+            item_extent=self.ROW_HEIGHT,
+            padding=ft.padding.symmetric(horizontal=20, vertical=10),
+            on_scroll_interval=100,
+            on_scroll=self.handle_scroll,
+        )
+        self.header = self.build_spinner()
+        self.footer = self.build_spinner()
+
+    @property
+    def max_rows(self):
+        return self.page_size * self.window_pages
+
+    def build(self):
+        """Build the list control and load the first page"""
+        self.load_next_page(update=False)
+        return self.list_view
+
+    def handle_scroll(self, e: ft.OnScrollEvent):
+        """Fetch the next (or previous) page once the user nears either end of what is loaded"""
+        if e.max_scroll_extent is None or e.pixels is None:
+            return
+        self._pixels = e.pixels
+        if e.max_scroll_extent - e.pixels < self.ROW_HEIGHT * 5:
+            self.load_next_page()
+        elif self._has_newer and e.pixels < self.ROW_HEIGHT * 5:
+            self.load_previous_page()
+
+    def load_next_page(self, update=True):
+        """Append the next older keyset page, dropping rows off the top past the window"""
+        if not self._begin_load(lambda: self._exhausted):
+            return
+        try:
+            cursor = self.rows[-1].trade_key if self.rows else None
+            trades = self._fetch(self.repository.get_trades_page, cursor)
+            if trades is None:
+                # Keep the cursor and the footer; the next scroll retries
+                self._render(update)
+                return
+            if len(trades) < self.page_size:
+                self._exhausted = True
+
+            self.rows.extend(self.take_row().show(trade) for trade in trades)
+            dropped = max(0, len(self.rows) - self.max_rows)
+            if dropped:
+                self._recycle(self.rows[:dropped])
+                del self.rows[:dropped]
+                self._has_newer = True
+            self._render(update, shift=-dropped)
+        finally:
+            self._loading = False
+
+    def load_previous_page(self, update=True):
+        """Prepend the page just newer than the top row, dropping rows off the bottom past the window"""
+        if not self._begin_load(lambda: not self._has_newer or not self.rows):
+            return
+        try:
+            trades = self._fetch(self.repository.get_trades_page_after, self.rows[0].trade_key)
+            if trades is None:
+                self._render(update)
+                return
+            if len(trades) < self.page_size:
+                self._has_newer = False
+
+            self.rows[:0] = [self.take_row().show(trade) for trade in trades]
+            dropped = max(0, len(self.rows) - self.max_rows)
+            if dropped:
+                self._recycle(self.rows[-dropped:])
+                del self.rows[-dropped:]
+                self._exhausted = False
+            self._render(update, shift=len(trades))
+        finally:
+            self._loading = False
+
+    def _begin_load(self, done):
+        with self._lock:
+            if self._loading or done():
+                return False
+            self._loading = True
+            return True
+
+    def _fetch(self, query, key):
+        """One keyset page, or None when the query failed (not the same as no more rows)"""
+        try:
+            if key is None:
+                return query(self.user_id, self.page_size)
+            return query(self.user_id, self.page_size, key)
+        except Exception as e:
+            logger.error(f"Error loading trading history: {e}")
+            return None
+
+    def take_row(self):
+        """A recycled row when one is spare, else a new one"""
+        return self._spare_rows.pop() if self._spare_rows else HistoryRow(self.styles)
+
+    def _recycle(self, rows):
+        # One page of spares covers the next load; extra rows are left to the GC
+        room = self.page_size - len(self._spare_rows)
+        self._spare_rows.extend(rows[:max(0, room)])
+
+    def _render(self, update, shift=0):
+        """Rebuild the controls list; shift rows were added (+) or dropped (-) above the viewport"""
+        had_header = bool(self.list_view.controls) and self.list_view.controls[0] is self.header
+        controls = []
+        if self._has_newer:
+            controls.append(self.header)
+        controls.extend(self.rows)
+        if not self._exhausted:
+            controls.append(self.footer)
+        elif not self.rows:
+            controls.append(self.build_empty_state())
+        self.list_view.controls = controls
+
+        if update:
+            self.list_view.update()
+            # Keep the rows the user is looking at in place while content above them changes
+            shift += int(self._has_newer) - int(had_header)
+            if shift:
+                self._pixels = max(0.0, self._pixels + shift * self.ROW_HEIGHT)
+                self.list_view.scroll_to(offset=self._pixels, duration=0)
+
+    def build_spinner(self):
+        return ft.Container(
+            content=ft.ProgressRing(width=20, height=20, stroke_width=2, color=self.styles.TEXT_SECONDARY),
+            alignment=ft.alignment.center,
+            height=self.ROW_HEIGHT,
+        )
+
+    def build_empty_state(self):
+        return ft.Container(
+            content=ft.Text("No trades yet", size=14, color=self.styles.TEXT_TERTIARY),
+            alignment=ft.alignment.center,
+            height=self.ROW_HEIGHT,
+        )
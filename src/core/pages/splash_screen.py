@@ -1,19 +1,19 @@
 import flet as ft
+import math
 import time
-import threading
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from core.styles import AppStyles
+from core.animation import animation_ticker, Tween, FrameEffect, linear
+from config.app_config import AppConfig
+from utils.logger import logger
 
 class SplashScreen:
-    def __init__(self, page: ft.Page, on_complete_callback):
+    def __init__(self, page: ft.Page, on_complete_callback, mode=None):
         self.page = page
         self.styles = AppStyles()
         self.on_complete_callback = on_complete_callback
+        # 'client' lets Flutter run implicit animations; 'server' streams frames from the ticker
+        self.mode = mode or AppConfig.SPLASH_ANIMATION_MODE
         
     def create_logo(self):
         """Create the ATV logo with enhanced effects"""
@@ -337,98 +337,90 @@ class SplashScreen:
         )
         return loading_text
         
+    def dot_wave_effect(self, progress_bar, frame_seconds=0.05, duration=None, delay=0.0):
+        """Pulse the loading dots in a wave, one step per frame_seconds"""
+        dots = progress_bar.content.controls[1].content.controls
+        
+        def update(seconds):
+            i = int(seconds / frame_seconds)
+            for j, dot in enumerate(dots):
+                # Create wave effect - each dot animates with delay
+                cycle_position = (i + j * 20) % 60
+                if cycle_position < 20:
+                    dot.opacity = 0.3 + (cycle_position / 20) * 0.7
+                elif cycle_position < 40:
+                    dot.opacity = 1.0 - ((cycle_position - 20) / 20) * 0.7
+                else:
+                    dot.opacity = 0.3
+        
+        return FrameEffect(dots, update, duration, delay)
+    
+    def progress_tween(self, progress_bar, duration, delay=0.0):
+        """Fill the progress bar and mirror the value into the percentage text"""
+        bar = progress_bar.content.controls[0].content
+        percentage_text = progress_bar.content.controls[2].content
+        
+        def show_percentage(value):
+            text = f"{int(round(value * 100))}%"
+            if percentage_text.value == text:
+                return ()
+            percentage_text.value = text
+            return (percentage_text,)
+        
+        return Tween(bar, "value", 1.0, duration, start=0.0, delay=delay, easing=linear, on_change=show_percentage)
+        
     def animate_progress(self, progress_bar):
         """Animate the progress bar with percentage updates and dancing dots"""
-        def update_progress():
-            for i in range(101):
-                # Update progress bar
-                progress_bar.content.controls[0].content.value = i / 100
-                # Update percentage text correctly
-                progress_bar.content.controls[2].content.value = f"{i}%"
-                
-                # Animate dots with wave effect
-                dots = progress_bar.content.controls[1].content.controls
-                for j, dot in enumerate(dots):
-                    # Create wave effect - each dot animates with delay
-                    cycle_position = (i + j * 20) % 60
-                    if cycle_position < 20:
-                        dot.opacity = 0.3 + (cycle_position / 20) * 0.7
-                    elif cycle_position < 40:
-                        dot.opacity = 1.0 - ((cycle_position - 20) / 20) * 0.7
-                    else:
-                        dot.opacity = 0.3
-                
-                self.page.update()
-                time.sleep(0.05)
-        
-        thread = threading.Thread(target=update_progress)
-        thread.daemon = True
-        thread.start()
+        animation_ticker.animate(
+            self.page,
+            self.progress_tween(progress_bar, 5.0),
+            self.dot_wave_effect(progress_bar, duration=5.0),
+        )
         
     def animate_floating_particles(self):
         """Animate floating particles around the logo"""
-        def animate_particles():
-            import math
-            cycle = 0
-            while cycle < 100:  # Run for about 5 seconds
-                # Get particle containers
-                particles = self.logo.content.controls[1].content.controls
-                
-                for i, particle in enumerate(particles):
-                    # Create circular floating motion
-                    angle = (cycle * 0.1) + (i * 1.5)  # Different phase for each particle
-                    radius = 15 + (i * 5)  # Different radius for each particle
-                    
-                    # Calculate new position
-                    x_offset = math.cos(angle) * radius
-                    y_offset = math.sin(angle) * radius
-                    
-                    # Apply smooth movement
-                    if i % 2 == 0:  # Even particles move clockwise
-                        particle.left = 70 + x_offset
-                        particle.top = 70 + y_offset
-                    else:  # Odd particles move counter-clockwise
-                        particle.right = 70 - x_offset
-                        particle.bottom = 70 - y_offset
+        particles = self.logo.content.controls[1].content.controls
+        glow = self.logo.content.controls[0]
+        
+        def update(seconds):
+            cycle = seconds / 0.05
+            for i, particle in enumerate(particles):
+                # Create circular floating motion
+                angle = (cycle * 0.1) + (i * 1.5)  # Different phase for each particle
+                radius = 15 + (i * 5)  # Different radius for each particle
                 
-                # Pulse logo glow effect
-                glow = self.logo.content.controls[0]
-                glow.opacity = 0.3 + (math.sin(cycle * 0.2) * 0.2)
+                # Calculate new position
+                x_offset = math.cos(angle) * radius
+                y_offset = math.sin(angle) * radius
                 
-                self.page.update()
-                time.sleep(0.05)
-                cycle += 1
+                # Apply smooth movement
+                if i % 2 == 0:  # Even particles move clockwise
+                    particle.left = 70 + x_offset
+                    particle.top = 70 + y_offset
+                else:  # Odd particles move counter-clockwise
+                    particle.right = 70 - x_offset
+                    particle.bottom = 70 - y_offset
+            
+            # Pulse logo glow effect
+            glow.opacity = 0.3 + (math.sin(cycle * 0.2) * 0.2)
         
-        thread = threading.Thread(target=animate_particles)
-        thread.daemon = True
-        thread.start()
+        # Run for about 5 seconds
+        animation_ticker.animate(self.page, FrameEffect(particles + [glow], update, 5.0))
 
     def simple_progress_animation(self):
         """Simple progress animation"""
-        def progress_update():
-            try:
-                # Get progress bar from the page
-                progress_bar = self.page.controls[0].content.controls[5]
-                
-                # Animate progress
-                for i in range(0, 101, 5):
-                    progress_bar.value = i / 100
-                    self.page.update()
-                    time.sleep(0.1)
-                
+        try:
+            progress_bar = self.progress_bar.content.controls[0].content
+            animation_ticker.animate(
+                self.page,
+                Tween(progress_bar, "value", 1.0, 2.0, start=0.0, easing=linear),
                 # Wait a moment then navigate to auth
-                time.sleep(1)
-                self.on_complete_callback()
-                
-            except Exception as e:
-                print(f"Progress animation error: {e}")
-                # Fallback - just wait and continue
-                time.sleep(3)
-                self.on_complete_callback()
-        
-        thread = threading.Thread(target=progress_update)
-        thread.daemon = True
-        thread.start()
+                FrameEffect([], lambda seconds: None, 1.0, delay=2.0),
+                on_complete=self.on_complete_callback,
+            )
+        except Exception as e:
+            logger.error(f"Progress animation error: {e}")
+            self.on_complete_callback()
         
     def fade_out_splash(self):
         """Fade out the splash screen"""
@@ -617,6 +609,8 @@ class SplashScreen:
             self.progress_bar = self.create_progress_bar()
             self.loading_text = self.create_loading_text()
             self.version_text = self.create_version_text()
+            if self.mode == "client":
+                self.prepare_client_animations()
             
             # Create main container with gradient background like original
             splash_container = ft.Container(
@@ -653,7 +647,6 @@ class SplashScreen:
             self.page.update()
             
         except Exception as e:
-            from utils.logger import logger
             logger.error(f"Error in splash build: {e}")
             # Fallback to simple splash
             self.page.add(ft.Text("ATV - Loading...", color=ft.Colors.WHITE, size=24))
@@ -661,48 +654,109 @@ class SplashScreen:
             time.sleep(3)
             self.on_complete_callback()
             
+    def prepare_client_animations(self):
+        """Declare implicit animations so the client tweens between a few target states"""
+        particle_layer = self.logo.content.controls[1]
+        particle_layer.animate_rotation = ft.Animation(5000, ft.AnimationCurve.LINEAR)
+        for particle in particle_layer.content.controls:
+            particle.animate_position = ft.Animation(3000, ft.AnimationCurve.EASE_IN_OUT)
+        
+        # ProgressBar.value does not animate implicitly; a fill container's width does
+        track = self.progress_bar.content.controls[0]
+        track.content = ft.Container(
+            content=ft.Container(
+                width=0,
+                height=6,
+                bgcolor=self.styles.TEXT_SECONDARY,
+                border_radius=3,
+                animate=ft.Animation(1700, ft.AnimationCurve.LINEAR),
+            ),
+            width=220,
+            height=6,
+            bgcolor=self.styles.PROGRESS_BG,
+            border_radius=3,
+            alignment=ft.alignment.center_left,
+        )
+        
+    def start_client_splash_sequence(self):
+        """Splash sequence as target states; Flutter interpolates between them"""
+        def at(delay, control, attr, value):
+            return Tween(control, attr, value, 0, delay=delay)
+        
+        particle_layer = self.logo.content.controls[1]
+        glow = self.logo.content.controls[0]
+        fill = self.progress_bar.content.controls[0].content.content
+        percentage_text = self.progress_bar.content.controls[2].content
+        dots = self.progress_bar.content.controls[1].content.controls
+        
+        states = [
+            at(0, self.logo, "opacity", 1),
+            at(0, glow, "opacity", 0.5),
+            # Two turns of the particle orbit over animate_rotation's 5 s
+            at(0, particle_layer, "rotate", 4 * math.pi),
+            at(0.3, self.brand_text, "opacity", 1),
+            at(0.6, self.progress_bar, "opacity", 1),
+            at(0.6, self.loading_text, "opacity", 1),
+            at(0.6, self.version_text, "opacity", 1),
+            # Fill runs client-side over the fill's 1.7 s animate duration
+            at(1.1, fill, "width", 220),
+        ]
+        
+        # Drift each particle to a point on its orbit (animate_position)
+        for i, particle in enumerate(particle_layer.content.controls):
+            angle = 5 + i * 1.5
+            radius = 15 + i * 5
+            if i % 2 == 0:
+                states.append(at(0, particle, "left", 70 + math.cos(angle) * radius))
+                states.append(at(0, particle, "top", 70 + math.sin(angle) * radius))
+            else:
+                states.append(at(0, particle, "right", 70 - math.cos(angle) * radius))
+                states.append(at(0, particle, "bottom", 70 - math.sin(angle) * radius))
+        
+        # Percentage label in quarter steps alongside the fill
+        for step in range(1, 5):
+            states.append(at(1.1 + step * 0.425, percentage_text, "value", f"{step * 25}%"))
+        
+        # Dot wave: one lit dot per 600 ms, faded by the dots' animate_opacity
+        for k in range(5):
+            for j, dot in enumerate(dots):
+                states.append(at(0.6 + k * 0.6, dot, "opacity", 1.0 if k % len(dots) == j else 0.3))
+        
+        animation_ticker.animate(
+            self.page,
+            *states,
+            # Short pause then navigate to auth
+            FrameEffect([], lambda seconds: None, 0.5, delay=2.8),
+            on_complete=self.on_complete_callback,
+        )
+        
     def start_splash_sequence(self):
         """Start the splash screen animation sequence - simplified"""
-        def animation_sequence():
-            try:
-                # Simple fade-in sequence
-                self.logo.opacity = 1
-                self.page.update()
-                time.sleep(0.3)
-                
-                self.brand_text.opacity = 1
-                self.page.update()
-                time.sleep(0.3)
-                
-                self.progress_bar.opacity = 1
-                self.loading_text.opacity = 1
-                self.version_text.opacity = 1
-                self.page.update()
-                time.sleep(0.5)
+        try:
+            if self.mode == "client":
+                self.start_client_splash_sequence()
+                return
+
+            animation_ticker.animate(
+                self.page,
+                # Simple fade-in sequence (animate_opacity does the fade client-side)
+                Tween(self.logo, "opacity", 1, 0),
+                Tween(self.brand_text, "opacity", 1, 0, delay=0.3),
+                Tween(self.progress_bar, "opacity", 1, 0, delay=0.6),
+                Tween(self.loading_text, "opacity", 1, 0, delay=0.6),
+                Tween(self.version_text, "opacity", 1, 0, delay=0.6),
                 
                 # Progress animation with percentage update
-                progress_bar_control = self.progress_bar.content.controls[0].content
-                percentage_text = self.progress_bar.content.controls[2].content
-                
-                for i in range(0, 101, 5):
-                    progress_bar_control.value = i / 100
-                    percentage_text.value = f"{i}%"
-                    self.page.update()
-                    time.sleep(0.08)
+                self.progress_tween(self.progress_bar, 1.7, delay=1.1),
                 
                 # Short pause then navigate to auth
-                time.sleep(0.5)
-                self.on_complete_callback()
-                
-            except Exception as e:
-                print(f"Animation error: {e}")
-                # Fallback to auth
-                time.sleep(3)
-                self.on_complete_callback()
-        
-        thread = threading.Thread(target=animation_sequence)
-        thread.daemon = True
-        thread.start()
+                FrameEffect([], lambda seconds: None, 0.5, delay=2.8),
+                on_complete=self.on_complete_callback,
+            )
+        except Exception as e:
+            logger.error(f"Animation error: {e}")
+            # Fallback to auth
+            self.on_complete_callback()
         
     def fade_out_splash(self):
         """Fade out the splash screen - restored original"""
@@ -714,4 +768,4 @@ class SplashScreen:
             self.version_text.opacity = 0
             self.page.update()
         except Exception as e:
-            print(f"Fade out error: {e}")
\ No newline at end of file
+            logger.debug(f"Fade out error: {e}")
\ No newline at end of file
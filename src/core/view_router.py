@@ -0,0 +1,132 @@
+"""
+Tab router that keeps built views mounted and switches between them
+"""
+import flet as ft
+import time
+
+from utils.logger import logger
+
+
+def count_controls(control):
+    """Count a control and all of its descendants"""
+    total = 1
+    for child in control._get_children():
+        total += count_controls(child)
+    return total
+
+
+class ViewRouter:
+    """Build each view once and swap between them inside one content area
+
+    Every built view stays mounted in `container`; switching only flips
+    `visible` on the outgoing and incoming views, so Flet sends two small
+    "set" commands instead of re-adding the whole tree. A view is built
+    (and its subtree sent) the first time it is shown, or again after
+    invalidate(). Views registered with cache=False are rebuilt every time
+    they are navigated to; on_show refreshes a cached view's live data
+    before it is sent.
+    """
+
+    def __init__(self, page: ft.Page):
+        self.page = page
+        self.container = ft.Column([], expand=True, spacing=0)
+        self.builders = {}
+        self.uncached = set()
+        self.on_show = {}
+        self.views = {}
+        self.current = None
+        self.stats = {
+            'navigations': 0,
+            'builds': 0,
+            'controls_sent': 0,
+        }
+        self.last_navigation = None
+
+    def register(self, key, builder, cache=True, on_show=None):
+        """Register a zero-argument callable that returns the view's root control
+
+        on_show is called with no arguments each time the cached view is
+        shown again; changes it makes are sent with the navigation.
+        """
+        self.builders[key] = builder
+        if not cache:
+            self.uncached.add(key)
+        if on_show is not None:
+            self.on_show[key] = on_show
+
+    def invalidate(self, key=None):
+        """Drop one cached view (or all of them) so it is rebuilt on next show"""
+        keys = [key] if key is not None else list(self.views)
+        for k in keys:
+            view = self.views.pop(k, None)
+            if view is not None:
+                self.container.controls.remove(view)
+        if self.current in keys:
+            self.current = None
+
+    def show(self, key, *extra_controls, update=True):
+        """Make `key` the visible view
+
+        extra_controls are updated in the same round trip (e.g. navigation
+        whose active state changed). With update=False the caller is
+        responsible for sending the container, e.g. when mounting it.
+        """
+        start = time.perf_counter()
+        changed = list(extra_controls)
+
+        if key in self.uncached and key != self.current:
+            self.invalidate(key)
+
+        view = self.views.get(key)
+        built = view is None
+        if built:
+            view = self.builders[key]()
+            self.views[key] = view
+            self.container.controls.append(view)
+            self.stats['builds'] += 1
+        elif key in self.on_show:
+            self.on_show[key]()
+
+        if self.current is not None and self.current != key:
+            previous = self.views.get(self.current)
+            if previous is not None:
+                previous.visible = False
+                changed.append(previous)
+
+        view.visible = True
+        if not built:
+            changed.append(view)
+        self.current = key
+
+        if built:
+            controls_sent = count_controls(view) + len(extra_controls)
+        else:
+            controls_sent = len(changed)
+
+        if update:
+            if built:
+                # New child: the container diff adds it and flips the old view in one batch
+                self.page.update(self.container, *extra_controls)
+            else:
+                self.page.update(*changed)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.stats['navigations'] += 1
+        self.stats['controls_sent'] += controls_sent
+        self.last_navigation = {
+            'view': key,
+            'built': built,
+            'controls_sent': controls_sent,
+            'ms': elapsed_ms,
+        }
+        logger.debug(
+            f"View '{key}' shown ({'built' if built else 'cached'}): "
+            f"{controls_sent} controls sent in {elapsed_ms:.1f} ms"
+        )
+        return view
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['cached_views'] = len(self.views)
+        stats['mounted_controls'] = count_controls(self.container)
+        return stats
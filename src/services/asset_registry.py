@@ -0,0 +1,132 @@
+"""
+Broker logo registry shared by every session
+"""
+import base64
+import mimetypes
+import os
+import threading
+from collections import OrderedDict
+
+from config.app_config import AppConfig
+from utils.logger import logger
+
+# Paths are relative to AppConfig.ASSETS_DIR
+BROKER_LOGOS = {
+    "Binomo": "brokers/binomo.png",
+    "Stockity": "brokers/stockity.png",
+    "IQ Option": "brokers/iqoption.png",
+    "Olymptrade": "brokers/olymptrade.png",
+    "Quotex": "brokers/quotex.png",
+}
+FALLBACK_LOGO = "logo.svg"
+
+
+class AssetRegistry:
+    """Resolve asset paths to Image.src values, once per file version
+
+    In 'url' mode the src is the file's path under the Flet assets
+    directory with its mtime as a version query, so browsers cache the
+    logo and pick up a replaced file without a restart. In 'inline' mode
+    the file is base64-encoded into a data URI (for hosts that cannot
+    serve static files). Either way entries are cached in an LRU bounded
+    by max_bytes and re-resolved when the file's mtime or size changes.
+    """
+
+    def __init__(self, assets_dir=None, mode=None, max_bytes=None):
+        self.assets_dir = assets_dir or AppConfig.ASSETS_DIR
+        self.mode = mode or AppConfig.ASSET_MODE
+        if self.mode not in ('url', 'inline'):
+            raise ValueError(f"Unsupported asset mode: {self.mode}")
+        self.max_bytes = max_bytes or AppConfig.ASSET_CACHE_MAX_BYTES
+
+        self._entries = OrderedDict()  # relative path -> (mtime_ns, size, src)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'reloads': 0,
+            'evictions': 0,
+        }
+
+    def _build_src(self, rel_path, full_path, mtime_ns):
+        if self.mode == 'url':
+            return f"/{rel_path}?v={mtime_ns // 1_000_000}"
+
+        with open(full_path, "rb") as asset_file:
+            encoded = base64.b64encode(asset_file.read()).decode('ascii')
+        mime_type = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+        return f"data:{mime_type};base64,{encoded}"
+
+    def get_src(self, rel_path):
+        """Get the Image.src for an asset, or None if the file is missing"""
+        full_path = os.path.join(self.assets_dir, rel_path)
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(rel_path)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(rel_path)
+                self.stats['hits'] += 1
+                return entry[2]
+
+        try:
+            src = self._build_src(rel_path, full_path, stat.st_mtime_ns)
+        except OSError as e:
+            logger.error(f"Error loading asset {rel_path}: {e}")
+            return None
+
+        with self._lock:
+            previous = self._entries.pop(rel_path, None)
+            if previous is not None:
+                self._bytes -= len(previous[2])
+                self.stats['reloads'] += 1
+            else:
+                self.stats['misses'] += 1
+
+            self._entries[rel_path] = (stat.st_mtime_ns, stat.st_size, src)
+            self._bytes += len(src)
+
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.stats['evictions'] += 1
+
+        return src
+
+    def broker_logo(self, broker_name):
+        """Get the logo src for a broker, falling back to the app logo"""
+        rel_path = BROKER_LOGOS.get(broker_name)
+        src = self.get_src(rel_path) if rel_path else None
+        if src is None:
+            if rel_path:
+                logger.warning(f"Logo not found for {broker_name}: {rel_path}")
+            src = self.get_src(FALLBACK_LOGO)
+        return src
+
+    def preload(self):
+        """Resolve every broker logo up front, returns the number loaded"""
+        loaded = sum(1 for rel_path in BROKER_LOGOS.values() if self.get_src(rel_path))
+        logger.info(f"Preloaded {loaded}/{len(BROKER_LOGOS)} broker logos ({self.mode} mode)")
+        return loaded
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+            stats['max_bytes'] = self.max_bytes
+            stats['mode'] = self.mode
+            return stats
+
+
+# Global asset registry instance
+asset_registry = AssetRegistry()
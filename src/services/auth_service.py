@@ -0,0 +1,125 @@
+"""
+Authentication service that keeps bcrypt work off the Flet UI thread
+"""
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config.app_config import AppConfig
+from services.password_policy import password_policy
+from services.login_limiter import login_limiter
+from utils.logger import logger
+
+
+class AuthServiceOverloaded(Exception):
+    """Raised when the hashing queue is full and the request is rejected"""
+
+
+class AuthService:
+    """Bounded executor for bcrypt hashing and verification
+
+    bcrypt releases the GIL while hashing, so a small thread pool gives real
+    parallelism without the pickling cost of a process pool. Every public
+    method returns a concurrent.futures.Future; callers attach a done
+    callback (or wrap it with asyncio.wrap_future) instead of blocking.
+    """
+
+    def __init__(self, max_workers=None, max_pending=None):
+        self.max_workers = max_workers or AppConfig.AUTH_HASH_WORKERS
+        self.max_pending = max_pending or AppConfig.AUTH_MAX_PENDING
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="atv-bcrypt",
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {
+            'submitted': 0,
+            'completed': 0,
+            'rejected': 0,
+            'failed': 0,
+        }
+
+    def _submit(self, fn, *args):
+        """Queue work, rejecting immediately when the queue is full"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._stats['rejected'] += 1
+                logger.warning(f"Authentication queue full, rejecting request ({self._pending} pending)")
+                raise AuthServiceOverloaded(
+                    f"Authentication queue full ({self._pending}/{self.max_pending})"
+                )
+            self._pending += 1
+            self._stats['submitted'] += 1
+
+        try:
+            # Run in the caller's context so log_context ids reach the worker's log records
+            future = self._executor.submit(contextvars.copy_context().run, fn, *args)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future):
+        """Release the queue slot once a job finishes"""
+        with self._lock:
+            self._pending -= 1
+            if future.exception() is not None:
+                self._stats['failed'] += 1
+            else:
+                self._stats['completed'] += 1
+
+    def hash_password(self, password):
+        """Hash a password in the background, returns Future[str]"""
+        return self._submit(password_policy.hash, password)
+
+    def verify_password(self, password, hashed_password):
+        """Verify a password in the background, returns Future[bool]"""
+        return self._submit(password_policy.verify, password, hashed_password)
+
+    def authenticate(self, db_manager, email, password, client=None):
+        """Run db_manager.verify_login in the background, returns Future[dict | None]
+
+        The future resolves to None for wrong credentials and raises on
+        database errors. Raises LoginRateLimited, before any database or bcrypt work, when
+        the email or client is over its attempt rate or locked out.
+        """
+        login_limiter.acquire(email, client)
+        try:
+            future = self._submit(db_manager.verify_login, email, password)
+        except AuthServiceOverloaded:
+            login_limiter.release(email, client)
+            raise
+        future.add_done_callback(lambda f: self._record_login(f, email, client))
+        return future
+
+    def _record_login(self, future, email, client):
+        """Count wrong credentials towards lockout; a database error is not the user's failure"""
+        if future.exception() is not None:
+            login_limiter.release(email, client)
+        else:
+            login_limiter.record(email, client, success=future.result() is not None)
+
+    def create_user(self, db_manager, user_data):
+        """Run db_manager.create_user (which hashes) in the background, returns Future[int | None]"""
+        return self._submit(db_manager.create_user, user_data)
+
+    def get_stats(self):
+        """Get queue and throughput counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending'] = self._pending
+        stats['max_pending'] = self.max_pending
+        stats['max_workers'] = self.max_workers
+        return stats
+
+    def shutdown(self, wait=True):
+        """Stop accepting work and shut the executor down"""
+        self._executor.shutdown(wait=wait)
+
+
+# Global authentication service instance
+auth_service = AuthService()
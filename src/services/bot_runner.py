@@ -0,0 +1,441 @@
+"""
+Asyncio runner that trades every active bot in trading_bots
+"""
+import asyncio
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from config.app_config import AppConfig
+from services.brokers import load_broker
+from services.database.trade_ingest import TradeHistoryIngestor
+from utils.logger import logger
+
+PRICE_WINDOW = 5  # Quotes a strategy looks back over
+
+
+class TrendStrategy:
+    """Bet that the price keeps moving away from its recent average"""
+
+    name = "trend"
+
+    def direction(self, prices):
+        if len(prices) < 2:
+            return None
+        return 'call' if prices[-1] > sum(prices) / len(prices) else 'put'
+
+    def stake(self, base, losing_streak):
+        return base
+
+
+class ReversalStrategy(TrendStrategy):
+    """Bet that the price returns to its recent average"""
+
+    name = "reversal"
+
+    def direction(self, prices):
+        trend = super().direction(prices)
+        if trend is None:
+            return None
+        return 'put' if trend == 'call' else 'call'
+
+
+class MartingaleStrategy(TrendStrategy):
+    """Trend entries, doubling the stake after each loss (BOT_MARTINGALE_MAX_STEPS times at most)"""
+
+    name = "martingale"
+
+    def stake(self, base, losing_streak):
+        return base * 2 ** min(losing_streak, AppConfig.BOT_MARTINGALE_MAX_STEPS)
+
+
+STRATEGIES = {
+    TrendStrategy.name: TrendStrategy(),
+    ReversalStrategy.name: ReversalStrategy(),
+    MartingaleStrategy.name: MartingaleStrategy(),
+}
+
+
+class _BotRun:
+    """In-memory state of one running bot"""
+
+    def __init__(self, bot, pnl=0.0):
+        self.bot = bot
+        self.asset_pair = AppConfig.BOT_ASSET_PAIRS[bot['id'] % len(AppConfig.BOT_ASSET_PAIRS)].strip()
+        self.pnl = pnl  # The bot's total profit; profit_target and stop_loss apply to it
+        self.trades = 0
+        self.losing_streak = 0
+        self.prices = deque(maxlen=PRICE_WINDOW)
+        self.in_trade = False
+        self.idle = False  # Waiting for a known strategy
+        self.stopping = False
+        self.task = None
+
+
+class BotRunner:
+    """Runs every active bot as a task on one event loop
+
+    Each bot quotes its asset pair every BOT_TICK_INTERVAL seconds. Its
+    strategy then picks call, put or no trade, and the trade is awaited
+    until it settles. Thousands of bots fit on one loop, because they
+    spend nearly all their time sleeping. Start times are staggered, and
+    BOT_MAX_CONCURRENT_ORDERS caps broker calls in flight.
+
+    profit_target and stop_loss apply to the bot's total_profit as stored,
+    plus results not written yet. Restarting the runner or switching a bot
+    off and on therefore never resets its loss budget. A stake is shrunk so
+    that losing it cannot pass the stop loss. When either limit is reached,
+    the bot is switched off in the database. It stops again at once if it
+    is switched back on without raising the limit.
+
+    Settled trades are buffered and written every BOT_FLUSH_INTERVAL
+    seconds with TradeHistoryIngestor, BOT_FLUSH_BATCH rows per
+    transaction, along with one counter update per bot. Database calls run
+    on a single helper thread, never on the loop. A failed batch stays
+    buffered and is retried.
+
+    The database is the source of truth: active bots are re-read every
+    BOT_RELOAD_INTERVAL seconds, or at once after request_reload(). This
+    lets a bot switched on or off from any app process reach the runner.
+    """
+
+    def __init__(self, broker=None, tick_interval=None, trade_duration=None, flush_interval=None,
+                 flush_batch=None, reload_interval=None):
+        self.broker = broker
+        self.tick_interval = tick_interval or AppConfig.BOT_TICK_INTERVAL
+        self.trade_duration = trade_duration or AppConfig.BOT_TRADE_DURATION
+        self.flush_interval = flush_interval or AppConfig.BOT_FLUSH_INTERVAL
+        self.flush_batch = flush_batch or AppConfig.BOT_FLUSH_BATCH
+        self.reload_interval = reload_interval or AppConfig.BOT_RELOAD_INTERVAL
+        self.max_buffered = AppConfig.BOT_MAX_BUFFERED
+
+        self.runs = {}  # bot id -> _BotRun
+        self._finished = set()  # Bots that hit a limit but could not be switched off yet
+        self._trades = []  # Settled trades waiting to be written
+        self._bot_stats = {}  # bot id -> counter deltas waiting to be written
+        self._writing_stats = []  # Counter deltas being written right now
+        self._random = random.Random()
+        self._loop = None
+        self._thread = None
+        self._executor = None
+        self.stats = {
+            'trades': 0,
+            'wins': 0,
+            'losses': 0,
+            'draws': 0,
+            'written': 0,
+            'write_errors': 0,
+            'dropped': 0,
+            'broker_errors': 0,
+            'stopped_profit_target': 0,
+            'stopped_stop_loss': 0,
+        }
+
+    # Hosting
+
+    def start(self, db_manager):
+        """Run on a background thread with its own event loop (single-process app)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self.run(db_manager)), name="bot-runner", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Ask the runner to stop (from any thread); with a timeout, wait for start()'s thread"""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._stop_requested.set)
+        if timeout is not None and self._thread:
+            self._thread.join(timeout)
+
+    def request_reload(self):
+        """Re-read active bots now instead of at the next interval (from any thread)"""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._reload_requested.set)
+
+    async def run(self, db_manager):
+        """Trade until stop() is called"""
+        self._stop_requested = asyncio.Event()
+        self._reload_requested = asyncio.Event()
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._orders = asyncio.Semaphore(AppConfig.BOT_MAX_CONCURRENT_ORDERS)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bot-db")
+        self.repository = db_manager.repository
+        self.ingestor = TradeHistoryIngestor(db_manager, chunk_size=self.flush_batch)
+        if self.broker is None:
+            self.broker = load_broker(AppConfig.BOT_BROKER)
+        self._loop = asyncio.get_running_loop()
+        logger.info(f"Bot runner started ({getattr(self.broker, 'name', type(self.broker).__name__)} broker)")
+
+        loops = [asyncio.create_task(self._reload_loop()), asyncio.create_task(self._flush_loop())]
+        try:
+            await self._stop_requested.wait()
+        finally:
+            for task in loops:
+                task.cancel()
+            await self._shutdown()
+
+    async def _shutdown(self):
+        """Write what has settled, let open trades settle (up to one trade duration), write again"""
+        await self.flush()
+        for run in self.runs.values():
+            run.stopping = True
+            if not run.in_trade and run.task:
+                run.task.cancel()
+        tasks = [run.task for run in self.runs.values() if run.task]
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=self.trade_duration + 5)
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"Bot runner stopped with {len(pending)} trades unsettled")
+        await self.flush()
+        await self.broker.close()
+        self._executor.shutdown(wait=True)
+        self._loop = None
+        logger.info(f"Bot runner stopped ({self.stats['trades']} trades, {self.stats['written']} written)")
+
+    def _db(self, func, *args):
+        return self._loop.run_in_executor(self._executor, func, *args)
+
+    # Loading bots
+
+    async def _reload_loop(self):
+        while True:
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.error(f"Could not load active bots: {e}")
+            try:
+                await asyncio.wait_for(self._reload_requested.wait(), self.reload_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._reload_requested.clear()
+
+    async def reload(self):
+        """Start bots that became active, stop bots that were switched off, pick up edited settings"""
+        active = {bot['id']: bot for bot in await self._db(self.repository.get_active_bots)}
+
+        for bot_id, run in self.runs.items():
+            if bot_id not in active and not run.stopping:
+                logger.info(f"Bot {bot_id} switched off")
+                self._stop_run(run)
+
+        for bot_id, bot in active.items():
+            if bot_id in self._finished:
+                await self._deactivate(bot_id)
+                continue
+            run = self.runs.get(bot_id)
+            if run is None:
+                self._start_run(bot)
+            else:
+                run.bot = bot  # Applies from the next tick
+                run.stopping = False
+
+    def _start_run(self, bot):
+        run = _BotRun(bot, float(bot.get('total_profit') or 0) + self._unwritten_profit(bot['id']))
+        self.runs[bot['id']] = run
+        run.task = asyncio.create_task(self._run_bot(run))
+        run.task.add_done_callback(lambda task, bot_id=bot['id']: self._forget(bot_id, task))
+
+    def _stop_run(self, run):
+        run.stopping = True
+        if not run.in_trade:
+            run.task.cancel()  # An open trade is allowed to settle first
+
+    def _unwritten_profit(self, bot_id):
+        """Profit a bot made that its total_profit row does not include yet"""
+        pending = [self._bot_stats.get(bot_id)]
+        pending.extend(stats for stats in self._writing_stats if stats['bot_id'] == bot_id)
+        return sum(stats['profit'] for stats in pending if stats)
+
+    def _forget(self, bot_id, task):
+        run = self.runs.get(bot_id)
+        if run is not None and run.task is task:
+            del self.runs[bot_id]
+
+    # Trading
+
+    async def _run_bot(self, run):
+        await asyncio.sleep(self._random.uniform(0, self.tick_interval))  # Spread bots over the tick
+        while not run.stopping:
+            strategy = STRATEGIES.get(run.bot['strategy_type'])
+            if strategy is None:
+                if not run.idle:
+                    logger.warning(f"Bot {run.bot['id']} has unknown strategy '{run.bot['strategy_type']}'; not trading")
+                run.idle = True
+                await asyncio.sleep(self.tick_interval)  # Until the strategy is fixed or the bot switched off
+                continue
+            run.idle = False
+
+            reason = self._limit_reached(run)
+            stake = self._stake(run, strategy) if reason is None else None
+            if reason is None and stake is None:
+                reason = 'stop_loss'
+            if reason:
+                await self._finish(run, reason)
+                return
+
+            try:
+                async with self._orders:
+                    run.prices.append(await self.broker.quote(run.asset_pair))
+                direction = strategy.direction(list(run.prices))
+                if direction:
+                    run.in_trade = True
+                    try:
+                        async with self._orders:
+                            order = await self.broker.place_trade(run.asset_pair, direction, stake, self.trade_duration)
+                        self._record(run, order, await self.broker.settle(order))
+                    finally:
+                        run.in_trade = False
+            except Exception as e:
+                self.stats['broker_errors'] += 1
+                logger.warning(f"Bot {run.bot['id']} broker error: {e}")
+
+            if not run.stopping:
+                await asyncio.sleep(self.tick_interval)
+
+    def _limit_reached(self, run):
+        profit_target = float(run.bot.get('profit_target') or 0)
+        stop_loss = float(run.bot.get('stop_loss') or 0)
+        if profit_target > 0 and run.pnl >= profit_target:
+            return 'profit_target'
+        if stop_loss > 0 and run.pnl <= -stop_loss:
+            return 'stop_loss'
+        return None
+
+    def _stake(self, run, strategy):
+        """Next stake, capped so losing it stays within the stop loss; None when nothing is left to risk"""
+        stake = strategy.stake(float(run.bot.get('investment_amount') or 0), run.losing_streak)
+        stop_loss = float(run.bot.get('stop_loss') or 0)
+        if stop_loss > 0:
+            stake = min(stake, stop_loss + run.pnl)
+        stake = round(stake, 2)
+        return stake if stake > 0 else None
+
+    def _record(self, run, order, outcome):
+        bot = run.bot
+        profit = outcome['payout_amount'] - order['amount']
+        run.pnl += profit
+        run.trades += 1
+        won = outcome['result'] == 'win'
+        if outcome['result'] == 'loss':
+            run.losing_streak += 1
+        elif won:
+            run.losing_streak = 0
+
+        self.stats['trades'] += 1
+        self.stats[{'win': 'wins', 'loss': 'losses'}.get(outcome['result'], 'draws')] += 1
+
+        self._trades.append({
+            'user_id': bot['user_id'],
+            'bot_id': bot['id'],
+            'broker_name': bot['broker_name'],
+            'asset_pair': order['asset_pair'],
+            'trade_type': order['direction'],
+            'investment_amount': order['amount'],
+            'payout_amount': outcome['payout_amount'],
+            'result': outcome['result'],
+            'entry_time': _timestamp(order['entry_time']),
+            'expiry_time': _timestamp(order['expiry_time']),
+            'entry_price': order['entry_price'],
+            'exit_price': outcome.get('exit_price'),
+        })
+        stats = self._bot_stats.setdefault(bot['id'], {'bot_id': bot['id'], 'trades': 0, 'wins': 0, 'profit': 0.0})
+        stats['trades'] += 1
+        stats['wins'] += int(won)
+        stats['profit'] += profit
+
+        if len(self._trades) >= self.flush_batch:
+            self._flush_requested.set()
+
+    async def _finish(self, run, reason):
+        """Switch a bot off after it reached profit_target or stop_loss"""
+        bot_id = run.bot['id']
+        self.stats[f'stopped_{reason}'] += 1
+        logger.info(f"Bot {bot_id} stopped by {reason} after {run.trades} trades (total profit {run.pnl:.2f})")
+        self._finished.add(bot_id)
+        self._flush_requested.set()
+        await self._deactivate(bot_id)
+
+    async def _deactivate(self, bot_id):
+        try:
+            await self._db(self.repository.set_bot_active, bot_id, False)
+        except Exception as e:
+            logger.error(f"Could not switch off bot {bot_id}, will retry: {e}")
+            return
+        self._finished.discard(bot_id)
+
+    # Writing results
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            # Cancelling the loop at shutdown must not interrupt a write halfway: the rows would
+            # reach the database without leaving the buffer, and be written again
+            await asyncio.shield(self.flush())
+
+    async def flush(self):
+        """Write buffered trades and bot counters; whatever fails stays buffered"""
+        async with self._flush_lock:
+            written = await self._write(self.ingestor.ingest, self._trades)
+            del self._trades[:written]
+            self.stats['written'] += written
+
+            if self._bot_stats:
+                pending, self._bot_stats = list(self._bot_stats.values()), {}
+                self._writing_stats = pending
+                try:
+                    done = await self._write(self.ingestor.apply_bot_stats, pending)
+                finally:
+                    self._writing_stats = []
+                for stats in pending[done:]:
+                    merged = self._bot_stats.setdefault(stats['bot_id'], {**stats, 'trades': 0, 'wins': 0, 'profit': 0.0})
+                    for key in ('trades', 'wins', 'profit'):
+                        merged[key] += stats[key]
+
+            overflow = len(self._trades) - self.max_buffered
+            if overflow > 0:
+                del self._trades[:overflow]
+                self.stats['dropped'] += overflow
+                logger.error(f"Trade buffer full; dropped {overflow} unwritten trades")
+
+    async def _write(self, write, rows):
+        """Write rows one batch (= one transaction) at a time, returns how many were written"""
+        written = 0
+        while written < len(rows):
+            batch = rows[written:written + self.flush_batch]
+            try:
+                await self._db(write, batch)
+            except Exception as e:
+                self.stats['write_errors'] += 1
+                logger.error(f"Could not write bot results, will retry: {e}")
+                break
+            written += len(batch)
+        return written
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['running'] = len(self.runs)
+        stats['open_trades'] = sum(1 for run in list(self.runs.values()) if run.in_trade)
+        stats['buffered'] = len(self._trades)
+        return stats
+
+
+def _timestamp(epoch):
+    """Same format as CURRENT_TIMESTAMP (UTC)"""
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+# Global bot runner instance
+bot_runner = BotRunner()
@@ -0,0 +1,96 @@
+"""
+Pluggable broker adapters used by the bot runner
+"""
+import asyncio
+import importlib
+import itertools
+import math
+import random
+import time
+
+from config.app_config import AppConfig
+
+
+class SimulatedBroker:
+    """Local stand-in broker for binary call/put trades
+
+    Each asset pair follows its own random walk, advanced lazily by the
+    wall-clock time since the last quote (volatility is per sqrt(second)).
+    A trade wins when the price at expiry moved in the chosen direction.
+    The payout is amount * (1 + payout_rate), a tie refunds the stake and
+    a loss pays nothing. Pass seed for reproducible runs.
+    """
+
+    name = "simulated"
+
+    def __init__(self, payout_rate=None, volatility=None, seed=None, latency=0.0):
+        self.payout_rate = AppConfig.SIM_PAYOUT_RATE if payout_rate is None else payout_rate
+        self.volatility = AppConfig.SIM_VOLATILITY if volatility is None else volatility
+        self.latency = latency  # Seconds added to every call, to mimic a remote API
+        self._random = random.Random(seed)
+        self._prices = {}  # asset_pair -> (price, updated_at)
+        self._order_ids = itertools.count(1)
+
+    def _price(self, asset_pair):
+        now = time.monotonic()
+        price, updated_at = self._prices.get(asset_pair, (1.0 + self._random.random(), now))
+        elapsed = now - updated_at
+        if elapsed > 0:
+            price *= math.exp(self._random.gauss(0.0, self.volatility * math.sqrt(elapsed)))
+        self._prices[asset_pair] = (price, now)
+        return price
+
+    async def quote(self, asset_pair):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._price(asset_pair)
+
+    async def place_trade(self, asset_pair, direction, amount, duration):
+        """Open a trade, returns the order the runner hands back to settle()"""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return {
+            'id': next(self._order_ids),
+            'asset_pair': asset_pair,
+            'direction': direction,
+            'amount': amount,
+            'entry_price': self._price(asset_pair),
+            'entry_time': time.time(),
+            'expiry_time': time.time() + duration,
+        }
+
+    async def settle(self, order):
+        """Wait for expiry, returns {'result', 'payout_amount', 'exit_price'}"""
+        await asyncio.sleep(max(0.0, order['expiry_time'] - time.time()) + self.latency)
+        exit_price = self._price(order['asset_pair'])
+        moved = exit_price - order['entry_price']
+        if moved == 0:
+            return {'result': 'draw', 'payout_amount': order['amount'], 'exit_price': exit_price}
+        won = moved > 0 if order['direction'] == 'call' else moved < 0
+        return {
+            'result': 'win' if won else 'loss',
+            'payout_amount': round(order['amount'] * (1 + self.payout_rate), 2) if won else 0.0,
+            'exit_price': exit_price,
+        }
+
+    async def close(self):
+        pass
+
+
+BROKERS = {
+    SimulatedBroker.name: SimulatedBroker,
+}
+
+
+def load_broker(spec, **options):
+    """Build a broker from a registered name or a "package.module:ClassName" path
+
+    Any object with async quote(asset_pair), place_trade(asset_pair,
+    direction, amount, duration), settle(order) and close() can be plugged in.
+    """
+    if spec in BROKERS:
+        return BROKERS[spec](**options)
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown broker '{spec}'; use one of {sorted(BROKERS)} or module:Class")
+    return getattr(importlib.import_module(module_name), class_name)(**options)
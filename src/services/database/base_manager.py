@@ -0,0 +1,190 @@
+"""
+Behaviour shared by the SQLite and PostgreSQL database managers
+"""
+
+from config.app_config import AppConfig
+from utils.logger import logger
+from services.password_policy import password_policy
+from services.database.user_cache import MISSING
+from services.database.migrations import MigrationRunner
+from services.database.repository import Repository, LANGUAGE_SETTING
+
+
+class BaseDatabaseManager:
+    """User/auth operations on top of a Repository
+
+    Subclasses provide get_connection, release_connection, init_db,
+    self.user_cache and a repository driver; everything else (hashing,
+    caching, return shapes, error handling) is identical across backends.
+    """
+
+    backend = None
+
+    def _create_driver(self):
+        raise NotImplementedError
+
+    def _init_repository(self):
+        self.repository = Repository(self._create_driver())
+
+    def get_cache_stats(self):
+        """Get user cache hit/miss statistics"""
+        return self.user_cache.get_stats()
+
+    def warm_pool(self, count=None):
+        """Open pooled connections ahead of the first request, returns how many"""
+        count = count or AppConfig.STARTUP_WARM_CONNECTIONS
+        connections = []
+        try:
+            for _ in range(count):
+                connections.append(self.get_connection())
+        finally:
+            for conn in connections:
+                self.release_connection(conn)
+        return len(connections)
+
+    def run_migrations(self):
+        """Apply pending schema migrations (trading tables, indexes, ...)"""
+        try:
+            return MigrationRunner(self, self.backend).migrate()
+        except Exception as e:
+            logger.error(f"Error running migrations: {e}")
+            return []
+
+    def hash_password(self, password):
+        """Hash password using the shared bcrypt policy"""
+        return password_policy.hash(password)
+
+    def verify_password(self, password, hashed_password):
+        """Verify password against hash"""
+        return password_policy.verify(password, hashed_password)
+
+    def _maybe_rehash(self, user_id, password, hashed_password):
+        """Upgrade a stored hash to the current cost without delaying the login"""
+        if password_policy.needs_rehash(hashed_password):
+            password_policy.schedule_rehash(
+                user_id,
+                password,
+                lambda new_hash: self.update_password_hash(user_id, new_hash),
+            )
+
+    def _get_user_row(self, email):
+        """Get the login row for an email, served from the user cache when warm"""
+        user = self.user_cache.get_row(email)
+        if user is MISSING:
+            user = self.repository.get_login_row(email)
+            self.user_cache.set_row(email, user)
+        return user
+
+    def verify_login(self, email, password):
+        """Check login credentials; returns None for wrong ones and lets database errors raise"""
+        user = self._get_user_row(email)
+
+        if user and self.verify_password(password, user['password_hash']):
+            logger.info(f"User authenticated successfully: {email}")
+            self._maybe_rehash(user['id'], password, user['password_hash'])
+            user.pop('password_hash')
+            return user
+        else:
+            logger.warning(f"Authentication failed for user: {email}")
+            return None
+
+    def authenticate_user(self, email, password):
+        """Authenticate user login"""
+        try:
+            return self.verify_login(email, password)
+        except Exception as e:
+            logger.error(f"Error during authentication: {e}")
+            return None
+
+    def create_user(self, user_data):
+        """Create a new user with default trading accounts"""
+        try:
+            hashed_password = self.hash_password(user_data['password'])
+            user_id = self.repository.create_user(user_data, hashed_password)
+            logger.info(f"User created successfully: {user_data['email']}")
+            return user_id
+
+        except self.repository.driver.integrity_error:
+            logger.warning(f"User already exists: {user_data['email']}")
+            return None
+        except Exception as e:
+            logger.error(f"Error creating user: {e}")
+            return None
+        finally:
+            self.user_cache.invalidate_email(user_data['email'])
+
+    def get_user_by_id(self, user_id):
+        """Get user by ID"""
+        cached = self.user_cache.get_user(user_id)
+        if cached is not MISSING:
+            return cached
+
+        try:
+            user = self.repository.get_user_by_id(user_id)
+            self.user_cache.set_user(user_id, user)
+            return user
+
+        except Exception as e:
+            logger.error(f"Error getting user by ID: {e}")
+            return None
+
+    def get_user_trading_accounts(self, user_id):
+        """Get all trading accounts for a user"""
+        try:
+            return self.repository.get_user_trading_accounts(user_id)
+        except Exception as e:
+            logger.error(f"Error getting trading accounts: {e}")
+            return []
+
+    def update_user_vip_status(self, user_id, vip_status):
+        """Update user VIP status"""
+        try:
+            self.repository.update_user_vip_status(user_id, vip_status)
+            logger.info(f"VIP status updated for user {user_id}: {vip_status}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating VIP status: {e}")
+            return False
+        finally:
+            self.user_cache.invalidate_user(user_id)
+
+    def update_password_hash(self, user_id, password_hash):
+        """Replace a user's stored password hash"""
+        try:
+            self.repository.update_password_hash(user_id, password_hash)
+            logger.info(f"Password hash upgraded for user {user_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating password hash: {e}")
+            return False
+        finally:
+            self.user_cache.invalidate_user(user_id)
+
+    def set_user_language(self, user_id, language_code):
+        """Persist a user's UI language so their next login restores it"""
+        try:
+            self.repository.set_user_setting(user_id, LANGUAGE_SETTING, language_code)
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving language: {e}")
+            return False
+        finally:
+            self.user_cache.invalidate_user(user_id)
+
+    def user_exists(self, email):
+        """Check if user exists by email"""
+        cached = self.user_cache.get_exists(email)
+        if cached is not MISSING:
+            return cached
+
+        try:
+            exists = self.repository.user_exists(email)
+            self.user_cache.set_exists(email, exists)
+            return exists
+
+        except Exception as e:
+            logger.error(f"Error checking if user exists: {e}")
+            return False
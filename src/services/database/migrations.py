@@ -0,0 +1,231 @@
+"""
+Versioned schema migrations for the SQLite and PostgreSQL backends
+"""
+
+from utils.logger import logger
+from services.database.enhanced_tables import SQLITE_TABLES, POSTGRES_TABLES
+
+# Arbitrary key for pg_advisory_xact_lock so concurrent workers migrate one at a time
+POSTGRES_MIGRATION_LOCK_ID = 582017
+
+
+class Migration:
+    """One ordered schema change, with DDL for each backend"""
+
+    def __init__(self, version, description, sqlite=(), postgres=()):
+        self.version = version
+        self.description = description
+        self.statements = {
+            'sqlite': list(sqlite),
+            'postgres': list(postgres),
+        }
+
+
+HOT_PATH_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_trading_accounts_user_id ON trading_accounts (user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_trading_history_user_created ON trading_history (user_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_notifications_user_read ON notifications (user_id, is_read)",
+    "CREATE INDEX IF NOT EXISTS idx_audit_logs_created_at ON audit_logs (created_at)",
+]
+
+# Append new steps at the end; never renumber or edit an applied migration
+MIGRATIONS = [
+    Migration(
+        1,
+        "Create trading tables",
+        sqlite=SQLITE_TABLES,
+        postgres=POSTGRES_TABLES,
+    ),
+    Migration(
+        2,
+        "Add hot-path secondary indexes",
+        sqlite=HOT_PATH_INDEXES,
+        postgres=HOT_PATH_INDEXES,
+    ),
+    Migration(
+        3,
+        "Keyset index for trading history pagination",
+        # SQLite secondary indexes already end in the rowid (id), so the
+        # version-2 index serves ORDER BY created_at, id as-is
+        sqlite=[],
+        postgres=[
+            "CREATE INDEX IF NOT EXISTS idx_trading_history_user_created_id "
+            "ON trading_history (user_id, created_at DESC, id DESC)",
+        ],
+    ),
+    Migration(
+        4,
+        "Server-side sessions for resumable logins",
+        sqlite=[
+            '''CREATE TABLE IF NOT EXISTS sessions (
+                id_hash TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+                expires_at REAL NOT NULL,
+                ttl REAL NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )''',
+            "CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)",
+        ],
+        postgres=[
+            '''CREATE TABLE IF NOT EXISTS sessions (
+                id_hash TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+                expires_at DOUBLE PRECISION NOT NULL,
+                ttl DOUBLE PRECISION NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )''',
+            "CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)",
+        ],
+    ),
+]
+
+# Queries the app runs per user, and the index each one must use
+HOT_QUERIES = {
+    'trading_accounts_by_user': (
+        "SELECT * FROM trading_accounts WHERE user_id = ?",
+        (1,),
+        'idx_trading_accounts_user_id',
+    ),
+    'trading_history_recent': (
+        "SELECT * FROM trading_history WHERE user_id = ? ORDER BY created_at DESC LIMIT 20",
+        (1,),
+        'idx_trading_history_user_created',
+    ),
+    'trading_history_keyset_page': (
+        "SELECT * FROM trading_history WHERE user_id = ? AND (created_at < ? OR (created_at = ? AND id < ?)) "
+        "ORDER BY created_at DESC, id DESC LIMIT 20",
+        (1, '2025-01-01', '2025-01-01', 100),
+        'idx_trading_history_user_created',
+    ),
+    'trading_history_keyset_newer': (
+        "SELECT * FROM trading_history WHERE user_id = ? AND (created_at > ? OR (created_at = ? AND id > ?)) "
+        "ORDER BY created_at ASC, id ASC LIMIT 20",
+        (1, '2025-01-01', '2025-01-01', 100),
+        'idx_trading_history_user_created',
+    ),
+    'unread_notifications': (
+        "SELECT * FROM notifications WHERE user_id = ? AND is_read = ?",
+        (1, False),
+        'idx_notifications_user_read',
+    ),
+    'audit_logs_recent': (
+        "SELECT * FROM audit_logs WHERE created_at >= ? ORDER BY created_at DESC",
+        ('2025-01-01',),
+        'idx_audit_logs_created_at',
+    ),
+}
+
+
+class MigrationRunner:
+    """Apply pending migrations through a database manager's connections"""
+
+    def __init__(self, db_manager, backend, migrations=None):
+        if backend not in ('sqlite', 'postgres'):
+            raise ValueError(f"Unsupported backend: {backend}")
+        self.db_manager = db_manager
+        self.backend = backend
+        self.migrations = sorted(migrations or MIGRATIONS, key=lambda m: m.version)
+        self.placeholder = '?' if backend == 'sqlite' else '%s'
+
+    def _ensure_version_table(self, cursor):
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+    def _read_version(self, cursor):
+        cursor.execute("SELECT MAX(version) FROM schema_version")
+        row = cursor.fetchone()
+        return (row[0] if row else None) or 0
+
+    def get_current_version(self):
+        """Get the highest applied migration version (0 for a fresh database)"""
+        conn = self.db_manager.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            self._ensure_version_table(cursor)
+            conn.commit()
+            return self._read_version(cursor)
+        finally:
+            cursor.close()
+            self.db_manager.release_connection(conn)
+
+    def migrate(self, target_version=None):
+        """Apply every pending migration up to target_version, returns applied versions"""
+        applied = []
+        for migration in self.migrations:
+            if target_version is not None and migration.version > target_version:
+                break
+            if self._apply(migration):
+                applied.append(migration.version)
+        return applied
+
+    def _apply(self, migration):
+        """Apply one migration in its own transaction unless already recorded"""
+        conn = self.db_manager.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            # Take the write lock before reading the version so two workers
+            # starting together cannot both apply the same step
+            if self.backend == 'sqlite':
+                cursor.execute("BEGIN IMMEDIATE")
+            else:
+                cursor.execute("SELECT pg_advisory_xact_lock(%s)", (POSTGRES_MIGRATION_LOCK_ID,))
+
+            self._ensure_version_table(cursor)
+            if self._read_version(cursor) >= migration.version:
+                conn.rollback()
+                return False
+
+            for statement in migration.statements[self.backend]:
+                cursor.execute(statement)
+
+            cursor.execute(
+                f"INSERT INTO schema_version (version, description) VALUES ({self.placeholder}, {self.placeholder})",
+                (migration.version, migration.description)
+            )
+            conn.commit()
+            logger.info(f"Applied migration {migration.version}: {migration.description}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error applying migration {migration.version}: {e}")
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            self.db_manager.release_connection(conn)
+
+    def check_query_plans(self):
+        """Explain every HOT_QUERIES query and check it uses its index
+
+        Returns {name: (uses_expected_index, plan_text)}. On PostgreSQL,
+        sequential scans are disabled for the check: on a small table the
+        planner rightly prefers them, and the question is whether an index
+        can serve the query at all.
+        """
+        conn = self.db_manager.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            if self.backend == 'sqlite':
+                explain = "EXPLAIN QUERY PLAN"
+            else:
+                explain = "EXPLAIN"
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+            results = {}
+            for name, (sql, params, index_name) in HOT_QUERIES.items():
+                cursor.execute(f"{explain} {sql.replace('?', self.placeholder)}", params)
+                plan = " | ".join(str(row[-1]).strip() for row in cursor.fetchall())
+                results[name] = (index_name in plan, plan)
+            return results
+        finally:
+            conn.rollback()  # Drops SET LOCAL
+            cursor.close()
+            self.db_manager.release_connection(conn)
@@ -1,27 +1,197 @@
 import psycopg2
-import bcrypt
+import atexit
 import os
-import sys
-from datetime import datetime
-from psycopg2.extras import RealDictCursor
+import threading
+from psycopg2 import pool as pg_pool
 
-# Add utils to path for logger
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
-try:
-    from utils.logger import logger
-except ImportError:
-    # Fallback if logger not available
-    import logging
-    logger = logging.getLogger(__name__)
+from config.app_config import AppConfig
+from services.database.user_cache import get_user_cache
+from services.database.base_manager import BaseDatabaseManager
+from services.database.repository import PostgresDriver
+from utils.logger import logger
 
-class PostgresManager:
-    def __init__(self, db_url=None):
+
+class PostgresPoolTimeout(Exception):
+    """Raised when no pooled connection becomes free within the checkout timeout"""
+
+
+class PostgresConnectionPool:
+    """Bounded ThreadedConnectionPool with checkout timeouts and liveness checks"""
+    
+    def __init__(self, db_url, min_size=None, max_size=None, timeout=None, pool_factory=None):
+        self.db_url = db_url
+        self.min_size = min_size if min_size is not None else AppConfig.PG_POOL_MIN_SIZE
+        self.max_size = max_size or AppConfig.PG_POOL_MAX_SIZE
+        self.timeout = timeout if timeout is not None else AppConfig.PG_POOL_TIMEOUT
+        # pool_factory lets tests swap in a fake pool with the same getconn/putconn API
+        self._pool_factory = pool_factory or pg_pool.ThreadedConnectionPool
+        
+        # ThreadedConnectionPool raises immediately when exhausted, so bound
+        # checkouts with a semaphore to give callers a real wait-with-timeout
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._pool = None
+        self._owners = {}  # id(conn) -> the pool it was borrowed from, which close_all may replace
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'reconnects': 0,
+            'discarded': 0,
+        }
+        
+    def _get_pool(self):
+        """Create the underlying pool lazily so a down server does not break startup"""
+        with self._lock:
+            if self._pool is None or self._pool.closed:
+                self._pool = self._pool_factory(self.min_size, self.max_size, self.db_url)
+            return self._pool
+            
+    def _is_alive(self, conn):
+        """Cheap liveness check run on every borrow"""
+        if conn.closed:
+            return False
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+            
+    def acquire(self):
+        """Borrow a live connection, replacing dead ones left behind by a server restart"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats['waits'] += 1
+            if not self._slots.acquire(timeout=self.timeout):
+                with self._lock:
+                    self._stats['timeouts'] += 1
+                raise PostgresPoolTimeout(
+                    f"No PostgreSQL connection available within {self.timeout}s"
+                )
+        
+        try:
+            # After a server restart every idle connection may be dead, so keep
+            # discarding until the pool hands out a fresh one
+            for _ in range(self.max_size + 1):
+                source = self._get_pool()
+                conn = source.getconn()
+                if self._is_alive(conn):
+                    break
+                logger.warning("Discarding dead PostgreSQL connection, reconnecting")
+                source.putconn(conn, close=True)
+                with self._lock:
+                    self._stats['discarded'] += 1
+                    self._stats['reconnects'] += 1
+            else:
+                raise psycopg2.OperationalError("Could not obtain a live PostgreSQL connection")
+        except Exception:
+            self._slots.release()
+            raise
+        
+        with self._lock:
+            self._stats['checkouts'] += 1
+            self._owners[id(conn)] = source
+        return conn
+        
+    def release(self, conn):
+        """Return a connection to the pool it came from, closing it if it is broken or that pool is gone"""
+        try:
+            with self._lock:
+                source = self._owners.pop(id(conn), None)
+            if source is None or source.closed:
+                # The pool was closed (and maybe rebuilt) while this connection was out
+                with self._lock:
+                    self._stats['discarded'] += 1
+                conn.close()
+                return
+            
+            broken = bool(conn.closed)
+            if not broken:
+                try:
+                    conn.rollback()
+                except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                    broken = True
+            if broken:
+                with self._lock:
+                    self._stats['discarded'] += 1
+            source.putconn(conn, close=broken)
+        finally:
+            self._slots.release()
+            
+    def close_all(self):
+        """Close every pooled connection"""
+        with self._lock:
+            if self._pool is not None and not self._pool.closed:
+                self._pool.closeall()
+            self._pool = None
+            
+    def get_stats(self):
+        """Get pool counters"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['min_size'] = self.min_size
+        stats['max_size'] = self.max_size
+        return stats
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_pool(db_url):
+    """Get the process-wide pool for a database URL, creating it on first use"""
+    with _pools_lock:
+        pool = _pools.get(db_url)
+        if pool is None:
+            pool = PostgresConnectionPool(db_url)
+            _pools[db_url] = pool
+        return pool
+
+
+@atexit.register
+def close_pools():
+    """Close every process-wide pool (run at interpreter exit)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
+
+
+class PostgresManager(BaseDatabaseManager):
+    backend = 'postgres'
+    
+    def __init__(self, db_url=None, use_pool=None, pool=None):
         self.db_url = db_url or os.environ.get('DATABASE_URL')
+        self.use_pool = AppConfig.PG_POOL_ENABLED if use_pool is None else use_pool
+        self.pool = pool
+        if self.use_pool and self.pool is None:
+            # Shared across every manager (and Flet session) using the same database
+            self.pool = get_pool(self.db_url)
+        self.user_cache = get_user_cache(self.db_url)
+        self._init_repository()
+        
+    def _create_driver(self):
+        return PostgresDriver(self)
         
     def get_connection(self):
-        """Get database connection"""
+        """Get database connection (borrowed from the pool when pooling is enabled)"""
+        if self.use_pool:
+            return self.pool.acquire()
         return psycopg2.connect(self.db_url)
         
+    def release_connection(self, conn):
+        """Return a connection obtained from get_connection"""
+        if self.use_pool:
+            self.pool.release(conn)
+        else:
+            conn.close()
+            
+    def get_pool_stats(self):
+        """Get connection pool statistics"""
+        return self.pool.get_stats() if self.use_pool else {}
+        
     def init_db(self):
         """Initialize database and create tables"""
         conn = self.get_connection()
@@ -65,177 +235,6 @@ class PostgresManager:
             conn.rollback()
         finally:
             cursor.close()
-            conn.close()
-    
-    def hash_password(self, password):
-        """Hash password using bcrypt"""
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
-    
-    def verify_password(self, password, hashed_password):
-        """Verify password against hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
-    
-    def authenticate_user(self, email, password):
-        """Authenticate user login"""
-        conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+            self.release_connection(conn)
         
-        try:
-            cursor.execute("""
-                SELECT id, email, password_hash, first_name, last_name, full_name, phone, is_admin, vip_status
-                FROM users 
-                WHERE email = %s
-            """, (email,))
-            
-            user = cursor.fetchone()
-            
-            if user and self.verify_password(password, user['password_hash']):
-                return {
-                    'id': user['id'],
-                    'email': user['email'],
-                    'first_name': user['first_name'],
-                    'last_name': user['last_name'],
-                    'full_name': user['full_name'],
-                    'phone': user['phone'],
-                    'is_admin': user['is_admin'],
-                    'vip_status': user['vip_status']
-                }
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error authenticating user: {e}")
-            return None
-        finally:
-            cursor.close()
-            conn.close()
-    
-    def create_user(self, user_data):
-        """Create a new user"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            hashed_password = self.hash_password(user_data['password'])
-            
-            cursor.execute("""
-                INSERT INTO users (email, password_hash, first_name, last_name, full_name, phone, is_admin, vip_status)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """, (
-                user_data['email'],
-                hashed_password,
-                user_data.get('first_name', ''),
-                user_data.get('last_name', ''),
-                user_data.get('full_name', ''),
-                user_data.get('phone', ''),
-                user_data.get('is_admin', False),
-                user_data.get('vip_status', False)
-            ))
-            
-            user_id = cursor.fetchone()[0]
-            conn.commit()
-            
-            # Create default trading accounts for new user
-            brokers = ['Binomo', 'Quotex', 'Olymptrade', 'IQ Option', 'Stockity']
-            for broker in brokers:
-                cursor.execute("""
-                    INSERT INTO trading_accounts (user_id, broker_name, account_balance, is_active)
-                    VALUES (%s, %s, %s, %s)
-                """, (user_id, broker, 1000.0, True))
-            
-            conn.commit()
-            return user_id
-            
-        except Exception as e:
-            print(f"Error creating user: {e}")
-            conn.rollback()
-            return None
-        finally:
-            cursor.close()
-            conn.close()
-    
-    def get_user_by_id(self, user_id):
-        """Get user by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        try:
-            cursor.execute("""
-                SELECT id, email, first_name, last_name, is_admin, vip_status
-                FROM users 
-                WHERE id = %s
-            """, (user_id,))
-            
-            user = cursor.fetchone()
-            return dict(user) if user else None
-            
-        except Exception as e:
-            print(f"Error getting user: {e}")
-            return None
-        finally:
-            cursor.close()
-            conn.close()
-    
-    def get_user_trading_accounts(self, user_id):
-        """Get all trading accounts for a user"""
-        conn = self.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        try:
-            cursor.execute("""
-                SELECT id, broker_name, account_balance, is_active
-                FROM trading_accounts 
-                WHERE user_id = %s
-                ORDER BY broker_name
-            """, (user_id,))
-            
-            accounts = cursor.fetchall()
-            return [dict(account) for account in accounts]
-            
-        except Exception as e:
-            print(f"Error getting trading accounts: {e}")
-            return []
-        finally:
-            cursor.close()
-            conn.close()
-    
-    def update_user_vip_status(self, user_id, vip_status):
-        """Update user VIP status"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                UPDATE users 
-                SET vip_status = %s, updated_at = %s
-                WHERE id = %s
-            """, (vip_status, datetime.now(), user_id))
-            
-            conn.commit()
-            return True
-            
-        except Exception as e:
-            print(f"Error updating VIP status: {e}")
-            conn.rollback()
-            return False
-        finally:
-            cursor.close()
-            conn.close()
-    
-    def user_exists(self, email):
-        """Check if user exists by email"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("SELECT id FROM users WHERE email = %s", (email,))
-            return cursor.fetchone() is not None
-            
-        except Exception as e:
-            print(f"Error checking user existence: {e}")
-            return False
-        finally:
-            cursor.close()
-            conn.close()
\ No newline at end of file
+        self.run_migrations()
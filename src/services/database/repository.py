@@ -0,0 +1,437 @@
+"""
+Backend-agnostic repository over the SQLite and PostgreSQL managers
+"""
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+
+# Columns every user-shaped result carries, on every backend
+USER_COLUMNS = "id, email, first_name, last_name, full_name, phone, is_admin, vip_status"
+LOGIN_COLUMNS = USER_COLUMNS + ", password_hash"
+
+# user_settings key for the UI language, loaded together with the login row
+LANGUAGE_SETTING = 'language'
+
+TRADING_ACCOUNT_COLUMNS = "id, user_id, broker_name, account_balance, is_active, created_at"
+BOT_COLUMNS = (
+    "id, user_id, bot_name, broker_name, strategy_type, is_active, profit_target, stop_loss, "
+    "investment_amount, total_trades, winning_trades, total_profit, created_at, updated_at"
+)
+TRADE_COLUMNS = (
+    "id, user_id, bot_id, broker_name, asset_pair, trade_type, investment_amount, payout_amount, "
+    "result, entry_time, expiry_time, entry_price, exit_price, created_at"
+)
+NOTIFICATION_COLUMNS = "id, user_id, title, message, type, is_read, created_at"
+
+# SQLite stores booleans as 0/1; these are converted so both backends agree
+BOOLEAN_COLUMNS = {'is_admin', 'vip_status', 'is_active', 'is_read'}
+
+DEFAULT_BROKERS = ['Binomo', 'Quotex', 'Olymptrade', 'IQ Option', 'Stockity']
+DEFAULT_ACCOUNT_BALANCE = 1000.0
+
+
+def qualify(columns, alias):
+    """Prefix each name in a column list with a table alias"""
+    return ", ".join(f"{alias}.{column.strip()}" for column in columns.split(","))
+
+
+def normalize_row(row):
+    """Convert a driver row into a plain dict with backend-independent types"""
+    if row is None:
+        return None
+    result = dict(row)
+    for key, value in result.items():
+        if key in BOOLEAN_COLUMNS and value is not None:
+            result[key] = bool(value)
+        elif isinstance(value, Decimal):
+            result[key] = float(value)
+        elif isinstance(value, datetime):
+            # Match SQLite's text timestamps; microseconds are kept so values round-trip
+            result[key] = value.isoformat(sep=' ')
+    return result
+
+
+class SQLiteDriver:
+    """Repository driver for SQLiteManager connections"""
+
+    backend = 'sqlite'
+    integrity_error = sqlite3.IntegrityError
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+
+    @contextmanager
+    def connection(self):
+        conn = self.db_manager.get_connection()
+        try:
+            yield conn
+        finally:
+            self.db_manager.release_connection(conn)
+
+    def cursor(self, conn):
+        return conn.cursor()
+
+    def prepare(self, sql):
+        # sqlite3 keeps its own per-connection compiled statement cache
+        return sql
+
+    def insert(self, cursor, sql, params):
+        """Execute an INSERT and return the new row id"""
+        cursor.execute(self.prepare(sql), params)
+        return cursor.lastrowid
+
+    def executemany(self, cursor, sql, rows):
+        cursor.executemany(self.prepare(sql), rows)
+
+
+class PostgresDriver:
+    """Repository driver for PostgresManager connections"""
+
+    backend = 'postgres'
+
+    def __init__(self, db_manager):
+        import psycopg2
+        from psycopg2.extras import RealDictCursor, execute_batch
+
+        self.db_manager = db_manager
+        self.integrity_error = psycopg2.IntegrityError
+        self._cursor_factory = RealDictCursor
+        self._execute_batch = execute_batch
+        # Translated statements, keyed by the repository's qmark SQL
+        self._statements = {}
+        self._statements_lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        conn = self.db_manager.get_connection()
+        try:
+            yield conn
+        finally:
+            self.db_manager.release_connection(conn)
+
+    def cursor(self, conn):
+        return conn.cursor(cursor_factory=self._cursor_factory)
+
+    def prepare(self, sql):
+        """Translate qmark placeholders to psycopg2 format once per statement"""
+        statement = self._statements.get(sql)
+        if statement is None:
+            statement = sql.replace('%', '%%').replace('?', '%s')
+            with self._statements_lock:
+                self._statements[sql] = statement
+        return statement
+
+    def insert(self, cursor, sql, params):
+        """Execute an INSERT and return the new row id"""
+        cursor.execute(self.prepare(sql + " RETURNING id"), params)
+        return cursor.fetchone()['id']
+
+    def executemany(self, cursor, sql, rows):
+        # psycopg2's executemany is one round trip per row; execute_batch pages them
+        self._execute_batch(cursor, self.prepare(sql), rows, page_size=500)
+
+
+class Repository:
+    """One data-access API for users, trading accounts, bots, history and notifications
+
+    SQL is written once with qmark placeholders; the driver adapts it to
+    its backend. Every method returns plain dicts from normalize_row, and
+    lets driver exceptions propagate to the caller.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    @property
+    def backend(self):
+        return self.driver.backend
+
+    def _fetch_one(self, sql, params=()):
+        with self.driver.connection() as conn:
+            cursor = self.driver.cursor(conn)
+            try:
+                cursor.execute(self.driver.prepare(sql), params)
+                return normalize_row(cursor.fetchone())
+            finally:
+                cursor.close()
+
+    def _fetch_all(self, sql, params=()):
+        with self.driver.connection() as conn:
+            cursor = self.driver.cursor(conn)
+            try:
+                cursor.execute(self.driver.prepare(sql), params)
+                return [normalize_row(row) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+
+    def _execute(self, sql, params=()):
+        """Run a write statement in its own transaction, returns affected rows"""
+        with self.driver.connection() as conn:
+            cursor = self.driver.cursor(conn)
+            try:
+                cursor.execute(self.driver.prepare(sql), params)
+                conn.commit()
+                return cursor.rowcount
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def _insert(self, sql, params):
+        """Run a single INSERT in its own transaction, returns the new id"""
+        with self.driver.connection() as conn:
+            cursor = self.driver.cursor(conn)
+            try:
+                row_id = self.driver.insert(cursor, sql, params)
+                conn.commit()
+                return row_id
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    # Users
+
+    def get_login_row(self, email):
+        """Get user fields, password_hash and the saved language for an email in one query"""
+        return self._fetch_one(f'''
+            SELECT {qualify(LOGIN_COLUMNS, 'u')}, s.setting_value AS language
+            FROM users u
+            LEFT JOIN user_settings s ON s.user_id = u.id AND s.setting_key = ?
+            WHERE u.email = ?
+        ''', (LANGUAGE_SETTING, email))
+
+    def get_user_by_id(self, user_id):
+        return self._fetch_one(f"SELECT {USER_COLUMNS} FROM users WHERE id = ?", (user_id,))
+
+    def user_exists(self, email):
+        return self._fetch_one("SELECT id FROM users WHERE email = ?", (email,)) is not None
+
+    def create_user(self, user_data, password_hash, seed_accounts=True):
+        """Insert a user (and default broker accounts) in one transaction
+
+        Raises driver.integrity_error when the email is already registered.
+        """
+        with self.driver.connection() as conn:
+            cursor = self.driver.cursor(conn)
+            try:
+                user_id = self.driver.insert(cursor, '''
+                    INSERT INTO users (email, password_hash, first_name, last_name, full_name, phone, is_admin, vip_status)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    user_data['email'],
+                    password_hash,
+                    user_data.get('first_name'),
+                    user_data.get('last_name'),
+                    user_data.get('full_name'),
+                    user_data.get('phone'),
+                    bool(user_data.get('is_admin', False)),
+                    bool(user_data.get('vip_status', False)),
+                ))
+
+                if seed_accounts:
+                    self.driver.executemany(cursor, '''
+                        INSERT INTO trading_accounts (user_id, broker_name, account_balance, is_active)
+                        VALUES (?, ?, ?, ?)
+                    ''', [(user_id, broker, DEFAULT_ACCOUNT_BALANCE, True) for broker in DEFAULT_BROKERS])
+
+                conn.commit()
+                return user_id
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def update_user_vip_status(self, user_id, vip_status):
+        return self._execute(
+            "UPDATE users SET vip_status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (bool(vip_status), user_id)
+        )
+
+    def update_password_hash(self, user_id, password_hash):
+        return self._execute(
+            "UPDATE users SET password_hash = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (password_hash, user_id)
+        )
+
+    # User settings
+
+    def get_user_setting(self, user_id, setting_key):
+        row = self._fetch_one(
+            "SELECT setting_value FROM user_settings WHERE user_id = ? AND setting_key = ?",
+            (user_id, setting_key)
+        )
+        return row['setting_value'] if row else None
+
+    def set_user_setting(self, user_id, setting_key, setting_value):
+        """Insert or update one setting (ON CONFLICT works on both backends)"""
+        return self._execute('''
+            INSERT INTO user_settings (user_id, setting_key, setting_value)
+            VALUES (?, ?, ?)
+            ON CONFLICT (user_id, setting_key)
+            DO UPDATE SET setting_value = excluded.setting_value, updated_at = CURRENT_TIMESTAMP
+        ''', (user_id, setting_key, setting_value))
+
+    # Sessions
+
+    def create_session(self, id_hash, user_id, expires_at, ttl):
+        return self._execute(
+            "INSERT INTO sessions (id_hash, user_id, expires_at, ttl) VALUES (?, ?, ?, ?)",
+            (id_hash, user_id, expires_at, ttl)
+        )
+
+    def get_session_user(self, id_hash, now):
+        """User fields, saved language and expiry for a live session, in one query"""
+        return self._fetch_one(f'''
+            SELECT {qualify(USER_COLUMNS, 'u')}, s.setting_value AS language, sess.expires_at, sess.ttl
+            FROM sessions sess
+            JOIN users u ON u.id = sess.user_id
+            LEFT JOIN user_settings s ON s.user_id = u.id AND s.setting_key = ?
+            WHERE sess.id_hash = ? AND sess.expires_at > ?
+        ''', (LANGUAGE_SETTING, id_hash, now))
+
+    def extend_session(self, id_hash, expires_at):
+        return self._execute("UPDATE sessions SET expires_at = ? WHERE id_hash = ?", (expires_at, id_hash))
+
+    def delete_session(self, id_hash):
+        return self._execute("DELETE FROM sessions WHERE id_hash = ?", (id_hash,))
+
+    def delete_expired_sessions(self, now):
+        return self._execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+
+    # Trading accounts
+
+    def get_user_trading_accounts(self, user_id):
+        return self._fetch_all(
+            f"SELECT {TRADING_ACCOUNT_COLUMNS} FROM trading_accounts WHERE user_id = ? ORDER BY broker_name",
+            (user_id,)
+        )
+
+    # Trading bots
+
+    def create_bot(self, bot_data):
+        return self._insert('''
+            INSERT INTO trading_bots (user_id, bot_name, broker_name, strategy_type, is_active,
+                                      profit_target, stop_loss, investment_amount)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            bot_data['user_id'],
+            bot_data['bot_name'],
+            bot_data['broker_name'],
+            bot_data['strategy_type'],
+            bool(bot_data.get('is_active', False)),
+            bot_data.get('profit_target', 0.0),
+            bot_data.get('stop_loss', 0.0),
+            bot_data.get('investment_amount', 0.0),
+        ))
+
+    def get_user_bots(self, user_id):
+        return self._fetch_all(
+            f"SELECT {BOT_COLUMNS} FROM trading_bots WHERE user_id = ? ORDER BY id",
+            (user_id,)
+        )
+
+    def get_active_bots(self):
+        return self._fetch_all(
+            f"SELECT {BOT_COLUMNS} FROM trading_bots WHERE is_active = ? ORDER BY id",
+            (True,)
+        )
+
+    def set_bot_active(self, bot_id, is_active):
+        return self._execute(
+            "UPDATE trading_bots SET is_active = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (bool(is_active), bot_id)
+        )
+
+    def set_broker_bots_active(self, user_id, broker_name, is_active):
+        """Switch all of a user's bots on one broker, returns how many exist"""
+        return self._execute(
+            "UPDATE trading_bots SET is_active = ?, updated_at = CURRENT_TIMESTAMP WHERE user_id = ? AND broker_name = ?",
+            (bool(is_active), user_id, broker_name)
+        )
+
+    # Trading history
+
+    def add_trade(self, trade):
+        return self._insert('''
+            INSERT INTO trading_history (user_id, bot_id, broker_name, asset_pair, trade_type,
+                                         investment_amount, payout_amount, result, entry_time,
+                                         expiry_time, entry_price, exit_price)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            trade['user_id'],
+            trade.get('bot_id'),
+            trade['broker_name'],
+            trade['asset_pair'],
+            trade['trade_type'],
+            trade['investment_amount'],
+            trade.get('payout_amount', 0.0),
+            trade.get('result', 'pending'),
+            trade.get('entry_time'),
+            trade.get('expiry_time'),
+            trade.get('entry_price'),
+            trade.get('exit_price'),
+        ))
+
+    def get_recent_trades(self, user_id, limit=20):
+        return self._fetch_all(
+            f"SELECT {TRADE_COLUMNS} FROM trading_history WHERE user_id = ? ORDER BY created_at DESC, id DESC LIMIT ?",
+            (user_id, limit)
+        )
+
+    def get_trades_page(self, user_id, limit=20, before=None):
+        """Get one page of trades, newest first, using keyset pagination
+
+        before is the (created_at, id) of the last row of the previous page;
+        pass None for the first page. Cost stays constant however deep the
+        user scrolls, unlike OFFSET.
+        """
+        if before is None:
+            return self.get_recent_trades(user_id, limit)
+        created_at, trade_id = before
+        return self._fetch_all(
+            f"SELECT {TRADE_COLUMNS} FROM trading_history "
+            "WHERE user_id = ? AND (created_at < ? OR (created_at = ? AND id < ?)) "
+            "ORDER BY created_at DESC, id DESC LIMIT ?",
+            (user_id, created_at, created_at, trade_id, limit)
+        )
+
+    def get_trades_page_after(self, user_id, limit, after):
+        """Get the page of trades just newer than after (a (created_at, id) key), newest first
+
+        Walks get_trades_page backwards, for lists that dropped rows off the top.
+        """
+        created_at, trade_id = after
+        rows = self._fetch_all(
+            f"SELECT {TRADE_COLUMNS} FROM trading_history "
+            "WHERE user_id = ? AND (created_at > ? OR (created_at = ? AND id > ?)) "
+            "ORDER BY created_at ASC, id ASC LIMIT ?",
+            (user_id, created_at, created_at, trade_id, limit)
+        )
+        rows.reverse()
+        return rows
+
+    # Notifications
+
+    def create_notification(self, user_id, title, message, notification_type='info'):
+        return self._insert(
+            "INSERT INTO notifications (user_id, title, message, type) VALUES (?, ?, ?, ?)",
+            (user_id, title, message, notification_type)
+        )
+
+    def get_unread_notifications(self, user_id):
+        return self._fetch_all(
+            f"SELECT {NOTIFICATION_COLUMNS} FROM notifications WHERE user_id = ? AND is_read = ? ORDER BY created_at DESC",
+            (user_id, False)
+        )
+
+    def mark_notifications_read(self, user_id):
+        return self._execute(
+            "UPDATE notifications SET is_read = ? WHERE user_id = ? AND is_read = ?",
+            (True, user_id, False)
+        )
@@ -1,27 +1,173 @@
 import sqlite3
-import bcrypt
 import os
-import sys
-from datetime import datetime
+import threading
 
-# Add utils to path for logger
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
-try:
-    from utils.logger import logger
-except ImportError:
-    # Fallback if logger not available
-    import logging
-    logger = logging.getLogger(__name__)
+from config.app_config import AppConfig
+from services.database.user_cache import get_user_cache
+from services.database.base_manager import BaseDatabaseManager
+from services.database.repository import SQLiteDriver
+from utils.logger import logger
 
-class SQLiteManager:
+
+class SQLitePoolTimeout(Exception):
+    """Raised when no pooled connection becomes free within the checkout timeout"""
+
+
+class SQLiteConnectionPool:
+    """Thread-safe pool of warm SQLite connections for a single database file"""
+    
+    def __init__(self, db_path, max_size=None, timeout=None, cache_size_kb=None):
+        self.db_path = db_path
+        self.max_size = max_size or AppConfig.SQLITE_POOL_SIZE
+        self.timeout = timeout if timeout is not None else AppConfig.SQLITE_POOL_TIMEOUT
+        self.cache_size_kb = cache_size_kb or AppConfig.SQLITE_CACHE_SIZE_KB
+        
+        self._idle = []  # Popped from the end (LIFO) so the hottest connection stays in use
+        self._lock = threading.Lock()
+        # Signalled whenever a connection is returned or a slot is freed
+        self._available = threading.Condition(self._lock)
+        self._open_connections = 0
+        self._in_use = 0
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'created': 0,
+            'discarded': 0,
+        }
+        
+    def _create_connection(self):
+        """Open a new connection and apply per-connection pragmas once"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,  # Connections move between Flet session threads
+            cached_statements=256,  # Keep repository statements compiled
+        )
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kb)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+        
+    def _can_checkout(self):
+        return bool(self._idle) or self._open_connections < self.max_size
+        
+    def acquire(self):
+        """Check out a connection, opening a new one while below max_size"""
+        with self._available:
+            if not self._can_checkout():
+                self._stats['waits'] += 1
+                if not self._available.wait_for(self._can_checkout, self.timeout):
+                    self._stats['timeouts'] += 1
+                    raise SQLitePoolTimeout(
+                        f"No SQLite connection available within {self.timeout}s ({self.db_path})"
+                    )
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = None
+                self._open_connections += 1  # Claim the slot before connecting outside the lock
+        
+        if conn is None:
+            try:
+                conn = self._create_connection()
+            except Exception:
+                with self._available:
+                    self._open_connections -= 1
+                    self._available.notify()
+                raise
+            with self._lock:
+                self._stats['created'] += 1
+        
+        with self._lock:
+            self._stats['checkouts'] += 1
+            self._in_use += 1
+        return conn
+        
+    def release(self, conn):
+        """Return a connection to the pool, rolling back any open transaction"""
+        with self._lock:
+            self._in_use -= 1
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            logger.warning(f"Discarding broken SQLite connection: {e}")
+            self._discard(conn)
+            return
+        with self._available:
+            self._idle.append(conn)
+            self._available.notify()
+        
+    def _discard(self, conn):
+        """Close a connection and free its slot for a waiting acquire()"""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._available:
+            self._open_connections -= 1
+            self._stats['discarded'] += 1
+            self._available.notify()
+            
+    def close_all(self):
+        """Close every idle connection in the pool"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._discard(conn)
+            
+    def get_stats(self):
+        """Get pool counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['open_connections'] = self._open_connections
+            stats['in_use'] = self._in_use
+            stats['idle'] = len(self._idle)
+        stats['max_size'] = self.max_size
+        return stats
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_pool(db_path):
+    """Get the process-wide pool for a database file, creating it on first use"""
+    key = os.path.abspath(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SQLiteConnectionPool(db_path)
+            _pools[key] = pool
+        return pool
+
+
+class SQLiteManager(BaseDatabaseManager):
+    backend = 'sqlite'
+    
     def __init__(self, db_path=None):
         self.db_path = db_path or "database.db"
+        # Shared across every manager (and Flet session) using the same file
+        self.pool = get_pool(self.db_path)
+        self.user_cache = get_user_cache(os.path.abspath(self.db_path))
+        self._init_repository()
+        
+    def _create_driver(self):
+        return SQLiteDriver(self)
         
     def get_connection(self):
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        return conn
+        """Check out a pooled database connection"""
+        return self.pool.acquire()
+        
+    def release_connection(self, conn):
+        """Return a connection obtained from get_connection to the pool"""
+        self.pool.release(conn)
+        
+    def get_pool_stats(self):
+        """Get connection pool statistics"""
+        return self.pool.get_stats()
         
     def init_db(self):
         """Initialize database and create tables"""
@@ -66,173 +212,6 @@ class SQLiteManager:
             conn.rollback()
         finally:
             cursor.close()
-            conn.close()
-    
-    def hash_password(self, password):
-        """Hash password using bcrypt"""
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
-    
-    def verify_password(self, password, hashed_password):
-        """Verify password against hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
-    
-    def authenticate_user(self, email, password):
-        """Authenticate user login"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute(
-                "SELECT id, email, password_hash, full_name, phone, is_admin, vip_status FROM users WHERE email = ?",
-                (email,)
-            )
-            user = cursor.fetchone()
-            
-            if user and self.verify_password(password, user['password_hash']):
-                logger.info(f"User authenticated successfully: {email}")
-                return {
-                    'id': user['id'],
-                    'email': user['email'],
-                    'full_name': user['full_name'],
-                    'phone': user['phone'],
-                    'is_admin': user['is_admin'],
-                    'vip_status': user['vip_status']
-                }
-            else:
-                logger.warning(f"Authentication failed for user: {email}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error during authentication: {e}")
-            return None
-        finally:
-            cursor.close()
-            conn.close()
-    
-    def create_user(self, user_data):
-        """Create a new user"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+            self.release_connection(conn)
         
-        try:
-            hashed_password = self.hash_password(user_data['password'])
-            
-            cursor.execute('''
-                INSERT INTO users (email, password_hash, first_name, last_name, full_name, phone, is_admin, vip_status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                user_data['email'],
-                hashed_password,
-                user_data.get('first_name'),
-                user_data.get('last_name'),
-                user_data.get('full_name'),
-                user_data.get('phone'),
-                user_data.get('is_admin', False),
-                user_data.get('vip_status', False)
-            ))
-            
-            user_id = cursor.lastrowid
-            conn.commit()
-            logger.info(f"User created successfully: {user_data['email']}")
-            return user_id
-            
-        except sqlite3.IntegrityError:
-            logger.warning(f"User already exists: {user_data['email']}")
-            return None
-        except Exception as e:
-            logger.error(f"Error creating user: {e}")
-            conn.rollback()
-            return None
-        finally:
-            cursor.close()
-            conn.close()
-    
-    def get_user_by_id(self, user_id):
-        """Get user by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute(
-                "SELECT id, email, full_name, phone, is_admin, vip_status FROM users WHERE id = ?",
-                (user_id,)
-            )
-            user = cursor.fetchone()
-            
-            if user:
-                return {
-                    'id': user['id'],
-                    'email': user['email'],
-                    'full_name': user['full_name'],
-                    'phone': user['phone'],
-                    'is_admin': user['is_admin'],
-                    'vip_status': user['vip_status']
-                }
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error getting user by ID: {e}")
-            return None
-        finally:
-            cursor.close()
-            conn.close()
-    
-    def get_user_trading_accounts(self, user_id):
-        """Get all trading accounts for a user"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute(
-                "SELECT * FROM trading_accounts WHERE user_id = ?",
-                (user_id,)
-            )
-            accounts = cursor.fetchall()
-            
-            return [dict(account) for account in accounts]
-            
-        except Exception as e:
-            logger.error(f"Error getting trading accounts: {e}")
-            return []
-        finally:
-            cursor.close()
-            conn.close()
-    
-    def update_user_vip_status(self, user_id, vip_status):
-        """Update user VIP status"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute(
-                "UPDATE users SET vip_status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (vip_status, user_id)
-            )
-            conn.commit()
-            logger.info(f"VIP status updated for user {user_id}: {vip_status}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error updating VIP status: {e}")
-            conn.rollback()
-            return False
-        finally:
-            cursor.close()
-            conn.close()
-    
-    def user_exists(self, email):
-        """Check if user exists by email"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("SELECT id FROM users WHERE email = ?", (email,))
-            return cursor.fetchone() is not None
-            
-        except Exception as e:
-            logger.error(f"Error checking if user exists: {e}")
-            return False
-        finally:
-            cursor.close()
-            conn.close()
\ No newline at end of file
+        self.run_migrations()
@@ -0,0 +1,130 @@
+"""
+Bulk ingest of bot trade results into trading_history
+"""
+import time
+from itertools import islice
+
+from config.app_config import AppConfig
+from utils.logger import logger
+
+INSERT_TRADE_SQL = '''
+    INSERT INTO trading_history (user_id, bot_id, broker_name, asset_pair, trade_type,
+                                 investment_amount, payout_amount, result, entry_time,
+                                 expiry_time, entry_price, exit_price)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+UPDATE_RESULT_SQL = '''
+    UPDATE trading_history
+    SET result = ?, payout_amount = ?, exit_price = COALESCE(?, exit_price)
+    WHERE id = ?
+'''
+
+UPDATE_BOT_STATS_SQL = '''
+    UPDATE trading_bots
+    SET total_trades = total_trades + ?, winning_trades = winning_trades + ?,
+        total_profit = total_profit + ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+'''
+
+
+def _chunks(iterable, size):
+    """Yield lists of up to size items without materialising the whole iterable"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _trade_params(trade):
+    return (
+        trade['user_id'],
+        trade.get('bot_id'),
+        trade['broker_name'],
+        trade['asset_pair'],
+        trade['trade_type'],
+        trade['investment_amount'],
+        trade.get('payout_amount', 0.0),
+        trade.get('result', 'pending'),
+        trade.get('entry_time'),
+        trade.get('expiry_time'),
+        trade.get('entry_price'),
+        trade.get('exit_price'),
+    )
+
+
+def _result_params(update):
+    return (
+        update['result'],
+        update.get('payout_amount', 0.0),
+        update.get('exit_price'),
+        update['id'],
+    )
+
+
+def _bot_stats_params(stats):
+    return (
+        stats['trades'],
+        stats['wins'],
+        stats['profit'],
+        stats['bot_id'],
+    )
+
+
+class TradeHistoryIngestor:
+    """Write trades with executemany, one transaction per chunk
+
+    Works with any manager exposing a Repository (SQLite or PostgreSQL).
+    Each method returns a report dict with rows, chunks, seconds and
+    rows_per_second. A failing chunk is rolled back and re-raised; earlier
+    chunks stay committed.
+    """
+
+    def __init__(self, db_manager, chunk_size=None):
+        self.driver = db_manager.repository.driver
+        self.chunk_size = chunk_size or AppConfig.TRADE_INGEST_CHUNK_SIZE
+
+    def _run(self, sql, rows, to_params, label):
+        total_rows = 0
+        chunks = 0
+        start = time.perf_counter()
+
+        with self.driver.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                for chunk in _chunks(rows, self.chunk_size):
+                    try:
+                        self.driver.executemany(cursor, sql, [to_params(row) for row in chunk])
+                        conn.commit()
+                    except Exception as e:
+                        conn.rollback()
+                        logger.error(f"Error in {label} chunk {chunks + 1}: {e}")
+                        raise
+                    total_rows += len(chunk)
+                    chunks += 1
+            finally:
+                cursor.close()
+
+        seconds = time.perf_counter() - start
+        report = {
+            'rows': total_rows,
+            'chunks': chunks,
+            'seconds': seconds,
+            'rows_per_second': total_rows / seconds if seconds > 0 else 0.0,
+        }
+        logger.debug(f"{label}: {total_rows} rows in {chunks} chunks ({report['rows_per_second']:.0f} rows/s)")
+        return report
+
+    def ingest(self, trades):
+        """Insert an iterable of trade dicts (same keys as Repository.add_trade)"""
+        return self._run(INSERT_TRADE_SQL, trades, _trade_params, "Trade ingest")
+
+    def apply_results(self, updates):
+        """Settle trades in bulk from dicts with id, result, payout_amount and optional exit_price"""
+        return self._run(UPDATE_RESULT_SQL, updates, _result_params, "Trade result update")
+
+    def apply_bot_stats(self, stats):
+        """Add per-bot deltas (bot_id, trades, wins, profit) to the trading_bots counters"""
+        return self._run(UPDATE_BOT_STATS_SQL, stats, _bot_stats_params, "Bot stats update")
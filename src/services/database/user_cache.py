@@ -0,0 +1,171 @@
+"""
+In-process TTL + LRU cache for user lookups
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from config.app_config import AppConfig
+
+# Returned by TTLCache.get when a key is absent or expired (None is a valid cached value)
+MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a TTL"""
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0,
+        }
+
+    def get(self, key):
+        """Get a cached value or MISSING"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return MISSING
+
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return MISSING
+
+            self._data.move_to_end(key)
+            self._stats['hits'] += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        """Store a value, evicting the least recently used entry when full"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def delete(self, key):
+        """Drop a key if present"""
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self._stats['invalidations'] += 1
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+
+    def get_stats(self):
+        """Get hit/miss counters and current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._data)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['max_size'] = self.max_size
+        return stats
+
+
+class UserCache:
+    """Positive/negative cache in front of user_exists, get_user_by_id and login row lookups"""
+
+    def __init__(self, max_size=None, ttl=None, negative_ttl=None):
+        max_size = max_size or AppConfig.USER_CACHE_SIZE
+        ttl = ttl if ttl is not None else AppConfig.USER_CACHE_TTL
+        # Misses expire sooner so users registered by another process show up quickly
+        self.negative_ttl = negative_ttl if negative_ttl is not None else AppConfig.USER_CACHE_NEGATIVE_TTL
+
+        self.exists = TTLCache(max_size, ttl)
+        self.by_id = TTLCache(max_size, ttl)
+        self.rows = TTLCache(max_size, ttl)
+
+        # user_id -> email, so id-based writes can drop email-keyed entries
+        self._emails = {}
+        self._lock = threading.Lock()
+
+    def get_exists(self, email):
+        return self.exists.get(email)
+
+    def set_exists(self, email, exists):
+        self.exists.set(email, exists, ttl=None if exists else self.negative_ttl)
+
+    def get_user(self, user_id):
+        value = self.by_id.get(user_id)
+        return dict(value) if isinstance(value, dict) else value
+
+    def set_user(self, user_id, user):
+        if user:
+            self._remember_email(user_id, user.get('email'))
+            self.by_id.set(user_id, dict(user))
+        else:
+            self.by_id.set(user_id, None, ttl=self.negative_ttl)
+
+    def get_row(self, email):
+        value = self.rows.get(email)
+        return dict(value) if isinstance(value, dict) else value
+
+    def set_row(self, email, row):
+        if row:
+            self._remember_email(row.get('id'), email)
+            self.rows.set(email, dict(row))
+            self.exists.set(email, True)
+        else:
+            self.rows.set(email, None, ttl=self.negative_ttl)
+
+    def _remember_email(self, user_id, email):
+        if user_id is not None and email:
+            with self._lock:
+                self._emails[user_id] = email
+
+    def invalidate_email(self, email):
+        """Drop every entry keyed by email (write-through on create_user)"""
+        self.exists.delete(email)
+        self.rows.delete(email)
+
+    def invalidate_user(self, user_id):
+        """Drop every entry for a user id (write-through on updates)"""
+        self.by_id.delete(user_id)
+        with self._lock:
+            email = self._emails.pop(user_id, None)
+        if email:
+            self.invalidate_email(email)
+
+    def clear(self):
+        self.exists.clear()
+        self.by_id.clear()
+        self.rows.clear()
+        with self._lock:
+            self._emails.clear()
+
+    def get_stats(self):
+        """Get hit/miss counters for each lookup cache"""
+        return {
+            'user_exists': self.exists.get_stats(),
+            'get_user_by_id': self.by_id.get_stats(),
+            'authenticate_user': self.rows.get_stats(),
+        }
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+def get_user_cache(namespace):
+    """Get the process-wide cache for a database, creating it on first use"""
+    with _caches_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            cache = UserCache()
+            _caches[namespace] = cache
+        return cache
@@ -0,0 +1,101 @@
+"""
+Per-process health endpoint, probed by the worker launcher
+"""
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config.app_config import AppConfig
+from utils.logger import logger
+
+
+class HealthMonitor:
+    """Tracks sessions and collects stats from registered providers
+
+    Providers are callables returning a JSON-serializable dict (cache,
+    limiter, logger stats...). The readiness check decides between
+    200 "ok" and 503 "starting"; a provider that raises is reported
+    instead of failing the probe.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.sessions_opened = 0
+        self.sessions_active = 0
+        self._providers = {}
+        self._ready = lambda: True
+        self._lock = threading.Lock()
+
+    def set_readiness(self, check):
+        self._ready = check
+
+    def add_provider(self, name, provider):
+        self._providers[name] = provider
+
+    def session_opened(self):
+        with self._lock:
+            self.sessions_opened += 1
+            self.sessions_active += 1
+
+    def session_closed(self):
+        with self._lock:
+            self.sessions_active = max(0, self.sessions_active - 1)
+
+    def is_ready(self):
+        try:
+            return bool(self._ready())
+        except Exception:
+            return False
+
+    def snapshot(self):
+        with self._lock:
+            report = {
+                'status': 'ok' if self.is_ready() else 'starting',
+                'worker': AppConfig.WORKER_ID or None,
+                'pid': os.getpid(),
+                'uptime': round(time.time() - self.started_at, 1),
+                'sessions_opened': self.sessions_opened,
+                'sessions_active': self.sessions_active,
+            }
+        for name, provider in self._providers.items():
+            try:
+                report[name] = provider()
+            except Exception as e:
+                report[name] = {'error': str(e)}
+        return report
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    monitor = None
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] != AppConfig.HEALTH_PATH:
+            self.send_error(404)
+            return
+        report = self.monitor.snapshot()
+        body = json.dumps(report, default=str).encode()
+        self.send_response(200 if report['status'] == 'ok' else 503)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Probes arrive every few seconds; keep them out of the app log
+
+
+def start_health_server(host, port, monitor=None):
+    """Serve monitor's report at HEALTH_PATH on a daemon thread, returns the server"""
+    handler = type('HealthHandler', (_HealthHandler,), {'monitor': monitor or health_monitor})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="health-server", daemon=True).start()
+    logger.info(f"Health endpoint on http://{host}:{server.server_port}{AppConfig.HEALTH_PATH}")
+    return server
+
+
+# Global health monitor instance
+health_monitor = HealthMonitor()
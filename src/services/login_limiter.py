@@ -0,0 +1,259 @@
+"""
+Login rate limiting and lockout, checked before any database or bcrypt work
+"""
+import math
+import sqlite3
+from contextlib import closing
+import threading
+import time
+from collections import OrderedDict, deque
+
+from config.app_config import AppConfig
+from utils.logger import logger
+
+
+class LoginRateLimited(Exception):
+    """Raised when a login attempt is rejected without checking the password"""
+
+    def __init__(self, reason, retry_after):
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"Login {reason}; retry in {math.ceil(retry_after)}s")
+
+
+class _Policy:
+    def __init__(self, burst, per_minute, failure_threshold):
+        self.burst = burst
+        self.rate = per_minute / 60.0  # Tokens per second
+        self.failure_threshold = failure_threshold
+
+
+class _KeyState:
+    __slots__ = ('tokens', 'refilled_at', 'failures', 'lockouts', 'locked_until')
+
+    def __init__(self, burst, now):
+        self.tokens = float(burst)
+        self.refilled_at = now
+        self.failures = deque()  # Timestamps of failures inside the window
+        self.lockouts = 0
+        self.locked_until = 0.0
+
+
+class LoginRateLimiter:
+    """Token buckets and failure lockouts keyed by email and by client
+
+    acquire() runs before a login is queued for bcrypt. It takes a token
+    from the email's and the client's bucket and raises LoginRateLimited
+    when either is empty or locked; that path is a few dict operations
+    under one lock and never touches the database.
+
+    record() feeds the result back; release() hands the tokens back for
+    an attempt that never reached a password check (queue full, database
+    error), so outages are not held against the user. Failures are kept in a sliding window;
+    reaching the policy's threshold locks the key for
+    LOGIN_LOCKOUT_BASE * 2^(lockouts - 1) seconds, capped at
+    LOGIN_LOCKOUT_MAX. A successful login clears the email's failures and
+    lockout history.
+
+    At most max_keys keys are tracked (least recently used are dropped),
+    so random emails cannot grow memory without bound. With a db_path,
+    active lockouts are written to SQLite and reloaded at startup, so a
+    restart does not lift them.
+    """
+
+    def __init__(self, db_path=None, max_keys=None):
+        self.policies = {
+            'email': _Policy(
+                AppConfig.LOGIN_RATE_EMAIL_BURST,
+                AppConfig.LOGIN_RATE_EMAIL_PER_MINUTE,
+                AppConfig.LOGIN_FAILURE_THRESHOLD,
+            ),
+            'client': _Policy(
+                AppConfig.LOGIN_RATE_CLIENT_BURST,
+                AppConfig.LOGIN_RATE_CLIENT_PER_MINUTE,
+                AppConfig.LOGIN_CLIENT_FAILURE_THRESHOLD,
+            ),
+        }
+        self.failure_window = AppConfig.LOGIN_FAILURE_WINDOW
+        self.lockout_base = AppConfig.LOGIN_LOCKOUT_BASE
+        self.lockout_max = AppConfig.LOGIN_LOCKOUT_MAX
+        self.max_keys = max_keys or AppConfig.LOGIN_LIMITER_MAX_KEYS
+        self.db_path = AppConfig.LOGIN_LIMITER_DB if db_path is None else db_path
+
+        self._lock = threading.Lock()
+        self._keys = OrderedDict()  # (kind, value) -> _KeyState
+        self.stats = {
+            'checked': 0,
+            'allowed': 0,
+            'rejected_rate': 0,
+            'rejected_lockout': 0,
+            'failures': 0,
+            'successes': 0,
+            'released': 0,
+            'lockouts': 0,
+            'evicted': 0,
+        }
+
+        if self.db_path:
+            self._init_store()
+
+    def _keys_for(self, email, client):
+        keys = [('email', (email or '').strip().lower())]
+        if client:
+            keys.append(('client', client))
+        return keys
+
+    def _state(self, key, now):
+        state = self._keys.get(key)
+        if state is None:
+            state = _KeyState(self.policies[key[0]].burst, now)
+            self._keys[key] = state
+            if len(self._keys) > self.max_keys:
+                self._keys.popitem(last=False)
+                self.stats['evicted'] += 1
+        else:
+            self._keys.move_to_end(key)
+        return state
+
+    def _refill(self, state, policy, now):
+        state.tokens = min(policy.burst, state.tokens + (now - state.refilled_at) * policy.rate)
+        state.refilled_at = now
+
+    def acquire(self, email, client=None):
+        """Take one attempt for email and client, or raise LoginRateLimited"""
+        now = time.monotonic()
+        with self._lock:
+            self.stats['checked'] += 1
+            states = [(key, self._state(key, now)) for key in self._keys_for(email, client)]
+
+            for key, state in states:
+                if state.locked_until > now:
+                    self.stats['rejected_lockout'] += 1
+                    raise LoginRateLimited(f"locked for this {key[0]}", state.locked_until - now)
+
+            for key, state in states:
+                policy = self.policies[key[0]]
+                self._refill(state, policy, now)
+                if state.tokens < 1:
+                    self.stats['rejected_rate'] += 1
+                    raise LoginRateLimited(f"rate limited for this {key[0]}", (1 - state.tokens) / policy.rate)
+
+            # Only spend tokens once every key has allowed the attempt
+            for _, state in states:
+                state.tokens -= 1
+            self.stats['allowed'] += 1
+
+    def record(self, email, client=None, success=False):
+        """Feed back the outcome of an attempt that acquire() allowed"""
+        now = time.monotonic()
+        locked = []
+        with self._lock:
+            for key in self._keys_for(email, client):
+                state = self._state(key, now)
+                if success:
+                    if key[0] == 'email':
+                        if state.lockouts:
+                            locked.append((key, 0.0, 0))  # Clear the persisted lockout too
+                        state.failures.clear()
+                        state.lockouts = 0
+                        state.locked_until = 0.0
+                    continue
+
+                state.failures.append(now)
+                while state.failures and state.failures[0] < now - self.failure_window:
+                    state.failures.popleft()
+                if len(state.failures) >= self.policies[key[0]].failure_threshold:
+                    state.lockouts += 1
+                    duration = min(self.lockout_max, self.lockout_base * 2 ** (state.lockouts - 1))
+                    state.locked_until = now + duration
+                    state.failures.clear()
+                    self.stats['lockouts'] += 1
+                    locked.append((key, duration, state.lockouts))
+                    logger.warning(f"Login locked for {key[0]} {key[1]} for {duration:.0f}s (lockout {state.lockouts})")
+
+            self.stats['successes' if success else 'failures'] += 1
+
+        if self.db_path:
+            for key, duration, lockouts in locked:
+                self._persist(key, duration, lockouts)
+
+    def release(self, email, client=None):
+        """Give back the tokens of an attempt that acquire() allowed but that was never checked"""
+        now = time.monotonic()
+        with self._lock:
+            for key in self._keys_for(email, client):
+                state = self._keys.get(key)
+                if state is not None:
+                    policy = self.policies[key[0]]
+                    self._refill(state, policy, now)
+                    state.tokens = min(policy.burst, state.tokens + 1)
+            self.stats['released'] += 1
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats['tracked_keys'] = len(self._keys)
+            now = time.monotonic()
+            stats['locked_keys'] = sum(1 for state in self._keys.values() if state.locked_until > now)
+        return stats
+
+    def reset(self):
+        """Forget all in-memory state (persisted lockouts stay)"""
+        with self._lock:
+            self._keys.clear()
+
+    # Optional SQLite persistence of lockouts
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _init_store(self):
+        try:
+            # The connection's own context manager only commits; closing() releases the handle
+            with closing(self._connect()) as conn, conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS login_lockouts (
+                        kind TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        locked_until REAL NOT NULL,
+                        lockouts INTEGER NOT NULL,
+                        PRIMARY KEY (kind, key)
+                    )
+                ''')
+                rows = conn.execute(
+                    "SELECT kind, key, locked_until, lockouts FROM login_lockouts WHERE locked_until > ?",
+                    (time.time(),)
+                ).fetchall()
+                conn.execute("DELETE FROM login_lockouts WHERE locked_until <= ?", (time.time(),))
+        except sqlite3.Error as e:
+            logger.error(f"Login limiter store unavailable, using memory only: {e}")
+            self.db_path = None
+            return
+
+        # Stored times are wall-clock; the in-memory state runs on the monotonic clock
+        now, wall = time.monotonic(), time.time()
+        with self._lock:
+            for kind, value, locked_until, lockouts in rows:
+                if kind in self.policies:
+                    state = self._state((kind, value), now)
+                    state.locked_until = now + (locked_until - wall)
+                    state.lockouts = lockouts
+        if rows:
+            logger.info(f"Restored {len(rows)} active login lockouts")
+
+    def _persist(self, key, duration, lockouts):
+        try:
+            with closing(self._connect()) as conn, conn:
+                if duration > 0:
+                    conn.execute('''
+                        INSERT INTO login_lockouts (kind, key, locked_until, lockouts) VALUES (?, ?, ?, ?)
+                        ON CONFLICT (kind, key) DO UPDATE SET locked_until = excluded.locked_until, lockouts = excluded.lockouts
+                    ''', (key[0], key[1], time.time() + duration, lockouts))
+                else:
+                    conn.execute("DELETE FROM login_lockouts WHERE kind = ? AND key = ?", key)
+        except sqlite3.Error as e:
+            logger.error(f"Could not persist login lockout: {e}")
+
+
+# Global login rate limiter instance
+login_limiter = LoginRateLimiter()
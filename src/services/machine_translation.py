@@ -0,0 +1,140 @@
+"""
+Offline fill-in of missing catalog keys with a pluggable machine translator
+"""
+import importlib
+import json
+import re
+
+from core.catalog import TranslationCatalog
+from utils.logger import logger
+
+SOURCE_LANGUAGE = "en"
+PLACEHOLDER = re.compile(r"\{[^{}]*\}")  # str.format fields, which must come through untranslated
+
+
+class DictionaryTranslator:
+    """Looks translations up in a {language: {english text: translation}} mapping
+
+    The stand-in engine for tests and hand-maintained glossaries; texts it
+    does not know come back as None and are left missing.
+    """
+
+    name = "dictionary"
+
+    def __init__(self, entries=None, path=None):
+        self.entries = dict(entries or {})
+        if path:
+            with open(path, encoding='utf-8') as f:
+                for language_code, mapping in json.load(f).items():
+                    self.entries.setdefault(language_code, {}).update(mapping)
+
+    def translate(self, texts, source_language, target_language):
+        mapping = self.entries.get(target_language, {})
+        return [mapping.get(text) for text in texts]
+
+
+class ArgosTranslator:
+    """Local neural translation with argostranslate (optional dependency)
+
+    Language packages must already be installed; nothing is downloaded here.
+    """
+
+    name = "argos"
+
+    def __init__(self):
+        try:
+            from argostranslate import translate
+        except ImportError as e:
+            raise RuntimeError("argostranslate is not installed (pip install argostranslate)") from e
+        self._translate = translate.translate
+
+    def translate(self, texts, source_language, target_language):
+        results = []
+        for text in texts:
+            try:
+                results.append(self._translate(text, source_language, target_language))
+            except Exception as e:
+                logger.warning(f"argos could not translate to {target_language}: {e}")
+                results.append(None)
+        return results
+
+
+TRANSLATORS = {
+    DictionaryTranslator.name: DictionaryTranslator,
+    ArgosTranslator.name: ArgosTranslator,
+}
+
+
+def load_translator(spec, **options):
+    """Build a translator from a registered name or a "package.module:ClassName" path
+
+    Any object with translate(texts, source_language, target_language)
+    returning one string (or None) per text can be plugged in.
+    """
+    if spec in TRANSLATORS:
+        return TRANSLATORS[spec](**options)
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown translator '{spec}'; use one of {sorted(TRANSLATORS)} or module:Class")
+    return getattr(importlib.import_module(module_name), class_name)(**options)
+
+
+def missing_keys(catalog, language_code):
+    """English keys that neither layer of a language's catalog provides"""
+    source = catalog.load(SOURCE_LANGUAGE)["manual"]
+    layers = catalog.load(language_code)
+    return [key for key in source if key not in layers["manual"] and key not in layers["auto"]]
+
+
+def coverage(catalog, language_code):
+    """(translated keys, English keys) for one language"""
+    total = len(catalog.load(SOURCE_LANGUAGE)["manual"])
+    return total - len(missing_keys(catalog, language_code)), total
+
+
+def keeps_placeholders(source_text, translation):
+    """True when a translation has exactly the source's {placeholders}"""
+    return sorted(PLACEHOLDER.findall(source_text)) == sorted(PLACEHOLDER.findall(translation))
+
+
+def fill_missing(translator, catalog=None, languages=None, dry_run=False):
+    """Translate every missing key into the "auto" layer of each catalog
+
+    Manual entries are never touched, and translations that lost or
+    mangled a {placeholder} are dropped. Returns one report row per
+    language: {"language", "before", "filled", "rejected", "after", "total"}.
+    """
+    catalog = catalog or TranslationCatalog()
+    if languages is None:
+        languages = [lang["code"] for lang in catalog.languages() if lang["code"] != SOURCE_LANGUAGE]
+    source = catalog.load(SOURCE_LANGUAGE)["manual"]
+
+    report = []
+    for language_code in languages:
+        keys = missing_keys(catalog, language_code)
+        before, total = coverage(catalog, language_code)
+        translations = translator.translate([source[key] for key in keys], SOURCE_LANGUAGE, language_code) if keys else []
+
+        filled, rejected = {}, 0
+        for key, text in zip(keys, translations):
+            if not text:
+                continue
+            if keeps_placeholders(source[key], text):
+                filled[key] = text
+            else:
+                rejected += 1
+                logger.warning(f"Dropped {language_code} translation of '{key}': placeholders changed")
+        if filled and not dry_run:
+            layers = catalog.load(language_code)
+            catalog.save(language_code, {"manual": layers["manual"], "auto": {**layers["auto"], **filled}})
+            logger.info(f"Filled {len(filled)} {language_code} keys with {getattr(translator, 'name', type(translator).__name__)}")
+
+        report.append({
+            "language": language_code,
+            "before": before,
+            "filled": len(filled),
+            "rejected": rejected,
+            "after": before + len(filled),
+            "total": total,
+        })
+    return report
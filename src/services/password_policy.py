@@ -0,0 +1,109 @@
+"""
+Password hashing policy shared by the SQLite and PostgreSQL managers
+"""
+import re
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from config.app_config import AppConfig
+from utils.logger import logger
+
+_BCRYPT_COST_PATTERN = re.compile(r'^\$2[abxy]?\$(\d{2})\$')
+
+
+class PasswordPolicy:
+    """bcrypt cost policy with host calibration and background rehashing"""
+
+    def __init__(self, rounds=None, budget_ms=None, min_rounds=None, max_rounds=None):
+        self.min_rounds = min_rounds or AppConfig.BCRYPT_MIN_ROUNDS
+        self.max_rounds = max_rounds or AppConfig.BCRYPT_MAX_ROUNDS
+        self.budget_ms = budget_ms or AppConfig.BCRYPT_LATENCY_BUDGET_MS
+        self.rounds = rounds or AppConfig.BCRYPT_ROUNDS
+
+        # A single worker keeps opportunistic rehashing from competing with logins
+        self._rehash_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="atv-rehash",
+        )
+        self._rehash_lock = threading.Lock()
+        self._rehash_in_flight = set()
+
+    def hash(self, password):
+        """Hash password with the current cost factor"""
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+    def verify(self, password, hashed_password):
+        """Verify password against hash"""
+        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+    @staticmethod
+    def get_cost(hashed_password):
+        """Get the cost factor encoded in a bcrypt hash, or None if unrecognised"""
+        match = _BCRYPT_COST_PATTERN.match(hashed_password or '')
+        return int(match.group(1)) if match else None
+
+    def needs_rehash(self, hashed_password):
+        """Check whether a stored hash was produced with a lower cost than the policy
+
+        Stronger hashes are kept: calibration can pick a lower cost on a
+        slower or busier host, and downgrading them would churn every login.
+        """
+        cost = self.get_cost(hashed_password)
+        return cost is not None and cost < self.rounds
+
+    def calibrate(self, budget_ms=None, samples=3):
+        """Pick the highest cost whose median hash time fits the latency budget"""
+        budget_ms = budget_ms or self.budget_ms
+        chosen = self.min_rounds
+        timings = {}
+
+        for rounds in range(self.min_rounds, self.max_rounds + 1):
+            durations = []
+            for _ in range(samples):
+                salt = bcrypt.gensalt(rounds=rounds)
+                start = time.perf_counter()
+                bcrypt.hashpw(b"calibration-password", salt)
+                durations.append((time.perf_counter() - start) * 1000)
+            timings[rounds] = statistics.median(durations)
+
+            if timings[rounds] > budget_ms:
+                break  # Each extra round doubles the cost, so stop at the first miss
+            chosen = rounds
+
+        self.rounds = chosen
+        logger.info(
+            f"bcrypt calibrated to cost {chosen} "
+            f"({timings.get(chosen, 0):.0f} ms, budget {budget_ms} ms)"
+        )
+        return chosen
+
+    def schedule_rehash(self, user_key, password, on_hashed):
+        """Re-hash a password with the current cost in the background
+
+        on_hashed(new_hash) is called from the rehash worker; at most one
+        rehash per user_key is queued at a time.
+        """
+        with self._rehash_lock:
+            if user_key in self._rehash_in_flight:
+                return None
+            self._rehash_in_flight.add(user_key)
+
+        def rehash():
+            try:
+                on_hashed(self.hash(password))
+            except Exception as e:
+                logger.error(f"Error rehashing password for {user_key}: {e}")
+            finally:
+                with self._rehash_lock:
+                    self._rehash_in_flight.discard(user_key)
+
+        return self._rehash_executor.submit(rehash)
+
+
+# Global password policy instance
+password_policy = PasswordPolicy()
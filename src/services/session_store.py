@@ -0,0 +1,192 @@
+"""
+Signed, resumable login sessions backed by the sessions table
+"""
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+
+from config.app_config import AppConfig
+from services.database.user_cache import MISSING, TTLCache
+from utils.logger import logger
+
+
+class SessionStore:
+    """Issue and resume sessions so a reload skips the login and bcrypt
+
+    A token is "<session id>.<HMAC-SHA256 of the id>". Forged or mangled
+    tokens fail the signature check before any lookup. The database only
+    stores a SHA-256 of the id, so a leaked sessions table cannot be
+    replayed.
+
+    resume() serves live sessions from an in-memory LRU (entries live at
+    most SESSION_CACHE_TTL seconds, so a revoke made by another process
+    takes effect within that time), and otherwise loads the user, their
+    saved language and the expiry in one query. Expiry slides: once less
+    than half of a session's TTL remains, it is pushed out again.
+
+    Every call takes the db_manager to use, like auth_service.
+    """
+
+    def __init__(self, cache_size=None, cache_ttl=None):
+        self.cache = TTLCache(cache_size or AppConfig.SESSION_CACHE_SIZE,
+                              AppConfig.SESSION_CACHE_TTL if cache_ttl is None else cache_ttl)
+        self._secret = None
+        self._lock = threading.Lock()
+        self._next_purge = 0.0
+        self.stats = {
+            'created': 0,
+            'resumed': 0,
+            'bad_signature': 0,
+            'unknown_or_expired': 0,
+            'extended': 0,
+            'revoked': 0,
+            'purged': 0,
+        }
+
+    # Tokens
+
+    def _get_secret(self):
+        if self._secret is None:
+            with self._lock:
+                if self._secret is None:
+                    self._secret = _load_secret()
+        return self._secret
+
+    def _sign(self, session_id):
+        digest = hmac.new(self._get_secret(), session_id.encode(), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b'=').decode()
+
+    def _verify(self, token):
+        """Session id from a well-signed token, else None"""
+        if not isinstance(token, str) or '.' not in token:
+            return None
+        session_id, signature = token.split('.', 1)
+        if not hmac.compare_digest(signature, self._sign(session_id)):
+            return None
+        return session_id
+
+    # Sessions
+
+    def create(self, db_manager, user_id, remember=False):
+        """Start a session for user_id, returns the token for client storage (None on failure)"""
+        ttl = AppConfig.SESSION_REMEMBER_TTL if remember else AppConfig.SESSION_TTL
+        session_id = secrets.token_urlsafe(32)
+        try:
+            db_manager.repository.create_session(_hash(session_id), user_id, time.time() + ttl, ttl)
+        except Exception as e:
+            logger.error(f"Error creating session: {e}")
+            return None
+
+        with self._lock:
+            self.stats['created'] += 1
+        self._maybe_purge(db_manager)
+        return f"{session_id}.{self._sign(session_id)}"
+
+    def resume(self, db_manager, token):
+        """Get the user (with their saved language) for a live session token, or None"""
+        session_id = self._verify(token)
+        if session_id is None:
+            if token:
+                self._count('bad_signature')
+            return None
+
+        id_hash = _hash(session_id)
+        now = time.time()
+        row = self.cache.get(id_hash)
+        if row is MISSING or row['expires_at'] <= now:
+            try:
+                row = db_manager.repository.get_session_user(id_hash, now)
+            except Exception as e:
+                logger.error(f"Error resuming session: {e}")
+                return None
+            if row is None:
+                self.cache.delete(id_hash)
+                self._count('unknown_or_expired')
+                return None
+
+        if row['expires_at'] - now < row['ttl'] / 2:
+            row = dict(row, expires_at=now + row['ttl'])
+            try:
+                db_manager.repository.extend_session(id_hash, row['expires_at'])
+                self._count('extended')
+            except Exception as e:
+                logger.warning(f"Could not extend session: {e}")
+
+        self.cache.set(id_hash, row, ttl=min(self.cache.ttl, row['expires_at'] - now))
+        self._count('resumed')
+        return {key: value for key, value in row.items() if key not in ('expires_at', 'ttl')}
+
+    def revoke(self, db_manager, token):
+        """End a session (logout)"""
+        session_id = self._verify(token)
+        if session_id is None:
+            return False
+        id_hash = _hash(session_id)
+        self.cache.delete(id_hash)
+        try:
+            db_manager.repository.delete_session(id_hash)
+        except Exception as e:
+            logger.error(f"Error revoking session: {e}")
+            return False
+        self._count('revoked')
+        return True
+
+    def _maybe_purge(self, db_manager):
+        """Delete expired rows at most once per SESSION_PURGE_INTERVAL"""
+        now = time.time()
+        with self._lock:
+            if now < self._next_purge:
+                return
+            self._next_purge = now + AppConfig.SESSION_PURGE_INTERVAL
+        try:
+            purged = db_manager.repository.delete_expired_sessions(now)
+            self._count('purged', purged)
+        except Exception as e:
+            logger.warning(f"Could not purge expired sessions: {e}")
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+        stats['cache'] = self.cache.get_stats()
+        return stats
+
+
+def _hash(session_id):
+    return hashlib.sha256(session_id.encode()).hexdigest()
+
+
+def _load_secret():
+    """SESSION_SECRET if set, else a random key kept in SESSION_SECRET_FILE so tokens survive restarts"""
+    if AppConfig.SESSION_SECRET:
+        return AppConfig.SESSION_SECRET.encode()
+
+    path = AppConfig.SESSION_SECRET_FILE
+    try:
+        # O_EXCL: when several workers start together exactly one creates the key
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        pass
+    else:
+        with os.fdopen(fd, 'w') as f:
+            f.write(secrets.token_hex(32))
+        logger.info(f"Generated session signing key at {path}")
+
+    for _ in range(50):
+        with open(path) as f:
+            secret = f.read().strip()
+        if secret:
+            return secret.encode()
+        time.sleep(0.01)  # Another worker created the file and is still writing it
+    raise RuntimeError(f"Session signing key file {path} is empty")
+
+
+# Global session store instance
+session_store = SessionStore()
@@ -0,0 +1,97 @@
+"""
+Background warmup run while the splash screen is on screen
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from utils.logger import logger
+
+
+class StartupPipeline:
+    """Run registered warmup steps once per process, concurrently
+
+    Steps are plain callables (open DB connections, preload logos, import
+    heavy modules). A failing step is logged and recorded but does not
+    block startup; whatever it would have prepared is then done lazily on
+    first use. Sessions wait on the pipeline through add_done_callback.
+    """
+
+    def __init__(self):
+        self.steps = []
+        self.timings = {}
+        self.errors = {}
+        self.seconds = None
+        self._started = False
+        self._done = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def add_step(self, name, func):
+        self.steps.append((name, func))
+
+    def start(self):
+        """Start warmup in the background; later calls are no-ops"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        threading.Thread(target=self._run, name="startup-warmup", daemon=True).start()
+
+    def _run_step(self, name, func):
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            logger.error(f"Warmup step '{name}' failed: {e}")
+            self.errors[name] = str(e)
+        self.timings[name] = time.perf_counter() - start
+
+    def _run(self):
+        start = time.perf_counter()
+        if self.steps:
+            with ThreadPoolExecutor(max_workers=len(self.steps), thread_name_prefix="warmup") as executor:
+                wait([executor.submit(self._run_step, name, func) for name, func in self.steps])
+        self.seconds = time.perf_counter() - start
+
+        steps = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.timings.items())
+        logger.info(f"Startup warmup finished in {self.seconds * 1000:.0f} ms ({steps})")
+
+        with self._lock:
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            self._invoke(callback)
+
+    def _invoke(self, callback):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Warmup callback error: {e}")
+
+    @property
+    def is_done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def add_done_callback(self, callback):
+        """Call callback() once warmup has finished (immediately if it already has)"""
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        self._invoke(callback)
+
+    def get_report(self):
+        return {
+            'done': self.is_done,
+            'seconds': self.seconds,
+            'steps': dict(self.timings),
+            'errors': dict(self.errors),
+        }
+
+
+# Global startup pipeline instance
+startup_pipeline = StartupPipeline()
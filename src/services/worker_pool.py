@@ -0,0 +1,391 @@
+"""
+Flet worker processes behind a sticky TCP proxy, so the app can use more than one core
+"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+
+from config.app_config import AppConfig
+from utils.logger import logger
+
+_HEAD_LIMIT = 64 * 1024  # Largest request head the proxy buffers before routing
+_HEAD_TIMEOUT = 10.0  # Seconds a new connection gets to send its request head
+_PROBE_TIMEOUT = 2.0
+_STATUS_TEXT = {200: 'OK', 502: 'Bad Gateway', 503: 'Service Unavailable'}
+
+
+class Worker:
+    """One worker process and its routing state"""
+
+    def __init__(self, worker_id, port, health_port):
+        self.id = worker_id
+        self.port = port
+        self.health_port = health_port
+        self.process = None
+        self.state = 'stopped'  # starting -> ready -> draining -> stopped
+        self.connections = 0
+        self.failed_probes = 0
+        self.restarts = 0
+        self.started_at = None
+        self.last_health = None
+        self.hash_key = f"worker-{worker_id}".encode()
+        self.restart_lock = asyncio.Lock()
+
+    def snapshot(self):
+        return {
+            'id': self.id,
+            'pid': self.process.pid if self.process else None,
+            'port': self.port,
+            'state': self.state,
+            'connections': self.connections,
+            'restarts': self.restarts,
+            'failed_probes': self.failed_probes,
+            'health': self.last_health,
+        }
+
+
+class WorkerPool:
+    """Start, probe, restart and stop N copies of the app
+
+    Worker i runs `command` with SERVER_PORT, HEALTH_PORT and ATV_WORKER_ID
+    set, listening on localhost only. It also gets its own LOG_FILE_PREFIX,
+    because several processes rotating one file would corrupt it.
+    Everything else is shared through the environment and the filesystem:
+    the database, the sessions table and the session signing key.
+
+    A worker counts as ready once its health endpoint answers 200 (warmup
+    finished) and its Flet port accepts connections. A background task
+    probes every WORKER_HEALTH_INTERVAL seconds. Workers that exit, fail
+    WORKER_MAX_FAILED_PROBES probes in a row, or never become ready are
+    replaced.
+    """
+
+    def __init__(self, command, count=None, host='127.0.0.1', base_port=None, health_base_port=None, env=None):
+        self.command = list(command)
+        self.host = host
+        self.env = env
+        count = count or AppConfig.WORKERS
+        base_port = base_port or AppConfig.WORKER_BASE_PORT
+        health_base_port = health_base_port or AppConfig.WORKER_HEALTH_BASE_PORT
+        self.workers = [Worker(i, base_port + i, health_base_port + i) for i in range(count)]
+        self._monitor_task = None
+        self._rolling = None
+        self._stopping = False
+        self._tasks = set()  # Restarts started by the monitor; the loop only keeps weak references
+
+    def _worker_env(self, worker):
+        env = dict(os.environ if self.env is None else self.env)
+        env.update(
+            SERVER_HOST=self.host,
+            SERVER_PORT=str(worker.port),
+            HEALTH_PORT=str(worker.health_port),
+            ATV_WORKER_ID=str(worker.id),
+            LOG_FILE_PREFIX=f"{AppConfig.LOG_FILE_PREFIX}-w{worker.id}",
+        )
+        return env
+
+    async def _spawn(self, worker):
+        worker.process = await asyncio.create_subprocess_exec(*self.command, env=self._worker_env(worker))
+        worker.state = 'starting'
+        worker.failed_probes = 0
+        worker.started_at = time.monotonic()
+        logger.info(f"Worker {worker.id} started (pid {worker.process.pid}, port {worker.port})")
+
+    async def _terminate(self, worker):
+        """SIGTERM, then SIGKILL after WORKER_STOP_TIMEOUT"""
+        process = worker.process
+        worker.state = 'stopped'
+        if process is None or process.returncode is not None:
+            return
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), AppConfig.WORKER_STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"Worker {worker.id} ignored SIGTERM; killing it")
+            process.kill()
+            await process.wait()
+
+    async def probe(self, worker):
+        """Health report when the worker is ready to serve, else None"""
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, worker.health_port), _PROBE_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError):
+            return None
+        try:
+            writer.write(f"GET {AppConfig.HEALTH_PATH} HTTP/1.0\r\nHost: {self.host}\r\n\r\n".encode())
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), _PROBE_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        finally:
+            writer.close()
+
+        head, _, body = response.partition(b"\r\n\r\n")
+        try:
+            status = int(head.split(b" ", 2)[1])
+            worker.last_health = json.loads(body)
+        except (IndexError, ValueError):
+            return None
+        if status != 200:
+            return None
+
+        # Warmup can finish before ft.app has bound its port
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(self.host, worker.port), _PROBE_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        writer.close()
+        return worker.last_health
+
+    async def _wait_ready(self, worker, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and not self._stopping:
+            if worker.process.returncode is not None:
+                logger.error(f"Worker {worker.id} exited with code {worker.process.returncode} during startup")
+                return False
+            if await self.probe(worker):
+                worker.state = 'ready'
+                logger.info(f"Worker {worker.id} ready in {time.monotonic() - worker.started_at:.1f}s")
+                return True
+            await asyncio.sleep(0.25)
+        return False
+
+    async def start(self):
+        """Spawn every worker and wait until at least one is ready"""
+        for worker in self.workers:
+            await self._spawn(worker)
+        ready = await asyncio.gather(*(self._wait_ready(w, AppConfig.WORKER_START_TIMEOUT) for w in self.workers))
+        if not any(ready):
+            await self.stop()
+            raise RuntimeError("No worker became healthy")
+        self._monitor_task = asyncio.create_task(self._monitor())
+
+    async def _monitor(self):
+        while not self._stopping:
+            await asyncio.sleep(AppConfig.WORKER_HEALTH_INTERVAL)
+            for worker in self.workers:
+                if worker.restart_lock.locked() or worker.state not in ('starting', 'ready'):
+                    continue  # A restart is already handling it
+                if worker.process.returncode is not None:
+                    logger.error(f"Worker {worker.id} exited with code {worker.process.returncode}; restarting")
+                    self._background(self.restart(worker, drain=False))
+                    continue
+
+                if await self.probe(worker):
+                    worker.failed_probes = 0
+                    if worker.state == 'starting':
+                        worker.state = 'ready'
+                        logger.info(f"Worker {worker.id} ready")
+                    continue
+
+                worker.failed_probes += 1
+                if worker.state == 'ready' and worker.failed_probes >= AppConfig.WORKER_MAX_FAILED_PROBES:
+                    logger.error(f"Worker {worker.id} failed {worker.failed_probes} health checks; restarting")
+                    self._background(self.restart(worker, drain=False))
+                elif worker.state == 'starting' and time.monotonic() - worker.started_at > AppConfig.WORKER_START_TIMEOUT:
+                    logger.error(f"Worker {worker.id} not ready after {AppConfig.WORKER_START_TIMEOUT:.0f}s; restarting")
+                    self._background(self.restart(worker, drain=False))
+
+    def _background(self, coro):
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def restart(self, worker, drain=True):
+        """Replace one worker: stop routing to it, let open connections finish, start a fresh process
+
+        Flet sessions hold their websocket open, so a drain usually runs
+        into WORKER_DRAIN_TIMEOUT. Cut-off browsers reconnect to another
+        worker and resume through their stored session token.
+        """
+        async with worker.restart_lock:
+            worker.state = 'draining'
+            if drain:
+                deadline = time.monotonic() + AppConfig.WORKER_DRAIN_TIMEOUT
+                while worker.connections and time.monotonic() < deadline:
+                    await asyncio.sleep(0.2)
+            await self._terminate(worker)
+            if self._stopping:
+                return False
+            worker.restarts += 1
+            await self._spawn(worker)
+            return await self._wait_ready(worker, AppConfig.WORKER_START_TIMEOUT)
+
+    async def rolling_restart(self):
+        """Restart the workers one at a time while the others keep serving (e.g. after a deploy)"""
+        if self._rolling and not self._rolling.done():
+            logger.info("Rolling restart already in progress")
+            return await self._rolling
+        self._rolling = asyncio.ensure_future(self._rolling_restart())
+        return await self._rolling
+
+    async def _rolling_restart(self):
+        logger.info(f"Rolling restart of {len(self.workers)} workers")
+        for worker in self.workers:
+            if self._stopping:
+                return
+            if not await self.restart(worker):
+                logger.error(f"Rolling restart stopped: worker {worker.id} did not come back")
+                return
+        logger.info("Rolling restart finished")
+
+    async def stop(self):
+        self._stopping = True
+        if self._monitor_task:
+            self._monitor_task.cancel()
+        await asyncio.gather(*(self._terminate(worker) for worker in self.workers))
+        logger.info("All workers stopped")
+
+    def pick(self, client_key):
+        """Ready worker for a client (rendezvous hashing)
+
+        A client keeps its worker for as long as that worker is ready; when
+        one leaves or rejoins, only the clients hashed to it move.
+        """
+        ready = [worker for worker in self.workers if worker.state == 'ready']
+        if not ready:
+            return None
+        key = client_key.encode()
+        return max(ready, key=lambda worker: hashlib.blake2b(key + worker.hash_key, digest_size=8).digest())
+
+    def snapshot(self):
+        return {
+            'ready': sum(1 for worker in self.workers if worker.state == 'ready'),
+            'workers': [worker.snapshot() for worker in self.workers],
+        }
+
+
+class StickyProxy:
+    """Public TCP front end that pins each client IP to one worker
+
+    Only the request head of each new connection is parsed. That is enough
+    to pick a worker, answer HEALTH_PATH with every worker's report, and
+    rewrite X-Forwarded-For so the worker sees the real client IP (the
+    login limiter keys on it). After that, bytes are piped both ways
+    untouched, websocket frames included. Keep-alive requests that follow
+    on the same connection are not rewritten; they already go to the same
+    worker.
+
+    Client-sent X-Forwarded-For headers are dropped, unless
+    PROXY_TRUST_FORWARDED is set because a trusted proxy sits in front.
+    """
+
+    def __init__(self, pool, host=None, port=None, trust_forwarded=None):
+        self.pool = pool
+        self.host = host or AppConfig.SERVER_HOST
+        self.port = port or AppConfig.SERVER_PORT
+        self.trust_forwarded = AppConfig.PROXY_TRUST_FORWARDED if trust_forwarded is None else trust_forwarded
+        self.server = None
+        self.stats = {'connections': 0, 'active': 0, 'rejected': 0, 'health_checks': 0}
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, self.host, self.port, limit=_HEAD_LIMIT)
+        logger.info(f"Proxy listening on http://{self.host}:{self.port} for {len(self.pool.workers)} workers")
+
+    async def close(self):
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def _handle(self, client_reader, client_writer):
+        peer = client_writer.get_extra_info('peername')
+        peer_ip = peer[0] if peer else 'unknown'
+        try:
+            head = await asyncio.wait_for(client_reader.readuntil(b"\r\n\r\n"), _HEAD_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, OSError):
+            client_writer.close()
+            return
+
+        lines = head[:-4].decode('latin-1').split("\r\n")
+        request = lines[0].split(" ")
+        headers = [line for line in lines[1:] if line]
+        path = request[1].split('?', 1)[0] if len(request) > 1 else ''
+        if path == AppConfig.HEALTH_PATH:
+            self.stats['health_checks'] += 1
+            await self._respond_health(client_writer)
+            return
+
+        client_ip = peer_ip
+        if self.trust_forwarded:
+            forwarded = _header(headers, 'x-forwarded-for')
+            if forwarded:
+                client_ip = forwarded.split(',')[0].strip()
+
+        worker = self.pool.pick(client_ip)
+        if worker is None:
+            self.stats['rejected'] += 1
+            await _respond(client_writer, 503, {'status': 'unavailable', 'error': 'no worker is ready'})
+            return
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection(self.pool.host, worker.port)
+        except OSError as e:
+            logger.warning(f"Worker {worker.id} refused a connection: {e}")
+            self.stats['rejected'] += 1
+            await _respond(client_writer, 502, {'status': 'unavailable', 'error': f"worker {worker.id} unreachable"})
+            return
+
+        kept = [line for line in headers if line.split(':', 1)[0].strip().lower() != 'x-forwarded-for']
+        rewritten = "\r\n".join([lines[0], f"X-Forwarded-For: {client_ip}", *kept]) + "\r\n\r\n"
+
+        worker.connections += 1
+        self.stats['connections'] += 1
+        self.stats['active'] += 1
+        try:
+            upstream_writer.write(rewritten.encode('latin-1'))
+            await asyncio.gather(_pipe(client_reader, upstream_writer), _pipe(upstream_reader, client_writer))
+        finally:
+            worker.connections -= 1
+            self.stats['active'] -= 1
+            upstream_writer.close()
+            client_writer.close()
+
+    async def _respond_health(self, writer):
+        report = self.pool.snapshot()
+        report['status'] = 'ok' if report['ready'] else 'unavailable'
+        report['proxy'] = dict(self.stats)
+        await _respond(writer, 200 if report['ready'] else 503, report)
+
+
+def _header(headers, name):
+    for line in headers:
+        key, _, value = line.partition(':')
+        if key.strip().lower() == name:
+            return value.strip()
+    return None
+
+
+async def _respond(writer, status, payload):
+    body = json.dumps(payload, default=str).encode()
+    writer.write(
+        f"HTTP/1.1 {status} {_STATUS_TEXT[status]}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+        f"Cache-Control: no-store\r\nConnection: close\r\n\r\n".encode() + body
+    )
+    try:
+        await writer.drain()
+    except OSError:
+        pass
+    writer.close()
+
+
+async def _pipe(reader, writer):
+    """Copy bytes until EOF, then pass the half-close on"""
+    try:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except OSError:
+        pass
+    finally:
+        try:
+            if writer.can_write_eof():
+                writer.write_eof()
+        except OSError:
+            pass
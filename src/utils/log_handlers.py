@@ -0,0 +1,237 @@
+"""
+Logging handlers used by ATVLogger
+"""
+import glob
+import gzip
+import json
+import logging
+import os
+import queue
+import re
+import shutil
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta, timezone
+from logging.handlers import BaseRotatingHandler, QueueHandler, QueueListener
+
+# Ids bound by log_context and stamped onto records by ContextFilter
+_session_id = ContextVar('log_session_id', default=None)
+_request_id = ContextVar('log_request_id', default=None)
+
+# <prefix>_YYYYMMDD[.n].log[.gz]; files from before rotation have no .n
+_ARCHIVE_NAME = re.compile(r'_(\d{8})(?:\.(\d+))?\.log(?:\.gz)?$')
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler for a bounded queue that drops records instead of blocking
+
+    When the listener falls behind (e.g. a slow disk) and the queue is
+    full, the record is discarded and counted. The next record that fits
+    is preceded by a warning saying how many were lost.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self._lock = threading.Lock()
+        self.dropped = 0
+        self._unreported = 0
+
+    def enqueue(self, record):
+        try:
+            if self._unreported:
+                self._report_drops(record)
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                self._unreported += 1
+
+    def _report_drops(self, record):
+        with self._lock:
+            count, self._unreported = self._unreported, 0
+        notice = logging.LogRecord(
+            record.name, logging.WARNING, __file__, 0,
+            f"Log queue full; dropped {count} records", None, None,
+        )
+        try:
+            self.queue.put_nowait(notice)
+        except queue.Full:
+            with self._lock:
+                self._unreported += count
+            raise
+
+
+class DrainingQueueListener(QueueListener):
+    """QueueListener whose stop() waits for a full queue to drain instead of raising"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class RollingFileHandler(BaseRotatingHandler):
+    """Writes <directory>/<prefix>.log, rolling it over at midnight or at max_bytes
+
+    Rolled files are renamed <prefix>_YYYYMMDD.<n>.log after the day they
+    cover, then gzipped and pruned on a background thread: archives older
+    than retention_days are deleted, and at most backup_count are kept
+    (0 disables either limit). The size check uses the current file size,
+    so a file can overshoot max_bytes by one record.
+    """
+
+    def __init__(self, directory, prefix="atv", max_bytes=0, retention_days=0, backup_count=0,
+                 compress=True, encoding='utf-8'):
+        os.makedirs(directory, exist_ok=True)
+        super().__init__(os.path.join(directory, f"{prefix}.log"), 'a', encoding=encoding, delay=True)
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.retention_days = retention_days
+        self.backup_count = backup_count
+        self.compress = compress
+        self._archive_lock = threading.Lock()
+
+        # A file left over from an earlier day rolls on its first new record
+        if os.path.exists(self.baseFilename):
+            self._start_period(os.path.getmtime(self.baseFilename))
+        else:
+            self._start_period(time.time())
+        self._schedule_archive()
+
+    def _start_period(self, timestamp):
+        self._period = date.fromtimestamp(timestamp)
+        next_day = datetime.combine(self._period + timedelta(days=1), datetime.min.time())
+        self._rollover_at = next_day.timestamp()
+
+    def shouldRollover(self, record):
+        if record.created >= self._rollover_at:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.seek(0, os.SEEK_END)
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            os.replace(self.baseFilename, self._rolled_name())
+            self._schedule_archive()
+        self._start_period(time.time())
+
+    def _rolled_name(self):
+        """Next free <prefix>_YYYYMMDD.<n>.log; n keeps growing so names sort by age even after pruning"""
+        stem = os.path.join(self.directory, f"{self.prefix}_{self._period.strftime('%Y%m%d')}")
+        numbers = [_archive_order(path)[1] for path in glob.glob(f"{glob.escape(stem)}.*.log*")]
+        return f"{stem}.{max(numbers, default=0) + 1}.log"
+
+    def _schedule_archive(self):
+        threading.Thread(target=self._archive, name="log-archiver", daemon=True).start()
+
+    def _archive(self):
+        """Compress rolled files, then apply the retention limits"""
+        with self._archive_lock:
+            try:
+                if self.compress:
+                    for path in self._archives():
+                        if not path.endswith('.gz'):
+                            _gzip_file(path)
+                self._prune()
+            except OSError as e:
+                # The logger cannot log its own failures; report on stderr
+                sys.stderr.write(f"Log archive error: {e}\n")
+
+    def _archives(self):
+        """Rolled files, oldest first (including atv_YYYYMMDD.log files from older versions)"""
+        paths = glob.glob(os.path.join(glob.escape(self.directory), f"{glob.escape(self.prefix)}_*.log*"))
+        return sorted((p for p in paths if not p.endswith('.tmp')), key=_archive_order)
+
+    def _prune(self):
+        archives = self._archives()
+        expired = []
+        if self.retention_days > 0:
+            cutoff = time.time() - self.retention_days * 86400
+            expired = [path for path in archives if os.path.getmtime(path) < cutoff]
+        kept = [path for path in archives if path not in expired]
+        if self.backup_count > 0 and len(kept) > self.backup_count:
+            expired.extend(kept[:len(kept) - self.backup_count])
+        for path in expired:
+            os.remove(path)
+
+
+class ContextFilter(logging.Filter):
+    """Stamp records with the session and request ids bound by log_context
+
+    Runs on the calling thread, before records are queued, so the ids
+    survive the hop to the listener thread. Ids passed explicitly via
+    `extra` win.
+    """
+
+    def filter(self, record):
+        if getattr(record, 'session_id', None) is None:
+            record.session_id = _session_id.get()
+        if getattr(record, 'request_id', None) is None:
+            record.request_id = _request_id.get()
+        return True
+
+
+@contextmanager
+def log_context(session_id=None, request_id=None):
+    """Bind ids to every record logged inside the block on this thread
+
+    Always scope it with `with`: pool threads are reused across sessions,
+    so a binding that is never reset would leak into another session's logs.
+    """
+    tokens = []
+    if session_id is not None:
+        tokens.append((_session_id, _session_id.set(session_id)))
+    if request_id is not None:
+        tokens.append((_request_id, _request_id.set(request_id)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line, for bulk ingestion"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        session_id = getattr(record, 'session_id', None)
+        if session_id is not None:
+            entry['session_id'] = session_id
+        request_id = getattr(record, 'request_id', None)
+        if request_id is not None:
+            entry['request_id'] = request_id
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _archive_order(path):
+    """Sort key: the day in the name, then the rollover number (several rolls share an mtime second)"""
+    match = _ARCHIVE_NAME.search(os.path.basename(path))
+    if match is None:
+        return ('', 0, os.path.getmtime(path))
+    return (match.group(1), int(match.group(2) or 0), 0)
+
+
+def _gzip_file(path):
+    tmp_path = f"{path}.gz.tmp"
+    with open(path, 'rb') as source, gzip.open(tmp_path, 'wb') as target:
+        shutil.copyfileobj(source, target)
+    shutil.copystat(path, tmp_path)  # Keep the mtime retention is based on
+    os.replace(tmp_path, f"{path}.gz")
+    os.remove(path)
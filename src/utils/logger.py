@@ -1,34 +1,56 @@
 """
 Logging utility for ATV application
 """
+import atexit
 import logging
-import os
-from datetime import datetime
+import queue
+
+from config.app_config import AppConfig
+from utils.log_handlers import (
+    ContextFilter,
+    DrainingQueueListener,
+    DroppingQueueHandler,
+    JsonLinesFormatter,
+    RollingFileHandler,
+    log_context,
+)
 
 class ATVLogger:
-    """ATV application logger configuration"""
+    """ATV application logger configuration
+    
+    With LOG_ASYNC (the default) callers only enqueue records; a single
+    QueueListener thread formats them and does the console/file I/O, so a
+    slow disk never stalls request handling. The queue is bounded: when
+    it is full new records are dropped and counted (see get_stats).
+    
+    Keyword arguments to the level methods (e.g. session_id=...) are
+    attached to the record; LOG_FORMAT=json writes them to the file.
+    """
     
     def __init__(self, name="ATV", level=logging.INFO):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
+        self.queue_handler = None
+        self.listener = None
         
         # Prevent duplicate handlers
         if not self.logger.handlers:
             self._setup_handlers()
     
-    def _setup_handlers(self):
-        """Setup logging handlers"""
+    def _create_handlers(self):
+        """Create the console and file handlers that do the actual output"""
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         
-        # File handler for errors
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        file_handler = logging.FileHandler(
-            os.path.join(log_dir, f"atv_{datetime.now().strftime('%Y%m%d')}.log")
+        # File handler, rolled daily and by size, old files gzipped and pruned
+        file_handler = RollingFileHandler(
+            AppConfig.LOG_DIR,
+            prefix=AppConfig.LOG_FILE_PREFIX,
+            max_bytes=AppConfig.LOG_MAX_BYTES,
+            retention_days=AppConfig.LOG_RETENTION_DAYS,
+            backup_count=AppConfig.LOG_BACKUP_COUNT,
+            compress=AppConfig.LOG_COMPRESS,
         )
         file_handler.setLevel(logging.DEBUG)
         
@@ -37,30 +59,68 @@ class ATVLogger:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         console_handler.setFormatter(formatter)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(JsonLinesFormatter() if AppConfig.LOG_FORMAT == 'json' else formatter)
+        
+        return [console_handler, file_handler]
+    
+    def _setup_handlers(self):
+        """Setup logging handlers, behind a queue unless LOG_ASYNC is off"""
+        handlers = self._create_handlers()
+        
+        if not AppConfig.LOG_ASYNC:
+            for handler in handlers:
+                handler.addFilter(ContextFilter())
+                self.logger.addHandler(handler)
+            return
         
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        log_queue = queue.Queue(maxsize=AppConfig.LOG_QUEUE_SIZE)
+        self.queue_handler = DroppingQueueHandler(log_queue)
+        # Ids are read on the calling thread, before the record is queued
+        self.queue_handler.addFilter(ContextFilter())
+        self.listener = DrainingQueueListener(log_queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        self.logger.addHandler(self.queue_handler)
+        
+        # Write out whatever is still queued when the process exits
+        atexit.register(self.stop)
+    
+    def stop(self):
+        """Flush queued records and stop the listener thread"""
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+    
+    def get_stats(self):
+        """Queue depth and drop count for the async pipeline"""
+        if self.queue_handler is None:
+            return {'mode': 'sync'}
+        log_queue = self.queue_handler.queue
+        return {
+            'mode': 'async',
+            'queued': log_queue.qsize(),
+            'queue_size': log_queue.maxsize,
+            'dropped': self.queue_handler.dropped,
+        }
     
-    def debug(self, message):
+    def debug(self, message, **context):
         """Debug level logging"""
-        self.logger.debug(message)
+        self.logger.debug(message, extra=context or None)
     
-    def info(self, message):
+    def info(self, message, **context):
         """Info level logging"""
-        self.logger.info(message)
+        self.logger.info(message, extra=context or None)
     
-    def warning(self, message):
+    def warning(self, message, **context):
         """Warning level logging"""
-        self.logger.warning(message)
+        self.logger.warning(message, extra=context or None)
     
-    def error(self, message):
+    def error(self, message, **context):
         """Error level logging"""
-        self.logger.error(message)
+        self.logger.error(message, extra=context or None)
     
-    def critical(self, message):
+    def critical(self, message, **context):
         """Critical level logging"""
-        self.logger.critical(message)
+        self.logger.critical(message, extra=context or None)
 
 # Global logger instance
 logger = ATVLogger()
\ No newline at end of file
@@ -0,0 +1,57 @@
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+class FakeSession(dict):
+    def set(self, key, value):
+        self[key] = value
+
+
+class FakeClientStorage(dict):
+    def set(self, key, value):
+        self[key] = value
+
+    def remove(self, key):
+        self.pop(key, None)
+
+
+class FakePage:
+    """Just enough of ft.Page to build pages without a Flet server"""
+
+    session_id = "test-session"
+    client_ip = "127.0.0.1"
+
+    def __init__(self):
+        self.session = FakeSession()
+        self.client_storage = FakeClientStorage()
+        self.controls = []
+        self.updates = 0
+
+    def add(self, *controls):
+        self.controls.extend(controls)
+
+    def clean(self):
+        self.controls.clear()
+
+    def update(self, *controls):
+        self.updates += 1
+
+    def run_thread(self, handler, *args):
+        handler(*args)
+
+
+def walk(control):
+    """Yield a control and everything nested under it"""
+    yield control
+    for child in control._get_children():
+        yield from walk(child)
+
+
+@pytest.fixture
+def fake_page():
+    return FakePage()
@@ -0,0 +1,112 @@
+"""
+PostgreSQL stand-in for the repository conformance suite
+
+Runs the real PostgresDriver (format-style placeholders, RETURNING id,
+dict rows, psycopg2.IntegrityError) against a SQLite file. Rows come back
+with the types psycopg2 produces (bool, Decimal, datetime), so
+normalize_row is exercised the same way a live server would exercise it.
+"""
+import sqlite3
+from datetime import datetime
+from decimal import Decimal
+
+import psycopg2
+
+from services.database.base_manager import BaseDatabaseManager
+from services.database.repository import BOOLEAN_COLUMNS, PostgresDriver
+from services.database.sqlite_manager import SQLiteManager
+from services.database.user_cache import UserCache
+
+DECIMAL_COLUMNS = {
+    'account_balance', 'investment_amount', 'payout_amount', 'profit_target', 'stop_loss',
+    'total_profit', 'entry_price', 'exit_price',
+}
+TIMESTAMP_COLUMNS = {'created_at', 'updated_at'}
+
+
+def _postgres_value(key, value):
+    if value is None:
+        return None
+    if key in BOOLEAN_COLUMNS:
+        return bool(value)
+    if key in DECIMAL_COLUMNS:
+        return Decimal(str(value))
+    if key in TIMESTAMP_COLUMNS:
+        return datetime.fromisoformat(value)
+    return value
+
+
+class StandInCursor:
+    def __init__(self, conn):
+        self._cursor = conn.cursor()
+
+    def execute(self, sql, params=()):
+        # The driver must have translated every qmark; a leftover ? means it did not
+        assert '?' not in sql, f"untranslated placeholder in {sql!r}"
+        try:
+            self._cursor.execute(sql.replace('%s', '?').replace('%%', '%'), params)
+        except sqlite3.IntegrityError as e:
+            raise psycopg2.IntegrityError(str(e)) from e
+
+    def _row(self, row):
+        if row is None:
+            return None
+        names = [column[0] for column in self._cursor.description]
+        return {name: _postgres_value(name, value) for name, value in zip(names, row)}
+
+    def fetchone(self):
+        return self._row(self._cursor.fetchone())
+
+    def fetchall(self):
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def close(self):
+        self._cursor.close()
+
+
+class StandInConnection:
+    def __init__(self, db_path):
+        self._conn = sqlite3.connect(db_path)
+        self.closed = 0
+
+    def cursor(self, cursor_factory=None):
+        return StandInCursor(self._conn)
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        self._conn.close()
+        self.closed = 1
+
+
+class PostgresStandInManager(BaseDatabaseManager):
+    backend = 'postgres'
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.user_cache = UserCache()
+        self._init_repository()
+
+    def _create_driver(self):
+        driver = PostgresDriver(self)
+        # execute_batch builds one multi-statement string with mogrify; run the rows one by one instead
+        driver._execute_batch = lambda cursor, sql, rows, page_size: [cursor.execute(sql, row) for row in rows]
+        return driver
+
+    def init_db(self):
+        # Same tables and indexes, created with the SQLite DDL
+        SQLiteManager(self.db_path).init_db()
+
+    def get_connection(self):
+        return StandInConnection(self.db_path)
+
+    def release_connection(self, conn):
+        conn.close()
@@ -0,0 +1,51 @@
+from concurrent.futures import Future
+
+import flet as ft
+import pytest
+
+from config.app_config import AppConfig
+from conftest import walk
+from core.pages import auth_handler
+from core.pages.auth_handler import AuthHandler
+
+
+@pytest.fixture
+def login_form(fake_page, monkeypatch):
+    user = {'id': 7, 'email': 'trader@example.com'}
+    sessions = []
+
+    def authenticate(db_manager, email, password, client_ip):
+        future = Future()
+        future.set_result(user)
+        return future
+
+    monkeypatch.setattr(auth_handler.auth_service, 'authenticate', authenticate)
+    monkeypatch.setattr(auth_handler.session_store, 'create',
+                        lambda db_manager, user_id, remember=False: sessions.append((user_id, remember)) or "token")
+
+    handler = AuthHandler(fake_page, lambda user: None, db_manager=object())
+    handler.show_login()
+    controls = [control for root in fake_page.controls for control in walk(root)]
+    fields = [control for control in controls if isinstance(control, ft.TextField)]
+    fields[0].value = user['email']
+    fields[1].value = "correct-password"
+    checkbox = next(control for control in controls if isinstance(control, ft.Checkbox))
+    login = next(control for control in controls
+                 if isinstance(control, ft.TextButton) and getattr(control.on_click, '__name__', '') == 'handle_login')
+    return checkbox, login, sessions, fake_page
+
+
+@pytest.mark.parametrize("checked", [True, False])
+def test_remember_me_checkbox_sets_session_lifetime(login_form, checked):
+    checkbox, login, sessions, page = login_form
+    checkbox.value = checked
+
+    login.on_click(None)
+
+    assert sessions == [(7, checked)]
+    assert page.client_storage[AppConfig.SESSION_STORAGE_KEY] == "token"
+
+
+def test_login_form_has_one_remember_me_checkbox(login_form, fake_page):
+    checkboxes = [control for root in fake_page.controls for control in walk(root) if isinstance(control, ft.Checkbox)]
+    assert len(checkboxes) == 1
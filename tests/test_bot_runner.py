@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from services.bot_runner import BotRunner
+from services.brokers import SimulatedBroker
+from services.database.sqlite_manager import SQLiteManager
+
+FAST = dict(tick_interval=0.01, trade_duration=0.01, flush_interval=0.05, reload_interval=0.05)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    db_manager = SQLiteManager(str(tmp_path / "bots.db"))
+    db_manager.init_db()
+    return db_manager
+
+
+@pytest.fixture
+def user_id(db_manager):
+    return db_manager.repository.create_user({'email': 'bots@example.com'}, 'hash', seed_accounts=False)
+
+
+def create_bot(db_manager, user_id, **fields):
+    return db_manager.repository.create_bot({
+        'user_id': user_id,
+        'bot_name': 'Test Bot',
+        'broker_name': 'Binomo',
+        'strategy_type': 'trend',
+        'is_active': True,
+        'investment_amount': 1.0,
+        **fields,
+    })
+
+
+def run_until(db_manager, done, timeout=5.0, broker_seed=1):
+    """Run a BotRunner until done(runner) is true, returns the stopped runner"""
+    runner = BotRunner(broker=SimulatedBroker(seed=broker_seed, volatility=0.01), **FAST)
+
+    async def main():
+        task = asyncio.create_task(runner.run(db_manager))
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not done(runner) and asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(0.02)
+        runner.stop()
+        await task
+
+    asyncio.run(main())
+    return runner
+
+
+def bot_row(db_manager, bot_id):
+    return next(bot for bot in db_manager.repository._fetch_all("SELECT * FROM trading_bots") if bot['id'] == bot_id)
+
+
+def history_rows(db_manager, bot_id):
+    return db_manager.repository._fetch_all("SELECT * FROM trading_history WHERE bot_id = ?", (bot_id,))
+
+
+def test_limit_reached_stops_bot_and_persists_it(db_manager, user_id):
+    # A win (+0.85) passes the target and a loss (-1) hits the stop loss, so one settled trade ends the run
+    bot_id = create_bot(db_manager, user_id, profit_target=0.5, stop_loss=1.0)
+
+    runner = run_until(db_manager, lambda r: not bot_row(db_manager, bot_id)['is_active'])
+
+    bot = bot_row(db_manager, bot_id)
+    assert bot['is_active'] is False
+    assert runner.stats['stopped_profit_target'] + runner.stats['stopped_stop_loss'] == 1
+    decided = [trade for trade in history_rows(db_manager, bot_id) if trade['result'] != 'draw']
+    assert len(decided) == 1
+    reason = 'stopped_profit_target' if decided[0]['result'] == 'win' else 'stopped_stop_loss'
+    assert runner.stats[reason] == 1
+    assert -1.0 <= bot['total_profit'] <= 0.85
+
+
+@pytest.mark.parametrize("total_profit, reason", [(-50.0, 'stopped_stop_loss'), (100.0, 'stopped_profit_target')])
+def test_restart_keeps_the_persisted_profit(db_manager, user_id, total_profit, reason):
+    bot_id = create_bot(db_manager, user_id, profit_target=100.0, stop_loss=50.0)
+    db_manager.repository._execute("UPDATE trading_bots SET total_profit = ? WHERE id = ?", (total_profit, bot_id))
+
+    runner = run_until(db_manager, lambda r: not bot_row(db_manager, bot_id)['is_active'])
+
+    assert runner.stats[reason] == 1
+    assert runner.stats['trades'] == 0
+    assert bot_row(db_manager, bot_id)['is_active'] is False
+    assert history_rows(db_manager, bot_id) == []
+
+
+def test_stake_is_capped_by_the_remaining_loss_budget(db_manager, user_id):
+    bot_id = create_bot(db_manager, user_id, investment_amount=10.0, profit_target=1000.0, stop_loss=50.0)
+    db_manager.repository._execute("UPDATE trading_bots SET total_profit = -47.5 WHERE id = ?", (bot_id,))
+
+    run_until(db_manager, lambda r: r.stats['trades'] >= 1 and not r._trades)
+
+    first = history_rows(db_manager, bot_id)[0]
+    assert first['investment_amount'] == 2.5
+
+
+def test_batched_flushes_write_every_trade(db_manager, user_id):
+    bot_ids = [create_bot(db_manager, user_id, strategy_type=strategy, profit_target=1000.0, stop_loss=1000.0)
+               for strategy in ('trend', 'reversal', 'martingale') * 4]
+
+    runner = run_until(db_manager, lambda r: r.stats['trades'] >= 100, timeout=10.0)
+
+    assert runner.stats['trades'] >= 100
+    assert runner.stats['written'] == runner.stats['trades']
+    assert runner.stats['write_errors'] == 0
+    for bot_id in bot_ids:
+        trades = history_rows(db_manager, bot_id)
+        bot = bot_row(db_manager, bot_id)
+        assert bot['total_trades'] == len(trades)
+        assert bot['winning_trades'] == sum(trade['result'] == 'win' for trade in trades)
+        assert bot['total_profit'] == pytest.approx(sum(t['payout_amount'] - t['investment_amount'] for t in trades))
@@ -0,0 +1,92 @@
+"""
+Dashboard tabs stay in step with the bots and trades the bot runner writes
+"""
+import pytest
+
+from conftest import walk
+from core.pages import dashboard as dashboard_module
+from core.pages.dashboard import Dashboard
+from core.pages.history_view import HistoryRow
+from services.database.sqlite_manager import SQLiteManager
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    db_manager = SQLiteManager(str(tmp_path / "dashboard.db"))
+    db_manager.init_db()
+    return db_manager
+
+
+@pytest.fixture
+def dashboard(fake_page, db_manager, monkeypatch):
+    monkeypatch.setattr(dashboard_module.bot_runner, 'request_reload', lambda: None)
+    user_id = db_manager.repository.create_user({'email': 'dash@example.com'}, 'hash', seed_accounts=False)
+    dashboard = Dashboard(fake_page, {'id': user_id, 'email': 'dash@example.com'}, db_manager=db_manager)
+    dashboard.build()
+    return dashboard
+
+
+def broker_status(dashboard, broker_name):
+    status_text, status_switch = dashboard.broker_controls[broker_name]
+    return status_text.value, status_switch.value
+
+
+def history_pairs(dashboard):
+    view = dashboard.router.views["history"]
+    return [control.asset_pair.value for control in walk(view) if isinstance(control, HistoryRow)]
+
+
+def add_trade(dashboard, asset_pair):
+    dashboard.db_manager.repository.add_trade({
+        'user_id': dashboard.user_data['id'],
+        'broker_name': 'Binomo',
+        'asset_pair': asset_pair,
+        'trade_type': 'call',
+        'investment_amount': 1.0,
+    })
+
+
+def test_toggle_updates_the_label(dashboard):
+    assert broker_status(dashboard, 'Binomo') == ("Tidak Aktif", False)
+
+    dashboard.toggle_broker('Binomo', True)
+    assert broker_status(dashboard, 'Binomo') == ("Aktif", True)
+    assert dashboard.get_active_brokers() == {'Binomo'}
+
+    dashboard.toggle_broker('Binomo', False)
+    assert broker_status(dashboard, 'Binomo') == ("Tidak Aktif", False)
+
+
+def test_failed_toggle_rolls_the_switch_back(dashboard, monkeypatch):
+    def fail(*args):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(dashboard.db_manager.repository, 'set_broker_bots_active', fail)
+    dashboard.toggle_broker('Quotex', True)
+    assert broker_status(dashboard, 'Quotex') == ("Tidak Aktif", False)
+
+
+def test_home_tab_shows_bots_stopped_elsewhere(dashboard):
+    dashboard.toggle_broker('Binomo', True)
+    dashboard.switch_tab("profile")
+
+    # The bot runner stops the bot when it hits a limit
+    bot, = dashboard.db_manager.repository.get_user_bots(dashboard.user_data['id'])
+    dashboard.db_manager.repository.set_bot_active(bot['id'], False)
+
+    home = dashboard.router.views["beranda"]
+    dashboard.switch_tab("beranda")
+    assert dashboard.router.views["beranda"] is home  # Still cached, only refreshed
+    assert broker_status(dashboard, 'Binomo') == ("Tidak Aktif", False)
+
+
+def test_history_tab_shows_new_trades(dashboard):
+    add_trade(dashboard, "EUR/USD")
+    dashboard.switch_tab("history")
+    assert history_pairs(dashboard) == ["EUR/USD"]
+
+    dashboard.switch_tab("beranda")
+    add_trade(dashboard, "GBP/USD")
+    dashboard.switch_tab("history")
+    assert history_pairs(dashboard) == ["GBP/USD", "EUR/USD"]
+    assert len(dashboard.router.container.controls) == 2
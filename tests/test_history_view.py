@@ -0,0 +1,144 @@
+import pytest
+
+from core.pages.history_view import HistoryRow, TradingHistoryView
+from services.database.sqlite_manager import SQLiteManager
+from services.database.trade_ingest import TradeHistoryIngestor
+
+PAGE_SIZE = 10
+WINDOW_PAGES = 3
+TRADES = 250
+
+
+@pytest.fixture(scope="module")
+def history(tmp_path_factory):
+    """(repository, user_id) with TRADES trades, all created in the same second"""
+    db_manager = SQLiteManager(str(tmp_path_factory.mktemp("history") / "history.db"))
+    db_manager.init_db()
+    user_id = db_manager.repository.create_user({'email': 'history@example.com'}, 'hash', seed_accounts=False)
+    TradeHistoryIngestor(db_manager).ingest({
+        'user_id': user_id,
+        'broker_name': 'Binomo',
+        'asset_pair': f"PAIR{i}",
+        'trade_type': 'call',
+        'investment_amount': 1.0,
+        'payout_amount': 1.85 if i % 2 else 0.0,
+        'result': 'win' if i % 2 else 'loss',
+    } for i in range(TRADES))
+    return db_manager.repository, user_id
+
+
+def shown_pairs(view):
+    return [row.asset_pair.value for row in view.rows]
+
+
+def test_control_count_stays_bounded_while_paging(history):
+    view = TradingHistoryView(None, *history, page_size=PAGE_SIZE, window_pages=WINDOW_PAGES)
+    view.build()
+    created = set(map(id, view.rows))
+
+    pages = 1
+    while not view._exhausted:
+        view.load_next_page(update=False)
+        pages += 1
+        assert len(view.rows) <= PAGE_SIZE * WINDOW_PAGES
+        assert len(view.list_view.controls) <= PAGE_SIZE * WINDOW_PAGES + 2
+        created.update(map(id, view.rows))
+
+    assert pages >= TRADES // PAGE_SIZE
+    assert shown_pairs(view)[-1] == "PAIR0"
+    assert view.list_view.controls[0] is view.header
+    # Dropped rows are refilled instead of new ones being built for every page
+    assert len(created) <= PAGE_SIZE * (WINDOW_PAGES + 2)
+
+
+def test_scrolling_back_refetches_dropped_rows(history):
+    view = TradingHistoryView(None, *history, page_size=PAGE_SIZE, window_pages=WINDOW_PAGES)
+    view.build()
+    for _ in range(WINDOW_PAGES - 1):
+        view.load_next_page(update=False)
+    first_window = shown_pairs(view)
+    for _ in range(5):
+        view.load_next_page(update=False)
+
+    while view._has_newer:
+        view.load_previous_page(update=False)
+        assert len(view.list_view.controls) <= PAGE_SIZE * WINDOW_PAGES + 2
+
+    assert shown_pairs(view) == first_window
+    assert shown_pairs(view)[0] == f"PAIR{TRADES - 1}"
+    assert view.list_view.controls[0] is view.rows[0]
+    assert view.list_view.controls[-1] is view.footer
+
+
+def test_row_is_refilled_in_place():
+    row = HistoryRow(TradingHistoryView(None, None, None).styles)
+    trade = {'id': 1, 'created_at': '2026-01-01 10:00:00', 'asset_pair': 'EUR/USD', 'broker_name': 'Binomo',
+             'result': 'win', 'investment_amount': 10.0, 'payout_amount': 18.5}
+
+    assert row.show(trade) is row
+    assert row.amount.value == "+$8.50"
+    row.show({**trade, 'id': 2, 'asset_pair': 'GBP/USD', 'result': 'loss'})
+    assert (row.trade_key, row.asset_pair.value, row.amount.value) == (('2026-01-01 10:00:00', 2), 'GBP/USD', "-$10.00")
+
+
+def test_draw_has_its_own_label():
+    row = HistoryRow(TradingHistoryView(None, None, None).styles)
+    trade = {'id': 1, 'created_at': '2026-01-01 10:00:00', 'asset_pair': 'EUR/USD', 'broker_name': 'Binomo',
+             'result': 'draw', 'investment_amount': 10.0, 'payout_amount': 10.0}
+
+    draw = row.show(trade).amount.value
+    pending = row.show({**trade, 'result': 'pending'}).amount.value
+
+    assert draw == "Draw"
+    assert draw != pending
+
+
+class FlakyRepository:
+    """Fails the next `failures` page queries, then delegates"""
+
+    def __init__(self, repository):
+        self.repository = repository
+        self.failures = 0
+
+    def _query(self, name, *args):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database is locked")
+        return getattr(self.repository, name)(*args)
+
+    def get_trades_page(self, *args):
+        return self._query('get_trades_page', *args)
+
+    def get_trades_page_after(self, *args):
+        return self._query('get_trades_page_after', *args)
+
+
+def test_failed_fetch_keeps_paging_for_a_retry(history):
+    flaky = FlakyRepository(history[0])
+    view = TradingHistoryView(None, flaky, history[1], page_size=PAGE_SIZE, window_pages=2)
+
+    flaky.failures = 1
+    view.build()
+    assert view.rows == [] and not view._exhausted
+    assert view.list_view.controls == [view.footer]
+
+    view.load_next_page(update=False)
+    first_page = shown_pairs(view)
+    assert len(first_page) == PAGE_SIZE
+
+    flaky.failures = 1
+    view.load_next_page(update=False)
+    assert shown_pairs(view) == first_page and not view._exhausted
+    assert view.list_view.controls[-1] is view.footer
+
+    view.load_next_page(update=False)
+    view.load_next_page(update=False)
+    assert view._has_newer
+    top = view.rows[0].trade_key
+
+    flaky.failures = 1
+    view.load_previous_page(update=False)
+    assert view._has_newer and view.rows[0].trade_key == top
+
+    view.load_previous_page(update=False)
+    assert shown_pairs(view)[:PAGE_SIZE] == first_page
@@ -0,0 +1,49 @@
+"""
+Cold-start regression test for the app entry point (see tools/import_profile.py)
+"""
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+from config.app_config import AppConfig
+from core import pages
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+@pytest.fixture(scope="module")
+def import_profile():
+    spec = importlib.util.spec_from_file_location("import_profile", os.path.join(ROOT, 'tools', 'import_profile.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_lazy_modules_cover_every_page(import_profile):
+    assert set(pages._PAGES.values()) <= set(import_profile.LAZY_MODULES)
+
+
+def test_app_import_stays_within_budget(import_profile):
+    import_profile.profile_once('app')  # Untimed run so bytecode caches exist
+    runs = [import_profile.summarize(import_profile.profile_once('app'), 'app') for _ in range(3)]
+    total_ms = statistics.median(total for total, _ in runs)
+    own_ms = statistics.median(own for _, own in runs)
+
+    assert total_ms < AppConfig.IMPORT_BUDGET_MS
+    assert own_ms < AppConfig.IMPORT_OWN_BUDGET_MS
+
+
+def test_app_import_leaves_lazy_modules_unloaded(import_profile):
+    script = (
+        "import json, sys\n"
+        "import app\n"
+        f"print(json.dumps([name for name in {import_profile.LAZY_MODULES!r} if name in sys.modules]))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert json.loads(result.stdout.splitlines()[-1]) == []
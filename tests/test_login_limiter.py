@@ -0,0 +1,216 @@
+"""
+Login limiter: token refill, lockout escalation, persistence and the auth service hand-off
+"""
+import sqlite3
+from concurrent.futures import Future
+
+import pytest
+
+from services import auth_service as auth_service_module
+from services import login_limiter as login_limiter_module
+from services.auth_service import AuthService, AuthServiceOverloaded
+from services.login_limiter import LoginRateLimited, LoginRateLimiter
+
+
+class FakeClock:
+    """Stands in for the time module so refill and lockout windows pass instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.wall = 1_700_000_000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.wall
+
+    def advance(self, seconds):
+        self.now += seconds
+        self.wall += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(login_limiter_module, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def limiter(clock):
+    limiter = LoginRateLimiter(db_path='')
+    limiter.policies['email'].burst = 3
+    limiter.policies['email'].rate = 1.0  # One token a second
+    limiter.policies['email'].failure_threshold = 3
+    limiter.lockout_base = 30
+    limiter.lockout_max = 100
+    return limiter
+
+
+def fail(limiter, email, times):
+    for _ in range(times):
+        limiter.acquire(email)
+        limiter.record(email)
+
+
+def test_bucket_empties_and_refills(limiter, clock):
+    for _ in range(3):
+        limiter.acquire('user@example.com')
+    with pytest.raises(LoginRateLimited) as exc:
+        limiter.acquire('user@example.com')
+    assert exc.value.retry_after == pytest.approx(1.0)
+
+    clock.advance(1.0)
+    limiter.acquire('user@example.com')
+    with pytest.raises(LoginRateLimited):
+        limiter.acquire('user@example.com')
+
+    # Refill stops at the burst
+    clock.advance(60)
+    for _ in range(3):
+        limiter.acquire('user@example.com')
+    with pytest.raises(LoginRateLimited):
+        limiter.acquire('user@example.com')
+
+
+def test_failures_lock_the_email_with_growing_lockouts(limiter, clock):
+    fail(limiter, 'user@example.com', 3)
+    with pytest.raises(LoginRateLimited) as exc:
+        limiter.acquire('user@example.com')
+    assert exc.value.reason == "locked for this email"
+    assert exc.value.retry_after == pytest.approx(30)
+    # Other emails are unaffected
+    limiter.acquire('other@example.com')
+
+    clock.advance(31)
+    fail(limiter, 'user@example.com', 3)
+    with pytest.raises(LoginRateLimited) as exc:
+        limiter.acquire('user@example.com')
+    assert exc.value.retry_after == pytest.approx(60)
+
+    clock.advance(61)
+    fail(limiter, 'user@example.com', 3)
+    with pytest.raises(LoginRateLimited) as exc:
+        limiter.acquire('user@example.com')
+    assert exc.value.retry_after == pytest.approx(100)  # Capped at lockout_max
+    assert limiter.get_stats()['lockouts'] == 3
+
+
+def test_success_clears_failures(limiter, clock):
+    fail(limiter, 'user@example.com', 2)
+    limiter.acquire('user@example.com')
+    limiter.record('user@example.com', success=True)
+    clock.advance(10)
+    fail(limiter, 'user@example.com', 2)
+    limiter.acquire('user@example.com')  # Two failures since the success, below the threshold
+
+
+def test_failures_outside_the_window_do_not_count(limiter, clock):
+    fail(limiter, 'user@example.com', 2)
+    clock.advance(limiter.failure_window + 1)
+    fail(limiter, 'user@example.com', 2)
+    limiter.acquire('user@example.com')
+
+
+def test_release_returns_the_token(limiter):
+    for _ in range(3):
+        limiter.acquire('user@example.com')
+        limiter.release('user@example.com')
+    limiter.acquire('user@example.com')
+    assert limiter.get_stats()['released'] == 3
+    assert limiter.get_stats()['failures'] == 0
+
+
+def test_lockout_survives_a_restart(limiter, clock, tmp_path):
+    db_path = str(tmp_path / "lockouts.db")
+    first = LoginRateLimiter(db_path=db_path)
+    first.policies = limiter.policies
+    first.lockout_base = 30
+    fail(first, 'user@example.com', 3)
+
+    clock.advance(10)
+    second = LoginRateLimiter(db_path=db_path)
+    with pytest.raises(LoginRateLimited) as exc:
+        second.acquire('user@example.com')
+    assert exc.value.retry_after == pytest.approx(20)
+
+    # A successful login clears the stored lockout as well
+    clock.advance(21)
+    second.acquire('user@example.com')
+    second.record('user@example.com', success=True)
+    third = LoginRateLimiter(db_path=db_path)
+    assert third.get_stats()['tracked_keys'] == 0
+
+
+def test_store_connections_are_closed(clock, tmp_path, monkeypatch):
+    opened = []
+    connect = LoginRateLimiter._connect
+
+    def tracked_connect(self):
+        conn = connect(self)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(LoginRateLimiter, '_connect', tracked_connect)
+    limiter = LoginRateLimiter(db_path=str(tmp_path / "lockouts.db"))
+    limiter.policies['email'].failure_threshold = 1
+    fail(limiter, 'user@example.com', 1)
+
+    assert len(opened) == 2
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+class FakeDatabaseManager:
+    def __init__(self, result):
+        self.result = result
+
+    def verify_login(self, email, password):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+@pytest.fixture
+def service_limiter(limiter, monkeypatch):
+    monkeypatch.setattr(auth_service_module, 'login_limiter', limiter)
+    return limiter
+
+
+@pytest.fixture
+def service():
+    service = AuthService(max_workers=1, max_pending=4)
+    yield service
+    service.shutdown()
+
+
+@pytest.mark.parametrize("result, failures", [(None, 1), ({'id': 7}, 0), (sqlite3.OperationalError("locked"), 0)])
+def test_only_wrong_credentials_count_as_failures(service, service_limiter, result, failures):
+    future = service.authenticate(FakeDatabaseManager(result), 'user@example.com', 'password')
+    try:
+        future.result(timeout=5)
+    except sqlite3.OperationalError:
+        pass
+    # The done callback may run just after result() returns
+    service.shutdown(wait=True)
+
+    stats = service_limiter.get_stats()
+    assert stats['failures'] == failures
+    assert stats['released'] == int(isinstance(result, Exception))
+
+
+def test_overloaded_queue_gives_the_token_back(service_limiter, monkeypatch):
+    service = AuthService(max_workers=1, max_pending=1)
+    blocker = Future()
+    service._submit(blocker.result)
+    try:
+        for _ in range(5):
+            with pytest.raises(AuthServiceOverloaded):
+                service.authenticate(FakeDatabaseManager(None), 'user@example.com', 'password')
+        assert service_limiter.get_stats()['released'] == 5
+        service_limiter.acquire('user@example.com')  # Still has tokens
+    finally:
+        blocker.set_result(None)
+        service.shutdown()
@@ -0,0 +1,98 @@
+"""
+Offline catalog fill-in: only missing keys are written, manual entries and placeholders are kept
+"""
+import json
+
+import pytest
+
+from core.catalog import TranslationCatalog
+from services.machine_translation import DictionaryTranslator, coverage, fill_missing, missing_keys
+
+ENGLISH = {
+    "login": "Login",
+    "logout": "Logout",
+    "welcome": "Welcome, {name}",
+    "balance": "Balance: {amount}",
+    "settings": "Settings",
+}
+
+
+def write_catalog(directory, language_code, manual, auto=None):
+    (directory / f"{language_code}.json").write_text(
+        json.dumps({"manual": manual, "auto": auto or {}}), encoding='utf-8'
+    )
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    (tmp_path / "languages.json").write_text(json.dumps([
+        {"code": "en", "name": "English"},
+        {"code": "id", "name": "Bahasa Indonesia"},
+        {"code": "de", "name": "Deutsch"},
+    ]), encoding='utf-8')
+    write_catalog(tmp_path, "en", ENGLISH)
+    write_catalog(tmp_path, "id", {"login": "Masuk (reviewed)"}, {"logout": "Keluar (auto)"})
+    # de has no catalog file yet
+    return TranslationCatalog(str(tmp_path), reload_interval=0)
+
+
+@pytest.fixture
+def translator():
+    return DictionaryTranslator({
+        "id": {
+            "Login": "Masuk (machine)",
+            "Logout": "Keluar (machine)",
+            "Welcome, {name}": "Selamat datang, {name}",
+            "Balance: {amount}": "Saldo: {jumlah}",  # Engine translated the field name
+        },
+        "de": {
+            "Login": "Anmelden",
+            "Welcome, {name}": "Willkommen, {name}",
+        },
+    })
+
+
+def read_layers(catalog, language_code):
+    with open(catalog.path(language_code), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_coverage_counts_both_layers(catalog):
+    assert missing_keys(catalog, "id") == ["welcome", "balance", "settings"]
+    assert coverage(catalog, "id") == (2, 5)
+    assert coverage(catalog, "de") == (0, 5)
+
+
+def test_fill_writes_only_missing_keys_to_the_auto_layer(catalog, translator):
+    report = fill_missing(translator, catalog)
+
+    assert report == [
+        {"language": "id", "before": 2, "filled": 1, "rejected": 1, "after": 3, "total": 5},
+        {"language": "de", "before": 0, "filled": 2, "rejected": 0, "after": 2, "total": 5},
+    ]
+    layers = read_layers(catalog, "id")
+    # Existing entries in either layer are never overwritten
+    assert layers["manual"] == {"login": "Masuk (reviewed)"}
+    assert layers["auto"] == {"logout": "Keluar (auto)", "welcome": "Selamat datang, {name}"}
+    assert read_layers(catalog, "de") == {"manual": {}, "auto": {"login": "Anmelden", "welcome": "Willkommen, {name}"}}
+
+
+def test_filled_placeholders_still_format(catalog, translator):
+    fill_missing(translator, catalog, languages=["id"])
+
+    reloaded = TranslationCatalog(catalog.directory, reload_interval=0)
+    auto = reloaded.load("id")["auto"]
+    assert auto["welcome"].format(name="Tia") == "Selamat datang, Tia"
+    assert "balance" not in auto  # {amount} became {jumlah}, so it stays missing
+    assert coverage(reloaded, "id") == (3, 5)
+
+
+def test_dry_run_and_second_run_write_nothing(catalog, translator):
+    before = read_layers(catalog, "id")
+    report = fill_missing(translator, catalog, languages=["id"], dry_run=True)
+    assert report[0]["filled"] == 1
+    assert read_layers(catalog, "id") == before
+
+    fill_missing(translator, catalog, languages=["id"])
+    again = fill_missing(translator, catalog, languages=["id"])
+    assert again[0]["filled"] == 0 and again[0]["before"] == 3
@@ -0,0 +1,40 @@
+import pytest
+
+from services.password_policy import PasswordPolicy
+
+
+@pytest.fixture
+def policy():
+    policy = PasswordPolicy(rounds=5)
+    yield policy
+    policy._rehash_executor.shutdown()
+
+
+def test_only_weaker_hashes_need_rehash(policy):
+    stored = policy.hash("correct-password")
+    assert policy.get_cost(stored) == 5
+    assert not policy.needs_rehash(stored)
+
+    policy.rounds = 4  # e.g. calibration on a slower host
+    assert not policy.needs_rehash(stored)
+
+    policy.rounds = 6
+    assert policy.needs_rehash(stored)
+
+
+def test_unrecognised_hashes_are_left_alone(policy):
+    assert not policy.needs_rehash("plain-text")
+    assert not policy.needs_rehash(None)
+
+
+def test_rehash_upgrades_to_the_policy_cost(policy):
+    weak = policy.hash("correct-password")
+    policy.rounds = 6
+    upgraded = []
+
+    policy.schedule_rehash(1, "correct-password", upgraded.append).result(timeout=10)
+
+    new_hash, = upgraded
+    assert policy.get_cost(new_hash) == 6
+    assert policy.verify("correct-password", new_hash)
+    assert policy.needs_rehash(weak) and not policy.needs_rehash(new_hash)
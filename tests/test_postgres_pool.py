@@ -0,0 +1,117 @@
+from psycopg2 import pool as pg_pool
+
+from services.database import postgres_manager
+from services.database.postgres_manager import PostgresConnectionPool, PostgresManager, close_pools, get_pool
+
+DB_URL = "postgresql://atv@localhost/atv_test"
+
+
+class FakeConnection:
+    closed = 0
+
+    def close(self):
+        self.closed = 1
+
+
+def test_managers_share_one_pool_per_url():
+    try:
+        first = PostgresManager(DB_URL, use_pool=True)
+        second = PostgresManager(DB_URL, use_pool=True)
+        other = PostgresManager(DB_URL + "_other", use_pool=True)
+
+        assert first.pool is second.pool is get_pool(DB_URL)
+        assert other.pool is not first.pool
+    finally:
+        close_pools()
+
+
+def test_close_pools_forgets_every_pool():
+    pool = get_pool(DB_URL)
+    close_pools()
+
+    assert postgres_manager._pools == {}
+    assert get_pool(DB_URL) is not pool
+    close_pools()
+
+
+def test_release_without_pool_closes_connection():
+    manager = PostgresManager(DB_URL, use_pool=False)
+    conn = FakeConnection()
+
+    manager.release_connection(conn)
+
+    assert conn.closed
+
+
+class FakeCursor:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        pass
+
+
+class FakePooledConnection(FakeConnection):
+    def cursor(self):
+        return FakeCursor()
+
+    def rollback(self):
+        pass
+
+
+class FakePool:
+    """Same getconn/putconn/closeall contract as psycopg2's ThreadedConnectionPool"""
+
+    def __init__(self, minconn, maxconn, dsn):
+        self.closed = False
+        self.used = set()
+        self.idle = []
+
+    def getconn(self):
+        conn = self.idle.pop() if self.idle else FakePooledConnection()
+        self.used.add(conn)
+        return conn
+
+    def putconn(self, conn, close=False):
+        if self.closed:
+            raise pg_pool.PoolError("connection pool is closed")
+        if conn not in self.used:
+            raise pg_pool.PoolError("trying to put unkeyed connection")
+        self.used.remove(conn)
+        if close:
+            conn.close()
+        else:
+            self.idle.append(conn)
+
+    def closeall(self):
+        for conn in self.idle + list(self.used):
+            conn.close()
+        self.closed = True
+
+
+def test_release_after_the_pool_was_rebuilt_closes_the_connection():
+    pools = []
+
+    def pool_factory(*args):
+        pools.append(FakePool(*args))
+        return pools[-1]
+
+    pool = PostgresConnectionPool(DB_URL, min_size=0, max_size=2, timeout=0.1, pool_factory=pool_factory)
+    stale = pool.acquire()
+    pool.close_all()
+    fresh = pool.acquire()
+    assert len(pools) == 2
+
+    pool.release(stale)
+    pool.release(fresh)
+
+    assert stale.closed
+    assert not fresh.closed and pools[1].idle == [fresh]
+    assert pool.get_stats()['discarded'] == 1
+    # Both slots came back
+    held = [pool.acquire(), pool.acquire()]
+    for conn in held:
+        pool.release(conn)
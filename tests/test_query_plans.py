@@ -0,0 +1,75 @@
+from services.database.migrations import HOT_QUERIES, MigrationRunner
+from services.database.sqlite_manager import SQLiteManager
+
+
+def test_sqlite_hot_queries_use_their_indexes(tmp_path):
+    db_manager = SQLiteManager(str(tmp_path / "plans.db"))
+    db_manager.init_db()
+
+    results = MigrationRunner(db_manager, 'sqlite').check_query_plans()
+
+    assert set(results) == set(HOT_QUERIES)
+    missing = {name: plan for name, (uses_index, plan) in results.items() if not uses_index}
+    assert not missing
+
+
+def test_sqlite_check_reports_a_missing_index(tmp_path):
+    db_manager = SQLiteManager(str(tmp_path / "plans.db"))
+    db_manager.init_db()
+    conn = db_manager.get_connection()
+    conn.execute("DROP INDEX idx_notifications_user_read")
+    db_manager.release_connection(conn)
+
+    uses_index, plan = MigrationRunner(db_manager, 'sqlite').check_query_plans()['unread_notifications']
+
+    assert not uses_index
+    assert "SCAN notifications" in plan
+
+
+class FakePostgresCursor:
+    def __init__(self, executed):
+        self.executed = executed
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+        if sql.startswith("EXPLAIN"):
+            index_name = next(index for query, _, index in HOT_QUERIES.values() if query in sql.replace('%s', '?'))
+            self.rows = [("Limit  (cost=0.15..8.17 rows=1 width=8)",),
+                         (f"  ->  Index Scan using {index_name} on some_table",)]
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakePostgresManager:
+    def __init__(self):
+        self.executed = []
+        self.rolled_back = False
+        self.released = False
+
+    def get_connection(self):
+        return self
+
+    def cursor(self):
+        return FakePostgresCursor(self.executed)
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def release_connection(self, conn):
+        self.released = True
+
+
+def test_postgres_check_explains_with_seqscans_disabled():
+    manager = FakePostgresManager()
+
+    results = MigrationRunner(manager, 'postgres').check_query_plans()
+
+    assert all(uses_index for uses_index, _ in results.values())
+    assert manager.executed[0] == ("SET LOCAL enable_seqscan = off", None)
+    assert all('?' not in sql for sql, _ in manager.executed)
+    assert manager.rolled_back and manager.released
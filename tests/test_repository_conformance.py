@@ -0,0 +1,156 @@
+"""
+Conformance suite: every backend must give the same answers through Repository and BaseDatabaseManager
+"""
+import pytest
+
+from postgres_standin import PostgresStandInManager
+from services.database.repository import DEFAULT_ACCOUNT_BALANCE, DEFAULT_BROKERS, USER_COLUMNS
+from services.database.sqlite_manager import SQLiteManager
+from services.password_policy import password_policy
+
+BACKENDS = {
+    'sqlite': SQLiteManager,
+    'postgres': PostgresStandInManager,
+}
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def db_manager(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(password_policy, 'rounds', 4)  # Keep bcrypt out of the test time
+    db_manager = BACKENDS[request.param](str(tmp_path / "conformance.db"))
+    db_manager.init_db()
+    return db_manager
+
+
+@pytest.fixture
+def user_id(db_manager):
+    return db_manager.create_user({
+        'email': 'trader@example.com',
+        'password': 'correct-password',
+        'first_name': 'Tia',
+        'phone': '+62 812 0000',
+    })
+
+
+def column_names(columns):
+    return {column.strip() for column in columns.split(',')}
+
+
+def test_backend_names_match_driver(db_manager):
+    assert db_manager.repository.backend == db_manager.backend
+
+
+def test_user_rows_have_the_same_shape(db_manager, user_id):
+    user = db_manager.get_user_by_id(user_id)
+
+    assert isinstance(user, dict)
+    assert set(user) == column_names(USER_COLUMNS)
+    assert user['phone'] == '+62 812 0000'
+    assert user['is_admin'] is False
+    assert user['vip_status'] is False
+
+    assert db_manager.update_user_vip_status(user_id, True)
+    assert db_manager.get_user_by_id(user_id)['vip_status'] is True
+
+
+def test_authenticate_returns_user_and_language_without_hash(db_manager, user_id):
+    db_manager.set_user_language(user_id, 'en')
+
+    user = db_manager.authenticate_user('trader@example.com', 'correct-password')
+
+    assert user['id'] == user_id
+    assert user['language'] == 'en'
+    assert 'password_hash' not in user
+    assert db_manager.authenticate_user('trader@example.com', 'wrong-password') is None
+    assert db_manager.authenticate_user('nobody@example.com', 'correct-password') is None
+
+
+def test_create_user_seeds_trading_accounts(db_manager, user_id):
+    accounts = db_manager.get_user_trading_accounts(user_id)
+
+    assert sorted(account['broker_name'] for account in accounts) == sorted(DEFAULT_BROKERS)
+    for account in accounts:
+        assert account['account_balance'] == DEFAULT_ACCOUNT_BALANCE
+        assert isinstance(account['account_balance'], float)
+        assert account['is_active'] is True
+
+
+def test_duplicate_email_is_an_integrity_error(db_manager, user_id):
+    assert db_manager.user_exists('trader@example.com') is True
+    assert db_manager.create_user({'email': 'trader@example.com', 'password': 'other-password'}) is None
+
+    repository = db_manager.repository
+    with pytest.raises(repository.driver.integrity_error):
+        repository.create_user({'email': 'trader@example.com'}, 'hash')
+    # The failed insert rolled back, so no second set of accounts was seeded
+    assert len(db_manager.get_user_trading_accounts(user_id)) == len(DEFAULT_BROKERS)
+
+
+def test_bot_rows_and_flags(db_manager, user_id):
+    repository = db_manager.repository
+    bot_id = repository.create_bot({
+        'user_id': user_id,
+        'bot_name': 'Binomo Bot',
+        'broker_name': 'Binomo',
+        'strategy_type': 'trend',
+        'profit_target': 100,
+        'stop_loss': 50,
+        'investment_amount': 10,
+    })
+
+    bot, = repository.get_user_bots(user_id)
+    assert bot['id'] == bot_id
+    assert bot['is_active'] is False
+    assert (bot['profit_target'], bot['stop_loss'], bot['investment_amount']) == (100.0, 50.0, 10.0)
+    assert repository.get_active_bots() == []
+
+    assert repository.set_broker_bots_active(user_id, 'Binomo', True) == 1
+    assert [bot['id'] for bot in repository.get_active_bots()] == [bot_id]
+    assert repository.set_bot_active(bot_id, False) == 1
+    assert repository.set_broker_bots_active(user_id, 'Quotex', True) == 0
+
+
+def test_notification_flags(db_manager, user_id):
+    repository = db_manager.repository
+    repository.create_notification(user_id, 'Hello', 'First')
+    repository.create_notification(user_id, 'Hello', 'Second')
+
+    unread = repository.get_unread_notifications(user_id)
+    assert [row['is_read'] for row in unread] == [False, False]
+    assert repository.mark_notifications_read(user_id) == 2
+    assert repository.get_unread_notifications(user_id) == []
+
+
+def test_keyset_pages_cover_every_trade_once(db_manager, user_id):
+    repository = db_manager.repository
+    # Ties on created_at must be broken by id, or rows get skipped or repeated at page boundaries
+    timestamps = ['2026-01-01 10:00:00'] * 2 + ['2026-01-01 10:00:05'] * 3 + ['2026-01-01 10:01:00', '2026-01-02 09:00:00']
+    for i, created_at in enumerate(timestamps):
+        trade_id = repository.add_trade({
+            'user_id': user_id,
+            'broker_name': 'Binomo',
+            'asset_pair': f"PAIR{i}",
+            'trade_type': 'call',
+            'investment_amount': 1.0,
+        })
+        repository._execute("UPDATE trading_history SET created_at = ? WHERE id = ?", (created_at, trade_id))
+    expected = [row['id'] for row in repository.get_recent_trades(user_id, limit=100)]
+    assert len(expected) == len(timestamps)
+
+    pages, cursor = [], None
+    while True:
+        page = repository.get_trades_page(user_id, 3, cursor)
+        if not page:
+            break
+        pages.append(page)
+        cursor = (page[-1]['created_at'], page[-1]['id'])
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [row['id'] for page in pages for row in page] == expected
+    assert pages[0][0]['created_at'] == '2026-01-02 09:00:00'
+    assert isinstance(pages[0][0]['investment_amount'], float)
+
+    # Walking back from the second page returns the first page exactly
+    second = pages[1]
+    assert repository.get_trades_page_after(user_id, 3, (second[0]['created_at'], second[0]['id'])) == pages[0]
+    assert repository.get_trades_page_after(user_id, 3, (pages[0][0]['created_at'], pages[0][0]['id'])) == []
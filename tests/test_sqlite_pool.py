@@ -0,0 +1,79 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from services.database.sqlite_manager import SQLiteConnectionPool, SQLitePoolTimeout
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), max_size=2, timeout=0.1)
+    yield pool
+    pool.close_all()
+
+
+def test_close_all_closes_idle_connections(pool):
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+
+    pool.close_all()
+
+    stats = pool.get_stats()
+    assert stats['open_connections'] == 0
+    assert stats['idle'] == 0
+    assert stats['discarded'] == 2
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
+
+
+def test_broken_connection_is_discarded_and_replaced(pool):
+    conn = pool.acquire()
+    conn.close()  # Any use, including the rollback check in release(), now fails
+
+    pool.release(conn)
+
+    stats = pool.get_stats()
+    assert stats['discarded'] == 1
+    assert stats['open_connections'] == 0
+    assert stats['in_use'] == 0
+
+    replacement = pool.acquire()
+    assert replacement is not conn
+    assert replacement.execute("SELECT 1").fetchone()[0] == 1
+    pool.release(replacement)
+
+
+def test_discarding_a_connection_wakes_a_waiter(tmp_path):
+    pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), max_size=1, timeout=5)
+    conn = pool.acquire()
+    checked_out = []
+    waiter = threading.Thread(target=lambda: checked_out.append(pool.acquire()))
+    waiter.start()
+    while pool.get_stats()['waits'] == 0:
+        time.sleep(0.001)
+
+    start = time.monotonic()
+    conn.close()
+    pool.release(conn)  # Broken, so discarded rather than handed over
+    waiter.join(timeout=5)
+
+    assert time.monotonic() - start < 1  # Woken by the freed slot, not the 5s timeout
+    replacement, = checked_out
+    assert replacement is not conn
+    stats = pool.get_stats()
+    assert stats['timeouts'] == 0
+    assert stats['open_connections'] == 1
+    pool.release(replacement)
+    pool.close_all()
+
+
+def test_waiter_times_out_when_nothing_is_freed(pool):
+    held = [pool.acquire(), pool.acquire()]
+    with pytest.raises(SQLitePoolTimeout):
+        pool.acquire()
+    assert pool.get_stats()['timeouts'] == 1
+    for conn in held:
+        pool.release(conn)
@@ -0,0 +1,67 @@
+"""
+Fill missing translation catalog keys offline and report coverage per language
+
+Usage:
+    python tools/fill_translations.py --report-only
+    python tools/fill_translations.py --translator argos
+    python tools/fill_translations.py --translator dictionary --dictionary glossary.json
+    python tools/fill_translations.py --translator mypackage.mt:MyTranslator --languages ja ko
+
+Machine output goes into each catalog's "auto" layer; reviewed "manual"
+entries are never overwritten. Running servers pick the new files up on
+their next catalog reload check.
+"""
+import argparse
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.catalog import TranslationCatalog
+from services.machine_translation import fill_missing, load_translator
+
+
+def print_report(report, dry_run):
+    print(f"{'language':<10}{'before':>8}{'filled':>8}{'rejected':>10}{'after':>8}{'coverage':>10}")
+    for row in report:
+        percent = row['after'] / row['total'] * 100 if row['total'] else 100.0
+        print(f"{row['language']:<10}{row['before']:>8}{row['filled']:>8}{row['rejected']:>10}{row['after']:>8}{percent:>9.1f}%")
+    if dry_run:
+        print("(dry run: catalogs not written)")
+
+
+class _NoTranslator:
+    name = "none"
+
+    def translate(self, texts, source_language, target_language):
+        return [None] * len(texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--translator', default='dictionary', help="dictionary, argos or module:Class")
+    parser.add_argument('--dictionary', help="JSON file {language: {english text: translation}} for the dictionary translator")
+    parser.add_argument('--catalog-dir', help="Catalog directory (defaults to TRANSLATION_CATALOG_DIR)")
+    parser.add_argument('--languages', nargs='+', help="Language codes to fill (defaults to all but English)")
+    parser.add_argument('--dry-run', action='store_true', help="Translate and report without writing catalogs")
+    parser.add_argument('--report-only', action='store_true', help="Only report current coverage")
+    args = parser.parse_args()
+
+    try:
+        if args.report_only:
+            translator = _NoTranslator()
+        elif args.translator == 'dictionary':
+            translator = load_translator('dictionary', path=args.dictionary)
+        else:
+            translator = load_translator(args.translator)
+    except (RuntimeError, ValueError, ImportError, AttributeError) as e:
+        parser.error(str(e))
+
+    catalog = TranslationCatalog(args.catalog_dir, reload_interval=0)
+    report = fill_missing(translator, catalog, args.languages, dry_run=args.dry_run or args.report_only)
+    print_report(report, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Profile cold-start import time of an entry point and fail when it exceeds a budget
+
+Usage:
+    python tools/import_profile.py
+    python tools/import_profile.py --runs 9 --top 15
+    python tools/import_profile.py --module app_simple --forbid
+
+Each run imports the module in a fresh interpreter under `-X importtime`.
+Medians are reported for the total and for the project's own modules
+(config, core, services, utils and the entry point itself), along with
+the slowest imports. Exits non-zero when a median is over budget or when
+a module listed in --forbid (pages that must load lazily) was imported,
+so it can gate CI.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from config.app_config import AppConfig
+
+PROJECT_PACKAGES = ('config', 'core', 'services', 'utils')
+
+# Only needed once a session reaches them; importing them at startup is a regression
+LAZY_MODULES = [
+    'core.pages.splash_screen',
+    'core.pages.auth_handler',
+    'core.pages.dashboard',
+    'core.pages.history_view',
+    'services.database.postgres_manager',
+    'services.machine_translation',
+    'services.worker_pool',
+    'psycopg2',
+]
+
+# "import time: <self us> | <cumulative us> | <indent><module>"
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$')
+
+
+def profile_once(module):
+    """Import module in a fresh interpreter, returns [(module, self_us, cumulative_us, depth)]"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def is_project_module(name, entry_module):
+    return name == entry_module or name.split('.')[0] in PROJECT_PACKAGES
+
+
+def summarize(entries, entry_module):
+    total = sum(cumulative for _, _, cumulative, depth in entries if depth == 0)
+    own = sum(self_us for name, self_us, _, _ in entries if is_project_module(name, entry_module))
+    return total / 1000, own / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default='app', help="Entry point to import (default: app)")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters to take the median over")
+    parser.add_argument('--top', type=int, default=10, help="Slowest imports to list")
+    parser.add_argument('--budget-ms', type=float, default=AppConfig.IMPORT_BUDGET_MS,
+                        help="Fail when the median total import time is above this")
+    parser.add_argument('--own-budget-ms', type=float, default=AppConfig.IMPORT_OWN_BUDGET_MS,
+                        help="Fail when the median self time of project modules is above this")
+    parser.add_argument('--forbid', nargs='*', default=LAZY_MODULES,
+                        help="Modules that must not be imported at startup (bare flag: none)")
+    args = parser.parse_args()
+
+    # One untimed run so bytecode caches exist, as they do on a deployed server
+    profile_once(args.module)
+    runs = [profile_once(args.module) for _ in range(args.runs)]
+    totals, owns = zip(*(summarize(entries, args.module) for entries in runs))
+    total_ms, own_ms = statistics.median(totals), statistics.median(owns)
+
+    cumulative = {}
+    for entries in runs:
+        for name, _, cumulative_us, _ in entries:
+            cumulative.setdefault(name, []).append(cumulative_us / 1000)
+    slowest = sorted(((statistics.median(times), name) for name, times in cumulative.items()), reverse=True)
+    own_slowest = [(ms, name) for ms, name in slowest if is_project_module(name, args.module)]
+
+    print(f"import {args.module}: median of {args.runs} fresh interpreters")
+    print(f"  total:           {total_ms:8.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"  project modules: {own_ms:8.1f} ms self time (budget {args.own_budget_ms:.0f} ms)")
+    print(f"  slowest imports (cumulative):")
+    for ms, name in slowest[:args.top]:
+        print(f"    {ms:8.1f} ms  {name}")
+    print(f"  slowest project imports (cumulative):")
+    for ms, name in own_slowest[:args.top]:
+        print(f"    {ms:8.1f} ms  {name}")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"total import time {total_ms:.1f} ms is over the {args.budget_ms:.0f} ms budget")
+    if own_ms > args.own_budget_ms:
+        failures.append(f"project import time {own_ms:.1f} ms is over the {args.own_budget_ms:.0f} ms budget")
+    imported = set(cumulative)
+    for module in args.forbid:
+        if module in imported:
+            failures.append(f"{module} is imported at startup; it should load lazily")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()